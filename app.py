@@ -14,13 +14,18 @@ Points Clés:
 
 from PySide6 import QtWidgets
 
+from currency_app.core import metrics
+from currency_app.core.lazy import LazyService
 from currency_app.core.logging_config import setup_logging
 from currency_app.core.settings import Settings
 
 from currency_app.infra.db import SQLiteRepository
+from currency_app.infra.history_archive import HistoryArchive
+from currency_app.infra.rate_snapshot import load_rate_table, save_rate_table
+from currency_app.infra.rate_sources import DropDirectorySource, HttpSource
 from currency_app.domain.converter import OfflineConverter
-from currency_app.services.notifier import SystemNotifier
-from currency_app.services.chart_service import RateChart
+from currency_app.services.history_maintenance import HistoryMaintenance
+from currency_app.services.rate_refresher import RateRefresher
 
 from currency_app.ui.main_window import MainWindow
 
@@ -36,12 +41,40 @@ def main():
 
     # Chargement configuration globale
     settings = Settings()
+    metrics.set_enabled(settings.metrics_enabled)
+    if settings.metrics_dump_path is not None:
+        app.aboutToQuit.connect(lambda: metrics.REGISTRY.dump_json(settings.metrics_dump_path))
 
     # Injection des services (D.I)
-    repo = SQLiteRepository(settings.db_path)
-    converter = OfflineConverter()
-    notifier = SystemNotifier()
-    chart = RateChart()
+    repo = SQLiteRepository(
+        settings.db_path,
+        write_behind=settings.db_write_behind,
+        batch_size=settings.db_batch_size,
+        flush_interval=settings.db_flush_interval,
+        synchronous=settings.db_synchronous,
+        read_pool_size=settings.db_read_pool_size,
+        busy_timeout=settings.db_busy_timeout,
+    )
+    # Rétention / compaction en arrière-plan (arrêtée avant la fermeture de la base)
+    archive = HistoryArchive(settings.history_archive_path)
+    maintenance = HistoryMaintenance(
+        repo,
+        archive,
+        retention_days=settings.history_retention_days,
+        interval=settings.history_maintenance_interval,
+        initial_delay=settings.history_maintenance_delay,
+        # VACUUM complet unique seulement si la rétention libère des pages
+        compact=settings.history_retention_days is not None,
+    ).start()
+    app.aboutToQuit.connect(maintenance.stop)
+    app.aboutToQuit.connect(repo.close)  # vide la file d'écriture avant de quitter
+    converter = OfflineConverter(load_rate_table(settings.rates_snapshot_path), settings.rate_fallback)
+    # QtCharts et tray : importés au premier usage (ou à l'idle après le 1er paint)
+    notifier = LazyService("currency_app.services.notifier", "SystemNotifier",
+                           settings.notify_min_interval, settings.alert_rules_path)
+    chart = LazyService("currency_app.services.chart_service", "RateChart")
+    if not settings.lazy_subsystems:
+        notifier, chart = notifier.get(), chart.get()
 
     # Création de la fenêtre principale
     win = MainWindow(
@@ -49,9 +82,23 @@ def main():
         repo=repo,
         converter=converter,
         notifier=notifier,
-        chart=chart
+        chart=chart,
+        archive=archive,
     )
 
+    # Taux rafraîchis en arrière-plan (swap atomique), l'UI est prévenue par signal
+    sources = []
+    if settings.rates_drop_dir is not None:
+        sources.append(DropDirectorySource(settings.rates_drop_dir))
+    if settings.rates_url:
+        sources.append(HttpSource(settings.rates_url))
+    refresher = RateRefresher(converter, sources, settings.rates_poll_interval,
+                              persist=lambda table: save_rate_table(settings.rates_snapshot_path, table))
+    refresher.subscribe(lambda name, table: win.rates_swapped.emit(name, str(table.last_date)))
+    refresher.subscribe_currencies(win.currencies_changed.emit)
+    app.aboutToQuit.connect(refresher.stop)
+    refresher.start()
+
     win.show()
     app.exec()  # boucle Qt
 
@@ -0,0 +1,33 @@
+"""
+Benchmarks RateChart : coût de add_point / rescale selon la taille de la série.
+"""
+
+import numpy as np
+from PySide6 import QtWidgets
+
+from benchmarks.harness import Result, benchmark, timed
+
+
+@benchmark("chart")
+def run(quick: bool):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])  # noqa: F841
+    from currency_app.services.chart_service import RateChart
+
+    results = []
+    for n in (1_000, 10_000) if quick else (1_000, 10_000, 100_000):
+        chart = RateChart()
+        xs = 1.7e12 + np.arange(n, dtype=np.float64) * 60_000
+        ys = 1.1 + np.sin(np.arange(n) / 50) * 0.01
+        load = timed(lambda: chart.load_points(xs, ys), repeat=3)
+
+        add = timed(lambda: chart.add_point("2026-10-18 12:00:00", 1.1), number=200)
+        rescale = timed(chart.rescale, number=200)
+
+        label = f"{n // 1000}k"
+        results += [
+            Result(f"chart.load_points_{label}_ms", load * 1e3, "ms"),
+            Result(f"chart.add_point_{label}_us", add * 1e6, "µs"),
+            Result(f"chart.rescale_{label}_us", rescale * 1e6, "µs"),
+        ]
+        chart.view.deleteLater()
+    return results
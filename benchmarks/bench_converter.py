@@ -0,0 +1,34 @@
+"""
+Benchmarks OfflineConverter : latence d'une conversion, débit des lots.
+"""
+
+import numpy as np
+
+from benchmarks.harness import Result, benchmark, timed
+from currency_app.domain.converter import OfflineConverter
+
+
+@benchmark("converter")
+def run(quick: bool):
+    conv = OfflineConverter()
+    codes = conv.list_currencies()
+    n = 100_000 if quick else 1_000_000
+
+    rng = np.random.default_rng(0)
+    amounts = rng.uniform(1, 10_000, n)
+    frms = [codes[i] for i in rng.integers(0, len(codes), n)]
+    tos = [codes[i] for i in rng.integers(0, len(codes), n)]
+
+    convert = timed(lambda: conv.convert(100.0, "EUR", "USD"), number=20_000)
+    convert_on = timed(lambda: conv.convert(100.0, "EUR", "USD", on="2020-03-16"), number=5_000)
+    many = timed(lambda: conv.convert_many(amounts, "EUR", "USD"), repeat=7)
+    matrix = timed(lambda: conv.convert_matrix(amounts, frms, tos), repeat=3)
+    series = timed(lambda: conv.rate_series("EUR", "USD"), number=100)
+
+    return [
+        Result("converter.convert_us", convert * 1e6, "µs"),
+        Result("converter.convert_on_date_us", convert_on * 1e6, "µs"),
+        Result("converter.convert_many_rows_per_s", n / many, "rows/s", True),
+        Result("converter.convert_matrix_rows_per_s", n / matrix, "rows/s", True),
+        Result("converter.rate_series_full_us", series * 1e6, "µs"),
+    ]
@@ -0,0 +1,47 @@
+"""
+Benchmarks export : PDF (temps par 1k lignes), CSV et colonnaire (lignes/s).
+"""
+
+import tempfile
+from pathlib import Path
+
+from PySide6 import QtWidgets
+
+from benchmarks.harness import Result, benchmark, timed
+from benchmarks.bench_repository import _records
+from currency_app.infra.db import SQLiteRepository
+from currency_app.utils.formatting import format_history_row
+
+HEADERS = ["Date", "De", "Vers", "Montant", "Résultat", "Taux"]
+
+
+@benchmark("export")
+def run(quick: bool):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])  # noqa: F841
+    from currency_app.infra.bulk_export import export_columnar, export_csv
+    from currency_app.infra.pdf_exporter import export_table_to_pdf
+
+    n_pdf = 2_000 if quick else 10_000
+    n_bulk = 100_000 if quick else 500_000
+    rows = [format_history_row(r.ts, r.from_cur, r.to_cur, r.amount, r.result, r.rate)
+            for r in _records(n_pdf)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf = timed(lambda: export_table_to_pdf(tmp / "bench.pdf", "Benchmark", HEADERS, rows), repeat=3)
+
+        repo = SQLiteRepository(tmp / "bench.sqlite3", write_behind=True)
+        try:
+            for rec in _records(n_bulk):
+                repo.insert(rec)
+            repo.flush()
+            csv = timed(lambda: export_csv(repo, tmp / "bench.csv"), repeat=3)
+            col = timed(lambda: export_columnar(repo, tmp / "bench.ccol"), repeat=3)
+        finally:
+            repo.close()
+
+    return [
+        Result("export.pdf_s_per_1k_rows", pdf / n_pdf * 1000, "s"),
+        Result("export.csv_rows_per_s", n_bulk / csv, "rows/s", True),
+        Result("export.columnar_rows_per_s", n_bulk / col, "rows/s", True),
+    ]
@@ -0,0 +1,62 @@
+"""
+Benchmarks SQLiteRepository : insert (write-behind), fetch_all et fetch_store (HistoryStore) à 10k/100k/1M lignes.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.harness import Result, benchmark
+from currency_app.core.settings import Settings
+from currency_app.domain.models import ConversionRecord
+from currency_app.infra.db import SQLiteRepository
+
+
+def _records(n):
+    for k in range(n):
+        rate = 1.05 + (k % 1000) * 1e-4
+        ts = f"2026-01-{1 + (k // 86400) % 28:02d} {(k // 3600) % 24:02d}:{(k // 60) % 60:02d}:{k % 60:02d}"
+        yield ConversionRecord(ts, "EUR", "USD", 100.0, 100.0 * rate, rate)
+
+
+@benchmark("repository")
+def run(quick: bool):
+    s = Settings()
+    results = []
+    for n in (10_000, 100_000) if quick else (10_000, 100_000, 1_000_000):
+        label = f"{n // 1000}k" if n < 1_000_000 else f"{n // 1_000_000}M"
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = SQLiteRepository(
+                Path(tmp) / "bench.sqlite3",
+                write_behind=s.db_write_behind,
+                batch_size=s.db_batch_size,
+                flush_interval=s.db_flush_interval,
+                synchronous=s.db_synchronous,
+            )
+            try:
+                records = list(_records(n))
+                start = time.perf_counter()
+                for rec in records:
+                    repo.insert(rec)
+                repo.flush()
+                insert = time.perf_counter() - start
+
+                start = time.perf_counter()
+                n_fetched = sum(1 for _ in repo.fetch_all())
+                fetch = time.perf_counter() - start
+                assert n_fetched == n
+
+                start = time.perf_counter()
+                store = repo.fetch_store()
+                fetch_store = time.perf_counter() - start
+                assert len(store) == n
+            finally:
+                repo.close()
+
+        results += [
+            Result(f"repository.insert_{label}_rows_per_s", n / insert, "rows/s", True),
+            Result(f"repository.fetch_all_{label}_s", fetch, "s"),
+            Result(f"repository.fetch_store_{label}_s", fetch_store, "s"),
+            Result(f"repository.store_{label}_bytes_per_row", store.nbytes / n, "B"),
+        ]
+    return results
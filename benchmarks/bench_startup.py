@@ -0,0 +1,57 @@
+"""
+Benchmarks démarrage : app.main() jusqu'au premier affichage, dans un processus neuf.
+
+Le processus enfant remplace app.MainWindow par une fabrique qui quitte la
+boucle Qt au premier tour d'événements après show() et affiche le temps
+écoulé depuis son lancement (horodatage transmis par le parent).
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.harness import Result, benchmark
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PROBE = """
+import os, sys, time
+from PySide6 import QtCore, QtWidgets
+import app
+
+Window = app.MainWindow
+
+def factory(**kwargs):
+    win = Window(**kwargs)
+    def shown():
+        print((time.time_ns() - int(os.environ["BENCH_T0_NS"])) / 1e9)
+        QtWidgets.QApplication.quit()
+    QtCore.QTimer.singleShot(0, shown)
+    return win
+
+app.MainWindow = factory
+app.main()
+"""
+
+
+def _startup(cwd) -> float:
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", BENCH_T0_NS=str(time.time_ns()),
+               PYTHONPATH=os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")])))
+    out = subprocess.run([sys.executable, "-c", PROBE], cwd=cwd, env=env,
+                         capture_output=True, text=True, check=True, timeout=120)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+@benchmark("startup")
+def run(quick: bool):
+    with tempfile.TemporaryDirectory() as tmp:
+        first = _startup(tmp)  # base vide, snapshot de taux à compiler
+        warm = statistics.median(_startup(tmp) for _ in range(3 if quick else 5))
+    return [
+        Result("startup.first_run_s", first, "s"),
+        Result("startup.warm_s", warm, "s"),
+    ]
@@ -0,0 +1,79 @@
+"""
+Module: compare.py
+Responsabilité:
+    Compare des résultats de benchmarks à une baseline et signale les régressions
+
+Usage:
+    python -m benchmarks.compare benchmarks/baselines/reference.json benchmarks/results/latest.json
+    python -m benchmarks.compare BASE CURRENT --threshold 0.25
+
+Sortie:
+    Tableau par mesure (baseline, actuel, écart) ; code retour 1 si au moins
+    une mesure régresse au-delà du seuil (en tenant compte du sens "meilleur")
+"""
+
+import argparse
+import sys
+
+from benchmarks.harness import load
+
+
+def compare(base: dict, current: dict, threshold: float) -> tuple[list[tuple], list[str]]:
+    """Retourne (lignes (nom, base, actuel, unité, écart, statut), noms en régression)."""
+    rows, regressions = [], []
+    base_results, cur_results = base["results"], current["results"]
+    for name in sorted(base_results.keys() | cur_results.keys()):
+        b, c = base_results.get(name), cur_results.get(name)
+        if b is None or c is None:
+            rows.append((name, b and b["value"], c and c["value"], (b or c)["unit"], None,
+                         "new" if b is None else "missing"))
+            continue
+
+        # écart > 0 = plus lent / moins de débit (quel que soit le sens de la mesure)
+        if c["higher_is_better"]:
+            change = b["value"] / c["value"] - 1 if c["value"] else float("inf")
+        else:
+            change = c["value"] / b["value"] - 1 if b["value"] else float("inf")
+
+        status = "ok"
+        if change > threshold:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            status = "improved"
+        rows.append((name, b["value"], c["value"], c["unit"], change, status))
+    return rows, regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare des résultats de benchmarks")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.20, help="tolérance (0.20 = 20 %%)")
+    args = parser.parse_args(argv)
+
+    base, current = load(args.baseline), load(args.current)
+    if base["meta"].get("quick") != current["meta"].get("quick"):
+        print("⚠ baseline et résultats n'ont pas le même mode (--quick)", file=sys.stderr)
+
+    rows, regressions = compare(base, current, args.threshold)
+    fmt = "{:<45} {:>14} {:>14} {:<7} {:>8}  {}"
+    print(fmt.format("benchmark", "baseline", "current", "unit", "slower", "status"))
+    for name, b, c, unit, change, status in rows:
+        print(fmt.format(
+            name,
+            "—" if b is None else f"{b:,.3f}",
+            "—" if c is None else f"{c:,.3f}",
+            unit,
+            "" if change is None else f"{change:+.1%}",
+            status,
+        ))
+
+    if regressions:
+        print(f"\n{len(regressions)} régression(s) au-delà de {args.threshold:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Module: harness.py
+Responsabilité:
+    Outils communs des benchmarks : registre, chronométrage, format JSON
+
+Design:
+    - Chaque module bench_*.py enregistre une fonction par groupe via
+      @benchmark("groupe") ; elle reçoit `quick` et retourne des Result
+    - Mesure = médiane de plusieurs répétitions (robuste au bruit)
+    - Résultats sérialisés en JSON : {"meta": {...}, "results": {nom: {...}}}
+"""
+
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+
+BENCHMARKS = {}  # groupe → fonction(quick) -> list[Result]
+
+
+@dataclass(frozen=True)
+class Result:
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool = False
+
+
+def benchmark(group):
+    """Enregistre une fonction de benchmark sous un nom de groupe."""
+    def deco(fn):
+        BENCHMARKS[group] = fn
+        return fn
+    return deco
+
+
+def timed(fn, repeat=5, number=1) -> float:
+    """Secondes par appel de fn() : médiane sur `repeat` séries de `number` appels."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return statistics.median(samples)
+
+
+def metadata(quick: bool) -> dict:
+    meta = {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "quick": quick,
+    }
+    for module in ("numpy", "PySide6"):
+        mod = sys.modules.get(module)
+        if mod is not None:
+            meta[module] = getattr(mod, "__version__", "?")
+    return meta
+
+
+def save(path, results, quick: bool) -> None:
+    payload = {
+        "meta": metadata(quick),
+        "results": {r.name: {k: v for k, v in asdict(r).items() if k != "name"} for r in results},
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=False) + "\n", encoding="utf-8")
+
+
+def load(path) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
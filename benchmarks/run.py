@@ -0,0 +1,59 @@
+"""
+Module: run.py
+Responsabilité:
+    Exécute la suite de benchmarks et écrit les résultats en JSON
+
+Usage:
+    python -m benchmarks.run                          # suite complète
+    python -m benchmarks.run --quick --only converter chart
+    python -m benchmarks.run --out benchmarks/baselines/local.json
+
+Design:
+    - Qt en mode offscreen (QT_QPA_PLATFORM) : exécutable sans écran / en CI
+    - --quick réduit les tailles (1M lignes → 100k, etc.)
+    - Comparer deux fichiers : python -m benchmarks.compare BASE CURRENT
+"""
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse  # noqa: E402
+import importlib  # noqa: E402
+import sys  # noqa: E402
+import time  # noqa: E402
+
+from benchmarks.harness import BENCHMARKS, save  # noqa: E402
+
+MODULES = ("bench_converter", "bench_repository", "bench_chart", "bench_export", "bench_startup")
+DEFAULT_OUT = "benchmarks/results/latest.json"
+
+
+def main(argv=None) -> int:
+    for module in MODULES:
+        importlib.import_module(f"benchmarks.{module}")
+
+    parser = argparse.ArgumentParser(description="Benchmarks des chemins critiques")
+    parser.add_argument("--quick", action="store_true", help="tailles réduites")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="groupes à exécuter")
+    parser.add_argument("--out", default=DEFAULT_OUT, help=f"fichier JSON (défaut: {DEFAULT_OUT})")
+    args = parser.parse_args(argv)
+
+    results = []
+    for group, fn in BENCHMARKS.items():
+        if args.only and group not in args.only:
+            continue
+        start = time.perf_counter()
+        group_results = fn(args.quick)
+        print(f"[{group}] {time.perf_counter() - start:.1f} s", file=sys.stderr)
+        for r in group_results:
+            print(f"  {r.name:<45} {r.value:>14,.3f} {r.unit}")
+        results += group_results
+
+    save(args.out, results, args.quick)
+    print(f"→ {args.out}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Module: loadtest.py
+Responsabilité:
+    Test de charge du serveur de conversion sur localhost
+
+Usage:
+    python -m currency_app.api.loadtest --connections 64 --requests 200
+    python -m currency_app.api.loadtest --url http://127.0.0.1:8765 ...
+
+Design:
+    - Sans --url, démarre un ConversionServer dans le même processus (port libre)
+    - N connexions keep-alive concurrentes, chacune envoie ses requêtes en série
+    - Rapporte débit, latences p50/p95/p99 et taille moyenne des micro-lots
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from urllib.parse import urlsplit
+
+PAIRS = [("EUR", "USD"), ("USD", "JPY"), ("GBP", "CHF"), ("EUR", "CAD"), ("AUD", "NZD")]
+
+
+async def _request(reader, writer, method, path, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":", 1)[1])
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def _client(host, port, n_requests, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(n_requests):
+            frm, to = random.choice(PAIRS)
+            start = time.perf_counter()
+            status, _ = await _request(reader, writer, "POST", "/convert",
+                                       {"amount": random.uniform(1, 10_000), "from": frm, "to": to})
+            latencies.append(time.perf_counter() - start)
+            errors[0] += status != 200
+    finally:
+        writer.close()
+
+
+async def run(host, port, connections, requests_per_conn) -> dict:
+    latencies, errors = [], [0]
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(host, port, requests_per_conn, latencies, errors) for _ in range(connections)))
+    elapsed = time.perf_counter() - start
+
+    reader, writer = await asyncio.open_connection(host, port)
+    _, metrics = await _request(reader, writer, "GET", "/metrics")
+    writer.close()
+
+    q = statistics.quantiles(latencies, n=100)
+    return {
+        "requests": len(latencies),
+        "errors": errors[0],
+        "seconds": round(elapsed, 3),
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(q[49] * 1000, 3),
+        "p95_ms": round(q[94] * 1000, 3),
+        "p99_ms": round(q[98] * 1000, 3),
+        "server_avg_batch_size": metrics.get("avg_batch_size"),
+    }
+
+
+async def _run_local(connections, requests_per_conn, batch_window) -> dict:
+    from currency_app.api.server import ConversionServer
+    from currency_app.domain.converter import OfflineConverter
+
+    server = ConversionServer(OfflineConverter(), "127.0.0.1", 0, batch_window)
+    await server.start()
+    try:
+        return await run("127.0.0.1", server.port, connections, requests_per_conn)
+    finally:
+        await server.stop()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Test de charge du serveur de conversion")
+    parser.add_argument("--url", default=None, help="serveur existant (sinon serveur local embarqué)")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=200, help="requêtes par connexion")
+    parser.add_argument("--batch-window-ms", type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    if args.url:
+        url = urlsplit(args.url)
+        result = asyncio.run(run(url.hostname, url.port or 80, args.connections, args.requests))
+    else:
+        result = asyncio.run(_run_local(args.connections, args.requests, args.batch_window_ms / 1000))
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
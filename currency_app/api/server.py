@@ -0,0 +1,365 @@
+"""
+Module: server.py
+Responsabilité:
+    Serveur HTTP/JSON local (asyncio) exposant OfflineConverter, sans Qt
+
+Usage:
+    python -m currency_app.api.server --host 127.0.0.1 --port 8765
+    python -m currency_app.api.server --watch-dir ./rates --poll-interval 10
+
+Endpoints:
+    POST /convert        {"amount": 100, "from": "EUR", "to": "USD"}
+    POST /convert/batch  {"items": [{"amount": ..., "from": ..., "to": ...}, ...]}
+    GET  /health         état + nombre de devises
+    GET  /metrics        compteurs (requêtes, lots, taille moyenne de lot, latence)
+
+Design:
+    - HTTP/1.1 minimal sur asyncio.start_server, connexions keep-alive
+    - Les requêtes /convert concurrentes arrivant dans une courte fenêtre sont
+      regroupées en un seul convert_matrix vectorisé (micro-batching)
+    - En-têtes limités à MAX_HEADER_BYTES (limite du flux asyncio) → 431 au-delà ;
+      requête mal formée (ligne de requête, Content-Length) → 400 puis
+      fermeture ; montant non fini ou taux absent → 422 ; réponses en JSON
+      strict (jamais NaN / Infinity)
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import logging
+import math
+import time
+from http import HTTPStatus
+
+from currency_converter import RateNotFoundError
+
+from currency_app.core.logging_config import setup_logging
+from currency_app.domain.converter import OfflineConverter
+from currency_app.services.rate_refresher import RateRefresher
+
+logger = logging.getLogger(__name__)
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 8 * 1024 * 1024
+
+
+class HttpError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class Metrics:
+    """Compteurs simples exposés par /metrics."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.requests = 0
+        self.errors = 0
+        self.connections = 0
+        self.conversions = 0
+        self.batches = 0
+        self.latency_total = 0.0
+
+    def as_dict(self):
+        return {
+            "uptime_s": round(time.time() - self.started, 3),
+            "requests": self.requests,
+            "errors": self.errors,
+            "connections": self.connections,
+            "conversions": self.conversions,
+            "batches": self.batches,
+            "avg_batch_size": round(self.conversions / self.batches, 2) if self.batches else 0.0,
+            "avg_latency_ms": round(1000 * self.latency_total / self.requests, 3) if self.requests else 0.0,
+        }
+
+
+class MicroBatcher:
+    """Regroupe les conversions unitaires concurrentes en un appel vectorisé."""
+
+    def __init__(self, converter, metrics, window=0.002, max_batch=4096):
+        self.converter = converter
+        self.metrics = metrics
+        self.window = window
+        self.max_batch = max_batch
+        self._queue = asyncio.Queue()
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def convert(self, amount, frm, to):
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put((amount, frm, to, fut))
+        return await fut
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self._flush(batch)
+
+    def _flush(self, batch):
+        self.metrics.batches += 1
+        self.metrics.conversions += len(batch)
+        try:
+            results, rates = self.converter.convert_matrix(
+                [b[0] for b in batch], [b[1] for b in batch], [b[2] for b in batch]
+            )
+        except ValueError:
+            # Une devise inconnue dans le lot : repli élément par élément
+            for amount, frm, to, fut in batch:
+                if not fut.done():
+                    try:
+                        fut.set_result(self.converter.convert(amount, frm, to))
+                    except RateNotFoundError:
+                        fut.set_exception(HttpError(HTTPStatus.UNPROCESSABLE_ENTITY, f"no rate for {frm}->{to}"))
+                    except Exception as exc:
+                        fut.set_exception(exc)
+            return
+
+        for (_, frm, to, fut), res, rate in zip(batch, results.tolist(), rates.tolist()):
+            if fut.done():
+                continue
+            if rate != rate:  # NaN
+                fut.set_exception(HttpError(HTTPStatus.UNPROCESSABLE_ENTITY, f"no rate for {frm}->{to}"))
+            else:
+                fut.set_result((res, rate))
+
+
+class ConversionServer:
+    """Serveur HTTP/JSON keep-alive autour d'un OfflineConverter."""
+
+    def __init__(self, converter, host="127.0.0.1", port=8765, batch_window=0.002, idle_timeout=30.0):
+        self.converter = converter
+        self.host = host
+        self.port = port
+        self.idle_timeout = idle_timeout
+        self.metrics = Metrics()
+        self.batcher = MicroBatcher(converter, self.metrics, batch_window)
+        self._server = None
+
+    async def start(self):
+        self.batcher.start()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                                  limit=MAX_HEADER_BYTES)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("Serveur de conversion sur http://%s:%d", self.host, self.port)
+
+    async def serve_forever(self):
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.batcher.stop()
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+    async def _handle_connection(self, reader, writer):
+        self.metrics.connections += 1
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.idle_timeout)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    return
+                except (asyncio.LimitOverrunError, ValueError):  # en-têtes > MAX_HEADER_BYTES
+                    self.metrics.errors += 1
+                    await self._respond(writer, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                                        {"error": "headers too large"}, keep_alive=False)
+                    return
+
+                start = time.perf_counter()
+                try:
+                    method, path, version, headers = self._parse_head(head)
+                    length = self._content_length(headers)
+                except HttpError as exc:
+                    self.metrics.errors += 1
+                    await self._respond(writer, exc.status, {"error": str(exc)}, keep_alive=False)
+                    return
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                        {"error": "body too large"}, keep_alive=False)
+                    return
+                try:
+                    body = await reader.readexactly(length) if length else b""
+                except (asyncio.IncompleteReadError, ConnectionError):  # corps tronqué
+                    return
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                status, payload = await self._dispatch(method, path, body)
+
+                self.metrics.requests += 1
+                self.metrics.errors += status >= 400
+                self.metrics.latency_total += time.perf_counter() - start
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    return
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    def _parse_head(head: bytes):
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, path, version = lines[0].split(" ", 2)
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "malformed request line") from None
+        if not version.startswith("HTTP/"):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "malformed request line")
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                k, v = line.split(":", 1)
+                headers[k.strip().lower()] = v.strip()
+        return method, path.split("?", 1)[0], version, headers
+
+    @staticmethod
+    def _content_length(headers) -> int:
+        raw = headers.get("content-length", "").strip()
+        if not raw:
+            return 0
+        if not raw.isdigit():  # ni signe ni espace : "-1", "abc", "1e3" refusés
+            raise HttpError(HTTPStatus.BAD_REQUEST, "invalid Content-Length")
+        return int(raw)
+
+    async def _respond(self, writer, status, payload, keep_alive=True):
+        body = json.dumps(payload, allow_nan=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        ).encode("latin-1")
+        writer.write(head + body)
+        await writer.drain()
+
+    async def _dispatch(self, method, path, body):
+        try:
+            if method == "GET" and path == "/health":
+                return HTTPStatus.OK, {"status": "ok", "currencies": len(self.converter.list_currencies())}
+            if method == "GET" and path == "/metrics":
+                return HTTPStatus.OK, self.metrics.as_dict()
+            if method == "POST" and path == "/convert":
+                amount, frm, to = self._item(self._json(body))
+                result, rate = await self.batcher.convert(amount, frm, to)
+                if not math.isfinite(result):
+                    raise HttpError(HTTPStatus.UNPROCESSABLE_ENTITY, "result out of range")
+                return HTTPStatus.OK, {"amount": amount, "from": frm, "to": to, "result": result, "rate": rate}
+            if method == "POST" and path == "/convert/batch":
+                return HTTPStatus.OK, {"results": self._convert_batch(self._json(body))}
+            raise HttpError(HTTPStatus.NOT_FOUND, f"no route for {method} {path}")
+        except HttpError as exc:
+            return exc.status, {"error": str(exc)}
+        except (ValueError, RateNotFoundError) as exc:  # devise inconnue, taux absent
+            return HTTPStatus.UNPROCESSABLE_ENTITY, {"error": str(exc)}
+        except Exception as exc:
+            logger.exception("Erreur serveur")
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(exc)}
+
+    @staticmethod
+    def _json(body):
+        try:
+            return json.loads(body or b"{}")
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "invalid JSON") from None
+
+    @staticmethod
+    def _item(obj):
+        try:
+            amount, frm, to = float(obj["amount"]), str(obj["from"]).upper(), str(obj["to"]).upper()
+        except (KeyError, TypeError, ValueError):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "expected {amount, from, to}") from None
+        if not math.isfinite(amount):
+            raise HttpError(HTTPStatus.UNPROCESSABLE_ENTITY, "amount must be a finite number")
+        return amount, frm, to
+
+    def _convert_batch(self, obj):
+        items = obj.get("items") if isinstance(obj, dict) else None
+        if not isinstance(items, list):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "expected {items: [...]}")
+        parsed = [self._item(it) for it in items]
+        self.metrics.batches += 1
+        self.metrics.conversions += len(parsed)
+        results, rates = self.converter.convert_matrix(
+            [p[0] for p in parsed], [p[1] for p in parsed], [p[2] for p in parsed]
+        )
+        return [
+            {"result": None, "rate": None, "error": "rate not found"} if rate != rate
+            else {"result": None, "rate": rate, "error": "result out of range"} if not math.isfinite(res)
+            else {"result": res, "rate": rate}
+            for res, rate in zip(results.tolist(), rates.tolist())
+        ]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Serveur JSON de conversion offline")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--batch-window-ms", type=float, default=2.0)
+    parser.add_argument("--snapshot", default=None, help="snapshot de taux compilé (rates.snapshot)")
+    parser.add_argument("--watch-dir", default=None, help="dossier de dépôt de fichiers de taux BCE")
+    parser.add_argument("--rates-url", default=None, help="URL locale d'un fichier de taux BCE")
+    parser.add_argument("--poll-interval", type=float, default=30.0, help="secondes entre deux interrogations")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    table = None
+    if args.snapshot:
+        from currency_app.infra.rate_snapshot import load_rate_table
+        table = load_rate_table(args.snapshot)
+    converter = OfflineConverter(table)
+
+    # Taux rafraîchis à chaud : les lots en cours gardent leur snapshot
+    sources = []
+    if args.watch_dir or args.rates_url:
+        from currency_app.infra.rate_sources import DropDirectorySource, HttpSource
+        if args.watch_dir:
+            sources.append(DropDirectorySource(args.watch_dir))
+        if args.rates_url:
+            sources.append(HttpSource(args.rates_url))
+    persist = None
+    if args.snapshot:
+        from currency_app.infra.rate_snapshot import save_rate_table
+        persist = functools.partial(save_rate_table, args.snapshot)
+    refresher = RateRefresher(converter, sources, args.poll_interval, persist=persist).start()
+
+    server = ConversionServer(converter, args.host, args.port, args.batch_window_ms / 1000)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        refresher.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,300 @@
+"""
+Module: cli.py
+Responsabilité:
+    Convertisseur batch en ligne de commande, sans interface (headless)
+
+Usage:
+    python -m currency_app.cli entree.csv sortie.csv --workers 4
+    python -m currency_app.cli entree.jsonl sortie.jsonl
+    python -m currency_app.cli entree.csv sortie.csv --exact
+
+Entrée:
+    CSV  : amount,from,to[,date] (en-tête optionnel, reconnu à ses noms de colonnes ;
+           champs entre guillemets multi-lignes acceptés)
+    JSONL: {"amount": 100, "from": "EUR", "to": "USD", "date": "2024-01-31"}
+
+Design:
+    - N'importe que currency_app.domain (jamais PySide6)
+    - Lecture en flux par paquets d'enregistrements (lignes JSONL, ou rangées
+      déjà découpées par csv.reader sur le fichier) ; chaque paquet est converti
+      de façon vectorisée (convert_matrix) dans un pool de processus
+    - Les lignes datées utilisent le taux du jour (jours sans cotation
+      comblés selon --fallback)
+    - Fenêtre bornée de paquets en vol : mémoire constante, ordre de sortie
+      identique à l'ordre d'entrée
+    - --exact : arithmétique entière en unités mineures (FixedPointConverter),
+      résultats écrits en décimal fixe selon l'exposant de la devise cible
+"""
+
+import argparse
+import csv
+import io
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import numpy as np
+
+from currency_app.domain.converter import OfflineConverter
+from currency_app.domain.fixed_point import RATE_DECIMALS, FixedPointConverter, exponents, multiply, overflows
+from currency_app.domain.rates import FALLBACKS, RateTable
+
+INPUT_FIELDS = ("amount", "from", "to", "date")
+OUTPUT_FIELDS = ("amount", "from", "to", "date", "result", "rate", "error")
+
+_converter = None  # un convertisseur par processus
+
+
+def _init_worker(codes, first_ordinal, data, ref, fallback, exact=False):
+    global _converter
+    _converter = OfflineConverter(RateTable(codes, first_ordinal, data, ref), fallback)
+    if exact:
+        _converter = FixedPointConverter(_converter)
+
+
+# ------------------------------------------------------------------
+# Parsing / conversion d'un paquet
+# ------------------------------------------------------------------
+def _parse(items, fmt):
+    """Lignes JSONL ou rangées CSV → liste de (amount, from, to, date, error)."""
+    rows = []
+    if fmt == "jsonl":
+        for line in items:
+            try:
+                obj = json.loads(line)
+                rows.append((_amount(obj["amount"]), str(obj["from"]).upper(), str(obj["to"]).upper(),
+                             obj.get("date") or "", ""))
+            except (ValueError, KeyError, TypeError) as exc:
+                rows.append((np.nan, "", "", "", f"invalid row: {exc}"))
+        return rows
+
+    for cells in items:
+        try:
+            amount, frm, to = _amount(cells[0]), cells[1].strip().upper(), cells[2].strip().upper()
+            date = cells[3].strip() if len(cells) > 3 else ""
+            rows.append((amount, frm, to, date, ""))
+        except (ValueError, IndexError) as exc:
+            rows.append((np.nan, "", "", "", f"invalid row: {exc}"))
+    return rows
+
+
+def _amount(value) -> float:
+    amount = float(value)
+    if not math.isfinite(amount):
+        raise ValueError(f"amount must be finite, got {value!r}")
+    return amount
+
+
+def convert_chunk(items, fmt, converter=None) -> str:
+    """
+    Convertit un paquet et retourne le texte de sortie (même ordre).
+    `items` : lignes JSONL, ou rangées CSV (listes de cellules, csv.reader).
+    `converter` : OfflineConverter, ou FixedPointConverter pour le mode exact.
+    """
+    converter = converter or _converter
+    exact = isinstance(converter, FixedPointConverter)
+    if exact:
+        fixed, converter = converter, converter.converter
+    rows = _parse(items, fmt)
+    known = set(converter.list_currencies())
+
+    errors = [r[4] for r in rows]
+    for k, (_, frm, to, date, err) in enumerate(rows):
+        if err:
+            continue
+        if frm not in known or to not in known:
+            errors[k] = f"unsupported currency: {frm if frm not in known else to}"
+        elif date:
+            try:
+                converter.table.day_index(date)
+            except ValueError:
+                errors[k] = f"invalid date: {date}"
+
+    ok = [k for k, e in enumerate(errors) if not e]
+    if exact:
+        return _convert_exact(fixed, rows, ok, errors, fmt)
+
+    results = np.full(len(rows), np.nan)
+    rates = np.full(len(rows), np.nan)
+    if ok:
+        res, rt = converter.convert_matrix(
+            [rows[k][0] for k in ok], [rows[k][1] for k in ok], [rows[k][2] for k in ok],
+            on=[rows[k][3] for k in ok],
+        )
+        results[ok], rates[ok] = res, rt
+        for k in np.asarray(ok)[np.isnan(rt)]:
+            errors[k] = "rate not found"
+
+    return _render(rows, results, rates, errors, fmt)
+
+
+def _convert_exact(fixed, rows, ok, errors, fmt) -> str:
+    """Mode exact : unités mineures int64, sorties en chaînes décimales fixes."""
+    results = [""] * len(rows)
+    rates = [""] * len(rows)
+    if ok:
+        frms = [rows[k][1] for k in ok]
+        tos = [rows[k][2] for k in ok]
+        amounts = np.array([rows[k][0] for k in ok], dtype=np.float64)
+
+        # Lignes hors bornes écartées une à une : le reste du paquet est converti
+        too_large = ~fixed.representable(amounts, frms)
+        minor = fixed.to_minor(np.where(too_large, 0.0, amounts), frms)
+        rt = fixed.scaled_rates(frms, tos, on=[rows[k][3] for k in ok])
+        missing = rt < 0
+        overflow = ~missing & overflows(minor, np.where(missing, 0, rt))
+        skip = missing | too_large | overflow
+        res = multiply(np.where(skip, 0, minor), np.where(skip, 0, rt))
+
+        to_exp = exponents(tos)
+        rate_exp = to_exp - exponents(frms) + RATE_DECIMALS
+        rows_out = zip(ok, res.tolist(), rt.tolist(), to_exp.tolist(), rate_exp.tolist(),
+                       missing.tolist(), too_large.tolist(), overflow.tolist())
+        for k, value, rate, e, re, no_rate, big, over in rows_out:
+            if no_rate:
+                errors[k] = "rate not found"
+            elif big:
+                errors[k] = "amount too large to be represented exactly from a float"
+            elif over:
+                errors[k] = "converted amount exceeds int64 minor units"
+            else:
+                results[k] = _fixed(value, e)
+                rates[k] = _fixed(rate, re)
+    return _render(rows, results, rates, errors, fmt)
+
+
+def _json_number(value):
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def _fixed(value: int, exponent: int) -> str:
+    """Entier d'unités mineures → texte décimal fixe (10025, 2 → "100.25")."""
+    if exponent <= 0:
+        return str(value * 10 ** -exponent)
+    sign = "-" if value < 0 else ""
+    digits = str(abs(value)).rjust(exponent + 1, "0")
+    return f"{sign}{digits[:-exponent]}.{digits[-exponent:]}"
+
+
+def _render(rows, results, rates, errors, fmt) -> str:
+    out = io.StringIO()
+    if fmt == "jsonl":
+        for (amount, frm, to, date, _), res, rate, err in zip(rows, results, rates, errors):
+            obj = {"amount": _json_number(amount), "from": frm, "to": to, "date": date or None}
+            if err:
+                obj["error"] = err
+            elif isinstance(res, str):  # mode exact : décimal fixe sans perte
+                obj.update({"result": res, "rate": rate})
+            else:
+                obj.update({"result": _json_number(res), "rate": _json_number(rate)})
+            # JSON strict : NaN / Infinity n'existent pas, ils sortent en null
+            out.write(json.dumps(obj, allow_nan=False) + "\n")
+    else:
+        writer = csv.writer(out, lineterminator="\n")
+        for (amount, frm, to, date, _), res, rate, err in zip(rows, results, rates, errors):
+            writer.writerow((amount, frm, to, date, "" if err else res, "" if err else rate, err))
+    return out.getvalue()
+
+
+# ------------------------------------------------------------------
+# Flux
+# ------------------------------------------------------------------
+def _is_header(cells) -> bool:
+    """Rangée d'en-tête : noms de colonnes attendus (amount,from,to[,date])."""
+    names = [c.strip().lower() for c in cells]
+    return 3 <= len(names) <= len(INPUT_FIELDS) and names == list(INPUT_FIELDS[:len(names)])
+
+
+def _chunks(f, fmt, chunk_size):
+    """
+    Paquets d'enregistrements non vides : lignes JSONL, ou rangées CSV lues
+    par csv.reader sur le fichier (guillemets multi-lignes respectés) ;
+    saute l'en-tête CSV s'il est présent.
+    """
+    if fmt == "jsonl":
+        items = (line for line in f if line.strip())
+    else:
+        items = (cells for cells in csv.reader(f) if any(c.strip() for c in cells))
+        first = next(items, None)
+        if first is None:
+            return
+        if not _is_header(first):
+            items = _prepend(first, items)
+    while chunk := list(islice(items, chunk_size)):
+        yield chunk
+
+
+def _prepend(item, it):
+    yield item
+    yield from it
+
+
+def run(input_path, output_path, fmt=None, workers=None, chunk_size=50_000, table=None,
+        fallback="last_known", exact=False) -> int:
+    """Convertit un fichier entier ; retourne le nombre de lignes écrites."""
+    fmt = fmt or ("jsonl" if str(input_path).endswith((".jsonl", ".ndjson")) else "csv")
+    table = table or RateTable.from_ecb_file()
+
+    with open(input_path, encoding="utf-8", newline="") as fin, \
+            open(output_path, "w", encoding="utf-8", newline="") as fout:
+        if fmt == "csv":
+            fout.write(",".join(OUTPUT_FIELDS) + "\n")
+
+        n = 0
+        chunks = _chunks(fin, fmt, chunk_size)
+        if workers == 1:
+            converter = OfflineConverter(table, fallback)
+            if exact:
+                converter = FixedPointConverter(converter)
+            for chunk in chunks:
+                fout.write(convert_chunk(chunk, fmt, converter))
+                n += len(chunk)
+            return n
+
+        workers = workers or os.cpu_count() or 1
+        init = (table.codes, table.first_ordinal, np.asarray(table.data), table.ref, fallback, exact)
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=init) as pool:
+            window = deque()
+            max_in_flight = 2 * workers
+            for chunk in chunks:
+                window.append((len(chunk), pool.submit(convert_chunk, chunk, fmt)))
+                if len(window) >= max_in_flight:
+                    size, fut = window.popleft()
+                    fout.write(fut.result())
+                    n += size
+            while window:
+                size, fut = window.popleft()
+                fout.write(fut.result())
+                n += size
+        return n
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Conversion de devises en lot (offline, sans UI)")
+    parser.add_argument("input", help="fichier CSV ou JSONL (amount, from, to[, date])")
+    parser.add_argument("output", help="fichier de sortie (même format)")
+    parser.add_argument("--format", choices=("csv", "jsonl"), default=None)
+    parser.add_argument("--workers", type=int, default=None, help="processus (1 = sans pool)")
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="lignes par paquet")
+    parser.add_argument("--fallback", choices=FALLBACKS, default="last_known",
+                        help="jours sans cotation (lignes datées)")
+    parser.add_argument("--exact", action="store_true",
+                        help="arithmétique entière en unités mineures (arrondi bancaire)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    n = run(args.input, args.output, args.format, args.workers, args.chunk_size, fallback=args.fallback,
+            exact=args.exact)
+    elapsed = time.perf_counter() - start
+    print(f"{n} lignes en {elapsed:.2f} s ({n / elapsed if elapsed else 0:,.0f} lignes/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -44,9 +44,33 @@ STRINGS = {
         Lang.FR:"Le taux {frm}→{to} = {rate:.4f} (≥ {th:.4f})",
         Lang.EN:"{frm}→{to} rate = {rate:.4f} (≥ {th:.4f})"
     },
+    "alert_title": {Lang.FR:"Alerte de taux", Lang.EN:"Rate alert"},
+    "alert_rules": {Lang.FR:"⚙ Règles d'alerte…", Lang.EN:"⚙ Alert rules…"},
+    "rule_add": {Lang.FR:"Ajouter", Lang.EN:"Add"},
+    "rule_remove": {Lang.FR:"Supprimer la sélection", Lang.EN:"Remove selected"},
     "dialog_success": {Lang.FR:"Succès", Lang.EN:"Success"},
     "dialog_error": {Lang.FR:"Erreur", Lang.EN:"Error"},
     "pdf_done": {Lang.FR:"Export terminé ✅", Lang.EN:"Export finished ✅"},
+    "pdf_progress": {Lang.FR:"Export PDF en cours…", Lang.EN:"Exporting PDF…"},
+    "pdf_cancelled": {Lang.FR:"Export annulé", Lang.EN:"Export cancelled"},
+    "cancel": {Lang.FR:"Annuler", Lang.EN:"Cancel"},
+    "rates_updated": {
+        Lang.FR:"Taux mis à jour ({source}, au {day})",
+        Lang.EN:"Rates updated ({source}, as of {day})"
+    },
+    "watchlist": {Lang.FR:"⭐ Watchlist", Lang.EN:"⭐ Watchlist"},
+    "watchlist_all": {Lang.FR:"Toutes les devises", Lang.EN:"All currencies"},
+    "watchlist_hint": {
+        Lang.FR:"Double-clic : épingler / retirer une devise",
+        Lang.EN:"Double-click: pin / unpin a currency"
+    },
+    "analytics": {Lang.FR:"📈 Analyses (moyenne mobile, min/max)", Lang.EN:"📈 Analytics (moving average, min/max)"},
+    "analytics_stats": {
+        Lang.FR:"{pair} — MM{n} {sma:.4f} · Volatilité {vol:.2f} % · Min/Max {low:.4f} / {high:.4f} · "
+                "Drawdown {dd:.2f} % (max {mdd:.2f} %) · Variation {chg:+.2f} %",
+        Lang.EN:"{pair} — SMA{n} {sma:.4f} · Volatility {vol:.2f}% · Low/High {low:.4f} / {high:.4f} · "
+                "Drawdown {dd:.2f}% (max {mdd:.2f}%) · Change {chg:+.2f}%"
+    },
 }
     
 def t(key: str, lang: Lang) -> str:
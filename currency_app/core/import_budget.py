@@ -0,0 +1,79 @@
+"""
+Module: import_budget.py
+Responsabilité:
+    Mesurer le coût d'import au démarrage et vérifier un budget.
+
+Usage:
+    python -m currency_app.core.import_budget --budget-ms 400 --top 15
+
+Design:
+    - Lance `python -X importtime -c "import app"` dans un sous-processus propre
+    - Classe les modules par temps propre (self) et cumulé
+    - Code retour 1 si le temps cumulé total dépasse le budget
+"""
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def measure_imports(target: str = "app", cwd=None) -> list[ImportTiming]:
+    """Importe `target` dans un interpréteur neuf et retourne les temps d'import."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=cwd, capture_output=True, text=True, check=True,
+    )
+
+    timings = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        timings.append(ImportTiming(name.strip(), int(self_us), int(cumulative_us), depth))
+    return timings
+
+
+def report(timings: list[ImportTiming], top: int = 15) -> str:
+    """Tableau texte des modules dominant le démarrage."""
+    total = sum(t.cumulative_us for t in timings if t.depth == 0)
+    lines = [f"Total import: {total / 1000:.1f} ms", "", "Top self time:"]
+    for t in sorted(timings, key=lambda t: t.self_us, reverse=True)[:top]:
+        lines.append(f"  {t.self_us / 1000:8.1f} ms  {t.module}")
+
+    lines += ["", "Direct imports of target (cumulative):"]
+    for t in sorted((t for t in timings if t.depth == 1), key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        lines.append(f"  {t.cumulative_us / 1000:8.1f} ms  {t.module}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Budget de temps d'import au démarrage")
+    parser.add_argument("--target", default="app", help="module importé (défaut: app)")
+    parser.add_argument("--budget-ms", type=float, default=None, help="budget total en ms")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    root = Path(__file__).resolve().parents[2]
+    timings = measure_imports(args.target, cwd=root)
+    print(report(timings, args.top))
+
+    total_ms = sum(t.cumulative_us for t in timings if t.depth == 0) / 1000
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"\nBudget dépassé: {total_ms:.1f} ms > {args.budget_ms:.1f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
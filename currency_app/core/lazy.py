@@ -0,0 +1,41 @@
+"""
+Module: lazy.py
+Responsabilité:
+    Import et construction différés des sous-systèmes coûteux
+    (QtCharts, QtPrintSupport, icône tray).
+
+Design:
+    - LazyService enveloppe une factory, rien n'est importé avant le premier usage
+    - Tout accès d'attribut construit le service puis lui est délégué
+    - `loaded` permet à l'UI de savoir si le service existe déjà
+"""
+
+from importlib import import_module
+
+
+def import_attr(module: str, name: str):
+    """Importe `module` et retourne son attribut `name`."""
+    return getattr(import_module(module), name)
+
+
+class LazyService:
+    """Proxy construisant le service réel au premier accès."""
+
+    def __init__(self, module: str, name: str, *args, **kwargs):
+        self._target = (module, name, args, kwargs)
+        self._instance = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._instance is not None
+
+    def get(self):
+        """Retourne le service, en l'important et le construisant si besoin."""
+        if self._instance is None:
+            module, name, args, kwargs = self._target
+            self._instance = import_attr(module, name)(*args, **kwargs)
+        return self._instance
+
+    def __getattr__(self, name):
+        # Appelé uniquement pour les attributs absents du proxy
+        return getattr(self.get(), name)
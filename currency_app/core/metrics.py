@@ -0,0 +1,240 @@
+"""
+Module: metrics.py
+Responsabilité:
+    Registre de métriques des chemins critiques : compteurs, histogrammes, timers
+
+Usage:
+    from currency_app.core import metrics
+
+    @metrics.timed("chart.add_point")
+    def add_point(...): ...
+
+    with metrics.timer("db.write_batch"):
+        ...
+    metrics.counter("db.rows_written").inc(len(batch))
+
+Design:
+    - Désactivé par défaut : un timer désactivé coûte un test de booléen
+      global (décorateur) ou retourne un context manager no-op partagé
+    - Histogrammes à buckets exponentiels fixes (durées : 1 µs → ~134 s,
+      tailles : 1 → ~1M) : mémoire constante, percentiles approchés à la
+      borne du bucket
+    - Thread-safe (pipeline, writer SQLite et export PDF tournent hors GUI)
+    - snapshot() / dump_json() : export JSON pour les tableaux de bord
+"""
+
+import bisect
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+_enabled = False
+
+# Bornes supérieures des buckets : durées (1 µs × 2^k) et tailles (2^k)
+BUCKETS = tuple(1e-6 * 2 ** k for k in range(28))
+SIZE_BUCKETS = tuple(float(2 ** k) for k in range(21))
+
+
+class Counter:
+    __slots__ = ("name", "value", "_lock")
+
+    def __init__(self, name):
+        self.name = name
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, n=1):
+        if _enabled:
+            with self._lock:
+                self.value += n
+
+    def reset(self):
+        with self._lock:
+            self.value = 0
+
+    def snapshot(self) -> int:
+        return self.value
+
+
+class Histogram:
+    __slots__ = ("name", "unit", "bounds", "count", "total", "min", "max", "buckets", "_lock")
+
+    def __init__(self, name, unit="s"):
+        self.name = name
+        self.unit = unit
+        self.bounds = BUCKETS if unit == "s" else SIZE_BUCKETS
+        self._lock = threading.Lock()
+        self.reset()
+
+    def observe(self, value):
+        if not _enabled:
+            return
+        k = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self.count += 1
+            self.total += value
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+            self.buckets[k] += 1
+
+    def reset(self):
+        with self._lock:
+            self.count = 0
+            self.total = 0.0
+            self.min = float("inf")
+            self.max = 0.0
+            self.buckets = [0] * (len(self.bounds) + 1)
+
+    def percentile(self, q) -> float:
+        """Percentile approché (borne haute du bucket, ramenée dans [min, max])."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for k, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                bound = self.bounds[k] if k < len(self.bounds) else self.max
+                return max(self.min, min(bound, self.max))
+        return self.max
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            if not self.count:
+                return {"unit": self.unit, "count": 0}
+            return {
+                "unit": self.unit,
+                "count": self.count,
+                "sum": self.total,
+                "mean": self.total / self.count,
+                "min": self.min,
+                "max": self.max,
+                "p50": self.percentile(0.50),
+                "p95": self.percentile(0.95),
+                "p99": self.percentile(0.99),
+            }
+
+
+class MetricsRegistry:
+    """Métriques nommées (noms pointés : "db.insert", "chart.add_point"...)."""
+
+    def __init__(self):
+        self.counters: dict[str, Counter] = {}
+        self.histograms: dict[str, Histogram] = {}
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    def counter(self, name) -> Counter:
+        c = self.counters.get(name)
+        if c is None:
+            with self._lock:
+                c = self.counters.setdefault(name, Counter(name))
+        return c
+
+    def histogram(self, name, unit="s") -> Histogram:
+        h = self.histograms.get(name)
+        if h is None:
+            with self._lock:
+                h = self.histograms.setdefault(name, Histogram(name, unit))
+        return h
+
+    def reset(self):
+        for metric in (*self.counters.values(), *self.histograms.values()):
+            metric.reset()
+        self.started = time.time()
+
+    def snapshot(self) -> dict:
+        return {
+            "ts": time.time(),
+            "pid": os.getpid(),
+            "enabled": _enabled,
+            "uptime_s": time.time() - self.started,
+            "counters": {n: c.snapshot() for n, c in sorted(self.counters.items())},
+            "histograms": {n: h.snapshot() for n, h in sorted(self.histograms.items())},
+        }
+
+    def dump_json(self, path) -> None:
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(self.snapshot(), indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+REGISTRY = MetricsRegistry()
+
+
+# ------------------------------------------------------------------
+# API module
+# ------------------------------------------------------------------
+def set_enabled(enabled: bool) -> None:
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def counter(name) -> Counter:
+    return REGISTRY.counter(name)
+
+
+def histogram(name, unit="s") -> Histogram:
+    """Histogramme de durées (unit="s") ou de tailles (toute autre unité)."""
+    return REGISTRY.histogram(name, unit)
+
+
+class _Timer:
+    __slots__ = ("hist", "start")
+
+    def __init__(self, hist):
+        self.hist = hist
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.hist.observe(time.perf_counter() - self.start)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def timer(name):
+    """Context manager qui mesure la durée du bloc (no-op si désactivé)."""
+    if not _enabled:
+        return _NULL_TIMER
+    return _Timer(REGISTRY.histogram(name))
+
+
+def timed(name):
+    """Décorateur : durée de chaque appel dans l'histogramme `name`."""
+    def deco(fn):
+        hist = REGISTRY.histogram(name)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                hist.observe(time.perf_counter() - start)
+        return wrapper
+    return deco
@@ -16,11 +16,65 @@ class Settings:
     app_title: str = "💱 Convertisseur — PySide6"
     db_path: Path = Path("history.sqlite3")
 
+    # Historique : écriture différée par lots (write-behind, WAL)
+    db_write_behind: bool = True
+    db_batch_size: int = 256          # lignes max par commit
+    db_flush_interval: float = 0.5    # secondes max avant commit d'un lot
+    db_synchronous: str = "NORMAL"    # OFF / NORMAL / FULL / EXTRA (durabilité)
+    db_read_pool_size: int = 4        # connexions WAL en lecture seule (0 = connexion partagée)
+    db_busy_timeout: float = 5.0      # secondes d'attente sur une base verrouillée
+
+    # Rétention : lignes plus anciennes archivées en segments compressés (None = tout garder)
+    history_retention_days: int | None = None
+    history_maintenance_interval: float = 3600.0  # secondes entre deux passes (archivage, VACUUM, ANALYZE)
+    history_maintenance_delay: float = 60.0       # première passe après le démarrage
+
     # Valeurs UX
     default_from: str = "EUR"
     default_to: str = "USD"
     default_amount: float = 100.0
+    convert_debounce_ms: int = 250
+    history_settle_ms: int = 2000     # inactivité avant d'enregistrer une rafale de saisies (une ligne)
+
+    # Rafraîchissement des taux à chaud (dossier de dépôt et/ou URL locale, format BCE)
+    rates_drop_dir: Path | None = None
+    rates_url: str | None = None
+    rates_poll_interval: float = 30.0  # secondes entre deux interrogations
+
+    # Conversions datées : comblement des jours sans cotation (none / last_known / linear)
+    rate_fallback: str = "last_known"
+
+    # Watchlist : un montant dans toutes les devises ou dans les devises épinglées
+    watchlist: tuple[str, ...] = ("USD", "EUR", "GBP", "JPY", "CHF", "CAD", "CNY")
+    watchlist_all: bool = False
+
+    # Analyses glissantes par paire (superposées au graphique)
+    analytics_window: int = 20
+    analytics_overlay: bool = False
+
+    # Métriques des chemins critiques (panneau Ctrl+Shift+D, dump JSON à la fermeture)
+    metrics_enabled: bool = False
+    metrics_dump_path: Path | None = None
 
     # Notifications
     notify_default_enabled: bool = False
     notify_default_threshold: float = 100.0
+    notify_min_interval: float = 10.0  # secondes entre deux messages tray (regroupés)
+
+    # Démarrage : graphique, export PDF et tray chargés après le 1er affichage
+    lazy_subsystems: bool = True
+
+    @property
+    def rates_snapshot_path(self) -> Path:
+        """Snapshot compilé des taux, rangé à côté de la base d'historique."""
+        return self.db_path.with_name("rates.snapshot")
+
+    @property
+    def alert_rules_path(self) -> Path:
+        """Règles d'alerte configurées (JSON), à côté de la base."""
+        return self.db_path.with_name("alert-rules.json")
+
+    @property
+    def history_archive_path(self) -> Path:
+        """Dossier des segments d'historique archivés, à côté de la base."""
+        return self.db_path.with_name("history-archive")
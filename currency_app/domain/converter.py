@@ -6,31 +6,257 @@ Responsabilité:
 Notes d'architecte:
     - Cette couche ne doit jamais dépendre de PySide6 (UI)
     - Facilement testable unitairement
+    - Les taux croisés sont précalculés dans une matrice NumPy N×N
+      (devises internées en IDs entiers) : une conversion = une lecture,
+      un lot = une opération vectorisée, un montant vers toutes les devises
+      (fan_out) = une ligne de la matrice.
+    - Les conversions datées lisent la table jours × devises (éventuellement
+      comblée) : une série de N jours pour une paire = deux tranches de colonnes.
+    - Table + matrice forment un RateSnapshot immuable : un rafraîchissement
+      des taux (swap) remplace la référence d'un bloc, chaque appel lit un
+      seul snapshot du début à la fin.
 """
 
-from currency_converter import CurrencyConverter
+from datetime import date
+from functools import cached_property
+from typing import Iterable, Sequence
+
+import numpy as np
+from currency_converter import RateNotFoundError
+
+from currency_app.domain.rates import FALLBACKS, RateTable
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class RateSnapshot:
+    """
+    Vue immuable d'une table de taux : table, devises internées et matrice
+    des taux croisés (construite au premier usage).
+
+    Le convertisseur ne garde qu'une référence vers le snapshot courant :
+    le remplacer est une seule affectation, un appel en cours garde le sien.
+    """
+
+    def __init__(self, table: RateTable):
+        self.table = table
+        self.codes = table.codes
+        self.ids = table.ids
+
+    @cached_property
+    def matrix(self) -> np.ndarray:
+        """
+        Matrice M où M[i, j] = taux de codes[i] vers codes[j].
+
+        Comme CurrencyConverter, la ligne i utilise la dernière date connue
+        de la devise source ; NaN si la devise cible n'a pas de taux ce jour-là.
+        """
+        table = self.table
+        n = len(table.codes)
+        ref = np.asarray(table.data[table.last_valid_index()])  # ligne i = taux au dernier jour de i
+        matrix = ref / ref[np.arange(n), np.arange(n)][:, None]
+
+        matrix.setflags(write=False)
+        return matrix
+
+    def ids_of(self, codes: Iterable[str]) -> np.ndarray:
+        """Interne une séquence de codes devise en IDs entiers."""
+        ids = self.ids
+        try:
+            return np.fromiter((ids[c] for c in codes), dtype=np.intp)
+        except KeyError as exc:
+            raise ValueError(f"{exc.args[0]} is not a supported currency") from None
 
 
 class OfflineConverter:
     """Service métier responsable de la conversion offline."""
 
-    def __init__(self):
-        # Instancie le moteur de conversion
-        self.cc = CurrencyConverter()
+    def __init__(self, table: RateTable | None = None, fallback: str = "none"):
+        # Table des taux injectée (snapshot memory-mappé) ou parse du CSV BCE
+        self._snapshot = RateSnapshot(table if table is not None else RateTable.from_ecb_file())
+
+        # Comblement des jours sans cotation pour les conversions datées
+        if fallback not in FALLBACKS:
+            raise ValueError(f"unknown fallback {fallback!r} (expected one of {', '.join(FALLBACKS)})")
+        self.fallback = fallback
+
+    # ------------------------------------------------------------------
+    # Snapshot courant des taux (remplacement atomique)
+    # ------------------------------------------------------------------
+    @property
+    def table(self) -> RateTable:
+        return self._snapshot.table
 
+    @table.setter
+    def table(self, table: RateTable):
+        self._snapshot = RateSnapshot(table)
+
+    def snapshot(self) -> RateSnapshot:
+        """Snapshot courant ; à passer aux appels qui doivent voir la même table."""
+        return self._snapshot
+
+    def swap(self, table: RateTable) -> RateTable:
+        """
+        Remplace la table des taux d'un bloc et retourne l'ancienne.
+
+        La matrice croisée et la table comblée par défaut sont calculées
+        avant la publication (thread appelant) : le premier appel qui suit
+        ne paie aucune reconstruction, et aucun appel ne voit un état mixte.
+        """
+        snap = RateSnapshot(table)
+        snap.matrix
+        table.filled(self.fallback)
+        old, self._snapshot = self._snapshot, snap
+        return old.table
+
+    def currency_ids(self, codes: Iterable[str]) -> np.ndarray:
+        """IDs entiers (colonnes de la table / de la matrice) d'une séquence de codes."""
+        return self._snapshot.ids_of(codes)
+
+    def cross_rates(self) -> tuple[tuple[str, ...], np.ndarray]:
+        """Retourne (codes, matrice N×N en lecture seule des taux croisés)."""
+        snap = self._snapshot
+        return snap.codes, snap.matrix
+
+    # ------------------------------------------------------------------
+    # API publique
+    # ------------------------------------------------------------------
     def list_currencies(self) -> list[str]:
         """Retourne la liste triée des devises disponibles."""
-        return sorted(list(self.cc.currencies))
+        return list(self._snapshot.codes)
 
-    def convert(self, amount: float, frm: str, to: str) -> tuple[float, float]:
+    def convert(self, amount: float, frm: str, to: str, on=None,
+                fallback: str | None = None) -> tuple[float, float]:
         """
-        Effectue la conversion.
+        Effectue la conversion, au dernier taux connu ou au taux du jour `on`.
         Retour:
             (resultat, taux utilisé)
 
         Exception:
-            Propagera si devise inconnue
+            ValueError si devise inconnue, RateNotFoundError si taux absent
+        """
+        if on is not None:
+            rate = self.rate_on(frm, to, on, fallback)
+            return float(amount) * rate, rate
+
+        snap = self._snapshot
+        i, j = snap.ids_of((frm, to))
+        rate = float(snap.matrix[i, j])
+        if rate != rate:  # NaN
+            raise RateNotFoundError(f"{to} has no rate for the last {frm} date")
+        return float(amount) * rate, rate
+
+    def rate_on(self, frm: str, to: str, on, fallback: str | None = None) -> float:
+        """
+        Taux frm → to au jour `on` (date, datetime ou "YYYY-MM-DD").
+
+        Exception:
+            ValueError si devise inconnue, RateNotFoundError si taux absent
         """
-        result = float(self.cc.convert(amount, frm, to))
-        rate = result / amount if amount != 0 else 0.0
-        return result, rate
+        snap = self._snapshot
+        table = snap.table
+        i, j = snap.ids_of((frm, to))
+        day = table.day_index(on)
+        if not 0 <= day < len(table.data):
+            raise RateNotFoundError(f"{on} is outside the rate table "
+                                    f"({table.first_date} – {table.last_date})")
+        row = table.filled(fallback or self.fallback)[day]
+        rate = float(row[j] / row[i])
+        if rate != rate:  # NaN
+            raise RateNotFoundError(f"no {frm}→{to} rate on {on}")
+        return rate
+
+    def rate_series(self, frm: str, to: str, start=None, end=None,
+                    fallback: str | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Série journalière des taux frm → to entre start et end (inclus).
+
+        Bornes absentes = début / fin de la table ; elles sont ramenées
+        à la plage couverte.
+        Retour:
+            (jours datetime64[D], taux) — NaN pour les jours sans taux
+
+        Exception:
+            ValueError si devise inconnue
+        """
+        snap = self._snapshot
+        table = snap.table
+        i, j = snap.ids_of((frm, to))
+        n = len(table.data)
+        lo = 0 if start is None else max(table.day_index(start), 0)
+        hi = n if end is None else min(table.day_index(end) + 1, n)
+        hi = max(hi, lo)
+
+        data = table.filled(fallback or self.fallback)
+        rates = data[lo:hi, j] / data[lo:hi, i]
+        days = np.arange(table.first_ordinal + lo, table.first_ordinal + hi) - _EPOCH_ORDINAL
+        return days.astype("datetime64[D]"), rates
+
+    def convert_many(self, amounts: Sequence[float], frm: str, to: str) -> np.ndarray:
+        """
+        Convertit un lot de montants pour une même paire (une multiplication).
+
+        Exception:
+            ValueError si devise inconnue, RateNotFoundError si taux absent
+        """
+        _, rate = self.convert(1.0, frm, to)
+        return np.asarray(amounts, dtype=np.float64) * rate
+
+    def fan_out(self, amount: float, frm: str,
+                tos: Sequence[str] | None = None,
+                snapshot: RateSnapshot | None = None) -> tuple[tuple[str, ...], np.ndarray, np.ndarray]:
+        """
+        Convertit un montant vers toutes les devises (ou la liste `tos`) :
+        une ligne de la matrice × le montant. `snapshot` : taux figés (défaut : le courant).
+        Retour:
+            (codes cibles, résultats, taux) — NaN pour les cibles sans taux
+
+        Exception:
+            ValueError si devise inconnue
+        """
+        snap = snapshot or self._snapshot
+        row = snap.matrix[snap.ids_of((frm,))[0]]
+        if tos is None:
+            codes, rates = snap.codes, row
+        else:
+            codes = tuple(tos)
+            rates = row[snap.ids_of(codes)]
+        return codes, float(amount) * rates, rates
+
+    def convert_matrix(self, amounts: Sequence[float], frms: Sequence[str],
+                       tos: Sequence[str], on=None,
+                       fallback: str | None = None,
+                       snapshot: RateSnapshot | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Convertit un lot hétérogène : amounts[k] de frms[k] vers tos[k].
+
+        `on` : None (dernier taux), une date commune, ou une séquence de
+        dates par élément (None / "" = dernier taux).
+        Les taux sont lus dans la matrice (ou la table datée) par indexation
+        vectorisée. `snapshot` : taux figés à utiliser (défaut : le courant).
+        Retour:
+            (résultats, taux) — NaN pour les paires sans taux
+
+        Exception:
+            ValueError si devise inconnue ou date invalide
+        """
+        snap = snapshot or self._snapshot
+        fi, ti = snap.ids_of(frms), snap.ids_of(tos)
+        rates = snap.matrix[fi, ti]
+
+        if on is not None:
+            table = snap.table
+            if isinstance(on, (str, date)):
+                days = np.full(len(rates), table.day_index(on), dtype=np.int64)
+                dated = np.ones(len(rates), dtype=bool)
+            else:
+                dated = np.fromiter((bool(d) for d in on), dtype=bool, count=len(rates))
+                days = np.fromiter((table.day_index(d) if d else 0 for d in on),
+                                   dtype=np.int64, count=len(rates))
+            inside = (days >= 0) & (days < len(table.data))
+            data = table.filled(fallback or self.fallback)
+            d = np.where(inside, days, 0)
+            rates = np.where(dated, np.where(inside, data[d, ti] / data[d, fi], np.nan), rates)
+
+        return np.asarray(amounts, dtype=np.float64) * rates, rates
+
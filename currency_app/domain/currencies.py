@@ -0,0 +1,317 @@
+"""
+Module: currencies.py
+Responsabilité:
+    Métadonnées des devises (noms FR/EN, drapeau, alias, exposant ISO 4217)
+    et index de recherche
+
+Design:
+    - Table statique parsée une fois à l'import (aucune dépendance Qt)
+    - CurrencyIndex précalcule, pour les devises disponibles :
+        * une liste triée de termes normalisés (minuscules, sans accents)
+          → recherche par préfixe en O(log n) (bisect)
+        * un index de trigrammes → sous-chaînes et recherche approchée
+          ("dolar", "yuan", "couronne") sans parcourir tous les noms
+    - search() classe : code exact, préfixe de code, préfixe de mot,
+      sous-chaîne, puis similarité de trigrammes
+"""
+
+import bisect
+import unicodedata
+from dataclasses import dataclass
+
+from currency_app.utils.flags import flag_for_currency
+
+# CODE|nom anglais|nom français|alias (séparés par des virgules)
+_TABLE = """
+AED|UAE Dirham|Dirham des Émirats arabes unis|emirati dirham
+AFN|Afghan Afghani|Afghani afghan|afghani
+ALL|Albanian Lek|Lek albanais|lek
+AMD|Armenian Dram|Dram arménien|dram
+ANG|Netherlands Antillean Guilder|Florin des Antilles néerlandaises|guilder,florin
+AOA|Angolan Kwanza|Kwanza angolais|kwanza
+ARS|Argentine Peso|Peso argentin|peso
+AUD|Australian Dollar|Dollar australien|dollar,aussie
+AWG|Aruban Florin|Florin arubais|florin
+AZN|Azerbaijani Manat|Manat azerbaïdjanais|manat
+BAM|Bosnia-Herzegovina Convertible Mark|Mark convertible de Bosnie-Herzégovine|mark
+BBD|Barbadian Dollar|Dollar barbadien|dollar
+BDT|Bangladeshi Taka|Taka bangladais|taka
+BGN|Bulgarian Lev|Lev bulgare|lev
+BHD|Bahraini Dinar|Dinar bahreïni|dinar
+BIF|Burundian Franc|Franc burundais|franc
+BMD|Bermudian Dollar|Dollar bermudien|dollar
+BND|Brunei Dollar|Dollar de Brunei|dollar
+BOB|Bolivian Boliviano|Boliviano bolivien|boliviano
+BRL|Brazilian Real|Réal brésilien|real
+BSD|Bahamian Dollar|Dollar bahaméen|dollar
+BTN|Bhutanese Ngultrum|Ngultrum bhoutanais|ngultrum
+BWP|Botswana Pula|Pula botswanais|pula
+BYN|Belarusian Ruble|Rouble biélorusse|ruble,rouble
+BZD|Belize Dollar|Dollar bélizien|dollar
+CAD|Canadian Dollar|Dollar canadien|dollar,loonie
+CDF|Congolese Franc|Franc congolais|franc
+CHF|Swiss Franc|Franc suisse|franc,swissy
+CLP|Chilean Peso|Peso chilien|peso
+CNY|Chinese Yuan|Yuan chinois|yuan,renminbi,rmb
+COP|Colombian Peso|Peso colombien|peso
+CRC|Costa Rican Colón|Colón costaricien|colon
+CUP|Cuban Peso|Peso cubain|peso
+CVE|Cape Verdean Escudo|Escudo cap-verdien|escudo
+CYP|Cypriot Pound|Livre chypriote|pound,livre
+CZK|Czech Koruna|Couronne tchèque|koruna,crown,couronne
+DJF|Djiboutian Franc|Franc djiboutien|franc
+DKK|Danish Krone|Couronne danoise|krone,crown,couronne
+DOP|Dominican Peso|Peso dominicain|peso
+DZD|Algerian Dinar|Dinar algérien|dinar
+EEK|Estonian Kroon|Couronne estonienne|kroon,couronne
+EGP|Egyptian Pound|Livre égyptienne|pound,livre
+ERN|Eritrean Nakfa|Nakfa érythréen|nakfa
+ETB|Ethiopian Birr|Birr éthiopien|birr
+EUR|Euro|Euro|euro
+FJD|Fijian Dollar|Dollar fidjien|dollar
+FKP|Falkland Islands Pound|Livre des Malouines|pound,livre
+GBP|British Pound|Livre sterling|pound,sterling,livre,quid
+GEL|Georgian Lari|Lari géorgien|lari
+GHS|Ghanaian Cedi|Cedi ghanéen|cedi
+GIP|Gibraltar Pound|Livre de Gibraltar|pound,livre
+GMD|Gambian Dalasi|Dalasi gambien|dalasi
+GNF|Guinean Franc|Franc guinéen|franc
+GTQ|Guatemalan Quetzal|Quetzal guatémaltèque|quetzal
+GYD|Guyanese Dollar|Dollar guyanien|dollar
+HKD|Hong Kong Dollar|Dollar de Hong Kong|dollar
+HNL|Honduran Lempira|Lempira hondurien|lempira
+HRK|Croatian Kuna|Kuna croate|kuna
+HTG|Haitian Gourde|Gourde haïtienne|gourde
+HUF|Hungarian Forint|Forint hongrois|forint
+IDR|Indonesian Rupiah|Roupie indonésienne|rupiah,roupie
+ILS|Israeli New Shekel|Nouveau shekel israélien|shekel,sheqel
+INR|Indian Rupee|Roupie indienne|rupee,roupie
+IQD|Iraqi Dinar|Dinar irakien|dinar
+IRR|Iranian Rial|Rial iranien|rial
+ISK|Icelandic Króna|Couronne islandaise|krona,couronne
+JMD|Jamaican Dollar|Dollar jamaïcain|dollar
+JOD|Jordanian Dinar|Dinar jordanien|dinar
+JPY|Japanese Yen|Yen japonais|yen
+KES|Kenyan Shilling|Shilling kényan|shilling
+KGS|Kyrgyzstani Som|Som kirghize|som
+KHR|Cambodian Riel|Riel cambodgien|riel
+KMF|Comorian Franc|Franc comorien|franc
+KPW|North Korean Won|Won nord-coréen|won
+KRW|South Korean Won|Won sud-coréen|won
+KWD|Kuwaiti Dinar|Dinar koweïtien|dinar
+KYD|Cayman Islands Dollar|Dollar des îles Caïmans|dollar
+KZT|Kazakhstani Tenge|Tenge kazakh|tenge
+LAK|Lao Kip|Kip laotien|kip
+LBP|Lebanese Pound|Livre libanaise|pound,livre
+LKR|Sri Lankan Rupee|Roupie srilankaise|rupee,roupie
+LRD|Liberian Dollar|Dollar libérien|dollar
+LSL|Lesotho Loti|Loti lesothan|loti
+LTL|Lithuanian Litas|Litas lituanien|litas
+LVL|Latvian Lats|Lats letton|lats
+LYD|Libyan Dinar|Dinar libyen|dinar
+MAD|Moroccan Dirham|Dirham marocain|dirham
+MDL|Moldovan Leu|Leu moldave|leu
+MGA|Malagasy Ariary|Ariary malgache|ariary
+MKD|Macedonian Denar|Denar macédonien|denar
+MMK|Myanmar Kyat|Kyat birman|kyat
+MNT|Mongolian Tögrög|Tugrik mongol|tugrik,togrog
+MOP|Macanese Pataca|Pataca de Macao|pataca
+MRU|Mauritanian Ouguiya|Ouguiya mauritanien|ouguiya
+MTL|Maltese Lira|Lire maltaise|lira,lire
+MUR|Mauritian Rupee|Roupie mauricienne|rupee,roupie
+MVR|Maldivian Rufiyaa|Rufiyaa maldivienne|rufiyaa
+MWK|Malawian Kwacha|Kwacha malawite|kwacha
+MXN|Mexican Peso|Peso mexicain|peso
+MYR|Malaysian Ringgit|Ringgit malaisien|ringgit
+MZN|Mozambican Metical|Metical mozambicain|metical
+NAD|Namibian Dollar|Dollar namibien|dollar
+NGN|Nigerian Naira|Naira nigérian|naira
+NIO|Nicaraguan Córdoba|Córdoba nicaraguayen|cordoba
+NOK|Norwegian Krone|Couronne norvégienne|krone,crown,couronne
+NPR|Nepalese Rupee|Roupie népalaise|rupee,roupie
+NZD|New Zealand Dollar|Dollar néo-zélandais|dollar,kiwi
+OMR|Omani Rial|Rial omanais|rial
+PAB|Panamanian Balboa|Balboa panaméen|balboa
+PEN|Peruvian Sol|Sol péruvien|sol
+PGK|Papua New Guinean Kina|Kina papouan-néo-guinéen|kina
+PHP|Philippine Peso|Peso philippin|peso
+PKR|Pakistani Rupee|Roupie pakistanaise|rupee,roupie
+PLN|Polish Złoty|Zloty polonais|zloty
+PYG|Paraguayan Guaraní|Guaraní paraguayen|guarani
+QAR|Qatari Riyal|Riyal qatarien|riyal
+ROL|Romanian Leu (old)|Ancien leu roumain|leu
+RON|Romanian Leu|Leu roumain|leu
+RSD|Serbian Dinar|Dinar serbe|dinar
+RUB|Russian Ruble|Rouble russe|ruble,rouble
+RWF|Rwandan Franc|Franc rwandais|franc
+SAR|Saudi Riyal|Riyal saoudien|riyal
+SBD|Solomon Islands Dollar|Dollar des îles Salomon|dollar
+SCR|Seychellois Rupee|Roupie seychelloise|rupee,roupie
+SDG|Sudanese Pound|Livre soudanaise|pound,livre
+SEK|Swedish Krona|Couronne suédoise|krona,crown,couronne
+SGD|Singapore Dollar|Dollar de Singapour|dollar
+SHP|Saint Helena Pound|Livre de Sainte-Hélène|pound,livre
+SIT|Slovenian Tolar|Tolar slovène|tolar
+SKK|Slovak Koruna|Couronne slovaque|koruna,couronne
+SLE|Sierra Leonean Leone|Leone sierraléonais|leone
+SOS|Somali Shilling|Shilling somalien|shilling
+SRD|Surinamese Dollar|Dollar surinamais|dollar
+SSP|South Sudanese Pound|Livre sud-soudanaise|pound,livre
+STN|São Tomé and Príncipe Dobra|Dobra santoméen|dobra
+SYP|Syrian Pound|Livre syrienne|pound,livre
+SZL|Swazi Lilangeni|Lilangeni swazi|lilangeni
+THB|Thai Baht|Baht thaïlandais|baht
+TJS|Tajikistani Somoni|Somoni tadjik|somoni
+TMT|Turkmenistani Manat|Manat turkmène|manat
+TND|Tunisian Dinar|Dinar tunisien|dinar
+TOP|Tongan Paʻanga|Pa'anga tongien|paanga
+TRL|Turkish Lira (old)|Ancienne livre turque|lira,livre
+TRY|Turkish Lira|Livre turque|lira,livre
+TTD|Trinidad and Tobago Dollar|Dollar de Trinité-et-Tobago|dollar
+TWD|New Taiwan Dollar|Nouveau dollar de Taïwan|dollar
+TZS|Tanzanian Shilling|Shilling tanzanien|shilling
+UAH|Ukrainian Hryvnia|Hryvnia ukrainienne|hryvnia
+UGX|Ugandan Shilling|Shilling ougandais|shilling
+USD|US Dollar|Dollar américain|dollar,buck,greenback
+UYU|Uruguayan Peso|Peso uruguayen|peso
+UZS|Uzbekistani Som|Sum ouzbek|som,sum
+VES|Venezuelan Bolívar|Bolívar vénézuélien|bolivar
+VND|Vietnamese Đồng|Dong vietnamien|dong
+VUV|Vanuatu Vatu|Vatu vanuatais|vatu
+WST|Samoan Tālā|Tala samoan|tala
+XAF|Central African CFA Franc|Franc CFA (BEAC)|franc,cfa
+XCD|East Caribbean Dollar|Dollar des Caraïbes orientales|dollar
+XOF|West African CFA Franc|Franc CFA (BCEAO)|franc,cfa
+XPF|CFP Franc|Franc Pacifique|franc,cfp
+YER|Yemeni Rial|Rial yéménite|rial
+ZAR|South African Rand|Rand sud-africain|rand
+ZMW|Zambian Kwacha|Kwacha zambien|kwacha
+ZWL|Zimbabwean Dollar|Dollar zimbabwéen|dollar
+"""
+
+
+# Exposant ISO 4217 des unités mineures (2 par défaut : 1 USD = 100 cents)
+MINOR_UNIT_EXPONENTS = {
+    # 0 décimale
+    "BIF": 0, "CLP": 0, "DJF": 0, "GNF": 0, "ISK": 0, "JPY": 0, "KMF": 0, "KRW": 0,
+    "PYG": 0, "RWF": 0, "TRL": 0, "UGX": 0, "VND": 0, "VUV": 0, "XAF": 0, "XOF": 0,
+    "XPF": 0,
+    # 3 décimales
+    "BHD": 3, "IQD": 3, "JOD": 3, "KWD": 3, "LYD": 3, "OMR": 3, "TND": 3,
+}
+
+
+def minor_unit_exponent(code: str) -> int:
+    """Nombre de décimales de l'unité mineure (ISO 4217)."""
+    return MINOR_UNIT_EXPONENTS.get(code, 2)
+
+
+@dataclass(frozen=True)
+class CurrencyInfo:
+    code: str
+    name_en: str
+    name_fr: str
+    flag: str
+    aliases: tuple[str, ...] = ()
+
+    def name(self, lang: str = "fr") -> str:
+        return self.name_fr if lang == "fr" else self.name_en
+
+
+def _parse_table(text) -> dict[str, CurrencyInfo]:
+    infos = {}
+    for line in text.strip().splitlines():
+        code, en, fr, aliases = line.split("|")
+        infos[code] = CurrencyInfo(code, en, fr, flag_for_currency(code),
+                                   tuple(a for a in aliases.split(",") if a))
+    return infos
+
+
+CURRENCIES = _parse_table(_TABLE)
+
+
+def currency_info(code: str) -> CurrencyInfo:
+    """Métadonnées d'une devise (nom = code si absente de la table)."""
+    info = CURRENCIES.get(code)
+    return info if info is not None else CurrencyInfo(code, code, code, flag_for_currency(code))
+
+
+def normalize(text: str) -> str:
+    """Minuscules sans accents : "Réal" → "real", "Złoty" → "zloty"."""
+    decomposed = unicodedata.normalize("NFKD", text.replace("ł", "l").replace("Ł", "L"))
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+
+def _trigrams(term: str) -> set[str]:
+    padded = f" {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CurrencyIndex:
+    """Index de recherche précalculé sur un ensemble de devises."""
+
+    def __init__(self, codes):
+        self.entries = [currency_info(c) for c in codes]
+        self.codes = [e.code for e in self.entries]
+        self._row = {c: i for i, c in enumerate(self.codes)}
+
+        self._haystacks = []        # texte normalisé complet par entrée
+        terms = []                  # (terme, entrée) triés → préfixes
+        self._trigrams = {}         # trigramme → {entrée}
+        for i, e in enumerate(self.entries):
+            words = {normalize(e.code)}
+            for text in (e.name_en, e.name_fr, *e.aliases):
+                norm = normalize(text)
+                words.add(norm)
+                words.update(w for w in norm.replace("-", " ").replace("(", " ").replace(")", " ").split())
+            self._haystacks.append(" | ".join(sorted(words)))
+            terms.extend((w, i) for w in words)
+            for w in words:
+                for tri in _trigrams(w):
+                    self._trigrams.setdefault(tri, set()).add(i)
+        terms.sort()
+        self._terms = terms
+        self._term_keys = [t for t, _ in terms]
+
+    def row_of(self, code: str) -> int:
+        return self._row.get(code, -1)
+
+    def _prefix(self, q) -> set[int]:
+        lo = bisect.bisect_left(self._term_keys, q)
+        hi = bisect.bisect_left(self._term_keys, q + "￿")
+        return {i for _, i in self._terms[lo:hi]}
+
+    def search(self, query: str, limit: int | None = None) -> list[str]:
+        """Codes correspondant à la requête, du plus au moins pertinent."""
+        q = normalize(query.strip())
+        if not q:
+            return list(self.codes)
+
+        ranks = {}
+        exact = self._row.get(q.upper())
+        if exact is not None:
+            ranks[exact] = (0, 0.0)
+        for i in self._prefix(q):
+            ranks.setdefault(i, (1 if self.codes[i].lower().startswith(q) else 2, 0.0))
+
+        grams = _trigrams(q) if len(q) >= 3 else set()
+        if grams:
+            # Sous-chaîne : l'entrée contient tous les trigrammes internes de q
+            inner = {q[i:i + 3] for i in range(len(q) - 2)}
+            postings = [self._trigrams.get(g, set()) for g in inner]
+            for i in set.intersection(*postings) if postings else ():
+                if q in self._haystacks[i]:
+                    ranks.setdefault(i, (3, 0.0))
+
+            # Approché : part des trigrammes de q présents dans l'entrée
+            hits = {}
+            for g in grams:
+                for i in self._trigrams.get(g, ()):
+                    hits[i] = hits.get(i, 0) + 1
+            for i, n in hits.items():
+                score = n / len(grams)
+                if score >= 0.5:
+                    ranks.setdefault(i, (4, -score))
+
+        ordered = sorted(ranks, key=lambda i: (*ranks[i], self.codes[i]))
+        return [self.codes[i] for i in ordered[:limit]]
@@ -0,0 +1,170 @@
+"""
+Module: fixed_point.py
+Responsabilité:
+    Conversion exacte en arithmétique entière (unités mineures int64)
+
+Représentation:
+    - Montant : entier d'unités mineures selon l'exposant ISO 4217
+      (100.25 EUR → 10025, 1500 JPY → 1500, 1.5 KWD → 1500)
+    - Taux : entier r tel que  résultat_mineur = montant_mineur × r / 10^RATE_DECIMALS
+      (l'écart d'exposants entre les deux devises est inclus dans r)
+    - Arrondi bancaire (demi vers pair) à chaque étape
+
+Design:
+    - Tout est vectorisé sur des tableaux int64 : un lot exact coûte quelques
+      opérations NumPy, comme le chemin float (pas de boucle Decimal)
+    - Le produit montant × taux dépasserait int64 : il est découpé
+      (taux = q·10^9 + r, montant = h·10^9 + l) pour rester exact sans 128 bits
+    - Un résultat hors de int64 lève OverflowError au lieu de déborder ;
+      representable() / overflows() donnent le même test ligne à ligne
+      (un lot peut écarter ses seules lignes hors bornes)
+"""
+
+from decimal import Decimal
+from typing import Sequence
+
+import numpy as np
+
+from currency_app.domain.currencies import minor_unit_exponent
+
+RATE_DECIMALS = 9
+_SCALE = 10 ** RATE_DECIMALS
+_LIMIT = 2 ** 62  # marge sous 2^63 pour les sommes intermédiaires
+_EXACT_FLOAT = 2 ** 53  # au-delà, un float ne représente plus chaque entier
+
+
+def round_half_even_div(num: np.ndarray, den: int) -> np.ndarray:
+    """num / den arrondi demi vers pair (num int64, den > 0)."""
+    q, rem = np.divmod(num, den)  # division euclidienne : 0 <= rem < den
+    twice = 2 * rem
+    return q + ((twice > den) | ((twice == den) & (q % 2 == 1)))
+
+
+def exponents(codes: Sequence[str]) -> np.ndarray:
+    """Exposants ISO 4217 d'une séquence de codes (tableau int64)."""
+    cache = {}
+    return np.fromiter((cache.setdefault(c, minor_unit_exponent(c)) for c in codes),
+                       dtype=np.int64, count=len(codes))
+
+
+def from_minor(minor: int, code: str) -> Decimal:
+    """Unités mineures → Decimal exact (ex. 10025, "EUR" → Decimal("100.25"))."""
+    return Decimal(int(minor)).scaleb(-minor_unit_exponent(code))
+
+
+def scale_rates(rates, frm_exp, to_exp) -> np.ndarray:
+    """Taux décimaux → taux entiers (écart d'exposants inclus) ; -1 si taux absent."""
+    rates = np.asarray(rates, dtype=np.float64)
+    shift = np.asarray(to_exp) - np.asarray(frm_exp) + RATE_DECIMALS
+    scaled = np.rint(rates * 10.0 ** shift)
+    missing = np.isnan(scaled)
+    if np.any(scaled[~missing] >= _LIMIT):
+        raise OverflowError("rate too large for the fixed-point scale")
+    return np.where(missing, -1, scaled).astype(np.int64)
+
+
+def overflows(minor, scaled_rates) -> np.ndarray:
+    """Masque des produits minor × rate / 10^RATE_DECIMALS hors int64 (estimation float)."""
+    a = np.abs(np.asarray(minor, dtype=np.int64)).astype(np.float64)
+    return a * np.asarray(scaled_rates, dtype=np.int64).astype(np.float64) / _SCALE >= _LIMIT
+
+
+def multiply(minor: np.ndarray, scaled_rates: np.ndarray) -> np.ndarray:
+    """minor × rate / 10^RATE_DECIMALS exact, arrondi bancaire, en int64."""
+    minor = np.asarray(minor, dtype=np.int64)
+    rate = np.asarray(scaled_rates, dtype=np.int64)
+
+    # Détecte un résultat hors int64 avant tout calcul
+    if np.any(overflows(minor, rate)):
+        raise OverflowError("converted amount exceeds int64 minor units")
+
+    sign = np.sign(minor)
+    a = np.abs(minor)
+    q, r = np.divmod(rate, _SCALE)      # taux = q·S + r
+    hi, lo = np.divmod(a, _SCALE)       # montant = hi·S + lo
+
+    # a·rate/S = a·q + hi·r + lo·r/S   (lo·r < S² ≈ 1e18 : tient dans int64)
+    whole = a * q + hi * r
+    return sign * (whole + round_half_even_div(lo * r, _SCALE))
+
+
+class FixedPointConverter:
+    """Moteur optionnel exact au-dessus d'OfflineConverter (mêmes taux, même table)."""
+
+    def __init__(self, converter):
+        self.converter = converter
+        # (snapshot des taux, exposants par ID, matrice N×N des taux entiers)
+        self._scaled = None
+
+    def _scaled_matrix(self):
+        """Matrice des taux croisés en entiers, reconstruite si les taux ont changé."""
+        snap = self.converter.snapshot()
+        cache = self._scaled
+        if cache is None or cache[0] is not snap:
+            exps = exponents(snap.codes)
+            cache = (snap, exps, scale_rates(snap.matrix, exps[:, None], exps[None, :]))
+            self._scaled = cache
+        return cache
+
+    def _minor_floats(self, amounts, codes) -> np.ndarray:
+        snap, exps, _ = self._scaled_matrix()
+        return np.asarray(amounts, dtype=np.float64) * 10.0 ** exps[snap.ids_of(codes)]
+
+    def representable(self, amounts, codes: Sequence[str]) -> np.ndarray:
+        """Masque des montants convertibles exactement en unités mineures (finis, < 2^53)."""
+        return np.abs(self._minor_floats(amounts, codes)) < _EXACT_FLOAT
+
+    def to_minor(self, amounts, codes: Sequence[str]) -> np.ndarray:
+        """Montants (float) → unités mineures int64 de leurs devises respectives."""
+        scaled = self._minor_floats(amounts, codes)
+        if not np.all(np.abs(scaled) < _EXACT_FLOAT):
+            raise OverflowError("amount too large to be represented exactly from a float")
+        return np.rint(scaled).astype(np.int64)
+
+    def scaled_rates(self, frms, tos, on=None) -> np.ndarray:
+        """Taux entiers par élément (-1 si absent)."""
+        snap, exps, matrix = self._scaled_matrix()
+        fi, ti = snap.ids_of(frms), snap.ids_of(tos)
+        if on is None:
+            return matrix[fi, ti]
+        _, rates = self.converter.convert_matrix(np.ones(len(fi)), frms, tos, on=on, snapshot=snap)
+        return scale_rates(rates, exps[fi], exps[ti])
+
+    def convert_minor(self, minor, frms: Sequence[str], tos: Sequence[str],
+                      on=None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Convertit un lot d'unités mineures.
+        Retour:
+            (résultats en unités mineures de la devise cible, taux entiers) —
+            taux -1 et résultat 0 pour les paires sans taux
+
+        Exception:
+            ValueError si devise inconnue, OverflowError si hors int64
+        """
+        rates = self.scaled_rates(frms, tos, on)
+        missing = rates < 0
+        results = multiply(minor, np.where(missing, 0, rates))
+        return np.where(missing, 0, results), rates
+
+    def convert(self, amount, frm: str, to: str, on=None) -> tuple[Decimal, Decimal]:
+        """
+        Conversion unitaire exacte : (résultat, taux) en Decimal.
+        Le taux retourné est celui de la table (jamais résultat / montant).
+
+        Exception:
+            ValueError si devise inconnue, RateNotFoundError si taux absent
+        """
+        minor = _decimal_to_minor(Decimal(str(amount)), frm)
+        _, rate = self.converter.convert(1.0, frm, to, on=on)  # lève si taux absent
+        e_frm, e_to = minor_unit_exponent(frm), minor_unit_exponent(to)
+        scaled = scale_rates([rate], [e_frm], [e_to])
+        result = multiply(np.array([minor], dtype=np.int64), scaled)[0]
+        return from_minor(result, to), Decimal(int(scaled[0])).scaleb(-(e_to - e_frm + RATE_DECIMALS))
+
+
+def _decimal_to_minor(amount: Decimal, code: str) -> int:
+    """Decimal → unités mineures (arrondi bancaire), sans passer par un float."""
+    minor = amount.scaleb(minor_unit_exponent(code)).to_integral_value(rounding="ROUND_HALF_EVEN")
+    if abs(minor) >= _LIMIT:
+        raise OverflowError("amount exceeds int64 minor units")
+    return int(minor)
@@ -0,0 +1,285 @@
+"""
+Module: history_store.py
+Responsabilité:
+    Historique des conversions en mémoire, sous forme colonnaire compacte
+
+Représentation:
+    - id / ts_epoch : int64 (ts_epoch = secondes du ts naïf, comme strftime('%s'))
+    - from_id / to_id : uint16, indices dans un dictionnaire de codes devise
+    - amount / result / rate : float64
+    → ~44 octets par ligne, contre plusieurs centaines pour un ConversionRecord
+      (dataclass + str + float Python)
+
+Design:
+    - Tableaux à capacité doublée : append() en O(1) amorti
+    - HistoryRow : vue légère (__slots__) sur une ligne, dépliable comme un
+      tuple (ts, from, to, amount, result, rate) ; le ts texte est recalculé
+    - snapshot() : copie O(1) (vues sur les lignes déjà écrites, jamais
+      modifiées) pour les lectures hors thread GUI (exports)
+    - Mêmes accès que le repository pour le graphique, les analyses et les
+      exports : rate_points(), iter_batches(), iter_rows(), count()
+"""
+
+from datetime import datetime, timedelta
+from typing import Iterable
+
+import numpy as np
+
+from currency_app.domain.models import ConversionRecord
+
+_EPOCH = datetime(1970, 1, 1)
+_NUMERIC = ("id", "ts_epoch", "amount", "result", "rate")
+_DTYPES = {"id": np.int64, "ts_epoch": np.int64, "from_id": np.uint16, "to_id": np.uint16,
+           "amount": np.float64, "result": np.float64, "rate": np.float64}
+
+
+def ts_to_epoch(ts: str) -> int:
+    """"YYYY-MM-DD HH:MM:SS" → secondes epoch naïves (même convention que strftime('%s'))."""
+    return int((datetime.fromisoformat(ts) - _EPOCH).total_seconds())
+
+
+def epoch_to_ts(epoch: int) -> str:
+    """Inverse de ts_to_epoch."""
+    return (_EPOCH + timedelta(seconds=int(epoch))).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _local_offset(naive: int) -> int:
+    """Décalage (s) de l'heure locale naïve `naive` par rapport à UTC."""
+    return naive - int((_EPOCH + timedelta(seconds=naive)).timestamp())
+
+
+def naive_epoch_to_ms(epochs: np.ndarray) -> np.ndarray:
+    """
+    ts_epoch (heure locale naïve lue comme UTC) → ms epoch réels,
+    identiques à datetime.fromisoformat(ts).timestamp() ligne à ligne.
+    Décalage local lu au début et à la fin de chaque jour distinct ; les jours
+    où il change (passage heure d'été / d'hiver) sont repris heure par heure.
+    """
+    if len(epochs) == 0:
+        return epochs.astype(np.float64)
+
+    days, inverse = np.unique(epochs // 86400, return_inverse=True)
+    first = np.array([_local_offset(d * 86400) for d in days.tolist()], dtype=np.int64)
+    last = np.array([_local_offset(d * 86400 + 86399) for d in days.tolist()], dtype=np.int64)
+    offsets = first[inverse]
+
+    straddle = (first != last)[inverse]  # lignes des jours de changement d'heure
+    if straddle.any():
+        hours, hour_inverse = np.unique(epochs[straddle] // 3600, return_inverse=True)
+        per_hour = np.array([_local_offset(h * 3600) for h in hours.tolist()], dtype=np.int64)
+        offsets[straddle] = per_hour[hour_inverse]
+    return (epochs - offsets).astype(np.float64) * 1000.0
+
+
+class HistoryRow:
+    """Vue sur une ligne d'un HistoryStore (aucune copie des valeurs)."""
+
+    __slots__ = ("_store", "_i")
+
+    def __init__(self, store, i):
+        self._store = store
+        self._i = i
+
+    @property
+    def id(self) -> int:
+        return int(self._store._cols["id"][self._i])
+
+    @property
+    def ts_epoch(self) -> int:
+        return int(self._store._cols["ts_epoch"][self._i])
+
+    @property
+    def ts(self) -> str:
+        return epoch_to_ts(self._store._cols["ts_epoch"][self._i])
+
+    @property
+    def from_cur(self) -> str:
+        return self._store.codes[self._store._cols["from_id"][self._i]]
+
+    @property
+    def to_cur(self) -> str:
+        return self._store.codes[self._store._cols["to_id"][self._i]]
+
+    @property
+    def amount(self) -> float:
+        return float(self._store._cols["amount"][self._i])
+
+    @property
+    def result(self) -> float:
+        return float(self._store._cols["result"][self._i])
+
+    @property
+    def rate(self) -> float:
+        return float(self._store._cols["rate"][self._i])
+
+    def __iter__(self):
+        # Dépliage comme une ligne de repository : (ts, from, to, amount, result, rate)
+        yield from (self.ts, self.from_cur, self.to_cur, self.amount, self.result, self.rate)
+
+    def as_record(self) -> ConversionRecord:
+        return ConversionRecord(*self)
+
+    def __repr__(self):
+        return f"HistoryRow({', '.join(map(repr, self))})"
+
+
+class HistoryStore:
+    """Historique colonnaire (ordre chronologique d'insertion)."""
+
+    def __init__(self, codes: Iterable[str] = (), capacity: int = 1024):
+        self.codes = list(codes)
+        self.ids = {c: i for i, c in enumerate(self.codes)}
+        self._n = 0
+        self._cols = {name: np.empty(capacity, dtype) for name, dtype in _DTYPES.items()}
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_columns(cls, id, ts_epoch, from_cur, to_cur, amount, result, rate) -> "HistoryStore":
+        """Construit depuis des colonnes (devises en tableaux de str), en bloc."""
+        codes, inverse = np.unique(np.concatenate([np.asarray(from_cur), np.asarray(to_cur)]),
+                                   return_inverse=True)
+        n = len(id)
+        store = cls([str(c) for c in codes], capacity=max(n, 1))
+        cols = store._cols
+        for name, values in (("id", id), ("ts_epoch", ts_epoch), ("amount", amount),
+                             ("result", result), ("rate", rate)):
+            cols[name][:n] = values
+        cols["from_id"][:n] = inverse[:n]
+        cols["to_id"][:n] = inverse[n:]
+        store._n = n
+        return store
+
+    def _id_of(self, code: str) -> int:
+        i = self.ids.get(code)
+        if i is None:
+            i = self.ids[code] = len(self.codes)
+            self.codes.append(code)
+        return i
+
+    def _reserve(self, n: int):
+        capacity = len(self._cols["id"])
+        if n <= capacity:
+            return
+        capacity = max(n, 2 * capacity)
+        for name, col in self._cols.items():
+            grown = np.empty(capacity, col.dtype)
+            grown[:self._n] = col[:self._n]
+            self._cols[name] = grown
+
+    def append(self, rec, row_id: int = -1) -> None:
+        """Ajoute un ConversionRecord (ou toute ligne ts/from_cur/to_cur/amount/result/rate)."""
+        self._reserve(self._n + 1)
+        i = self._n
+        cols = self._cols
+        cols["id"][i] = row_id
+        cols["ts_epoch"][i] = ts_to_epoch(rec.ts)
+        cols["from_id"][i] = self._id_of(rec.from_cur)
+        cols["to_id"][i] = self._id_of(rec.to_cur)
+        cols["amount"][i] = rec.amount
+        cols["result"][i] = rec.result
+        cols["rate"][i] = rec.rate
+        self._n = i + 1
+
+    def clear(self) -> None:
+        """Vide le store (nouveaux tableaux : les snapshots existants restent intacts)."""
+        self._n = 0
+        self._cols = {name: np.empty(1024, dtype) for name, dtype in _DTYPES.items()}
+
+    def snapshot(self) -> "HistoryStore":
+        """Vue figée des lignes actuelles (partage les tableaux, O(1))."""
+        snap = HistoryStore.__new__(HistoryStore)
+        snap.codes = list(self.codes)
+        snap.ids = dict(self.ids)
+        snap._n = self._n
+        snap._cols = {name: col[:self._n] for name, col in self._cols.items()}
+        return snap
+
+    # ------------------------------------------------------------------
+    # Accès
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self._n
+
+    def count(self) -> int:
+        return self._n
+
+    def __getitem__(self, i) -> HistoryRow:
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError(i)
+        return HistoryRow(self, i)
+
+    def __iter__(self):
+        for i in range(self._n):
+            yield HistoryRow(self, i)
+
+    def since(self, ts_epoch: int):
+        """Lignes de ts_epoch >= `ts_epoch` (le store est en ordre chronologique)."""
+        start = int(np.searchsorted(self._cols["ts_epoch"][:self._n], ts_epoch, side="left"))
+        for i in range(start, self._n):
+            yield HistoryRow(self, i)
+
+    def column(self, name: str) -> np.ndarray:
+        """Colonne en lecture (vue) ; from_cur / to_cur décodées en tableaux de str."""
+        if name in ("from_cur", "to_cur"):
+            codes = np.array(self.codes, dtype=object)
+            return codes[self._cols["from_id" if name == "from_cur" else "to_id"][:self._n]]
+        if name == "ts":
+            return np.array([epoch_to_ts(e) for e in self._cols["ts_epoch"][:self._n].tolist()], dtype=object)
+        view = self._cols[name][:self._n]
+        view.flags.writeable = False
+        return view
+
+    def mask(self, frm=None, to=None) -> np.ndarray:
+        """Masque booléen des lignes d'une paire (ou d'une seule devise)."""
+        mask = np.ones(self._n, dtype=bool)
+        for code, key in ((frm, "from_id"), (to, "to_id")):
+            if code is not None:
+                i = self.ids.get(code)
+                if i is None:
+                    return np.zeros(self._n, dtype=bool)
+                mask &= self._cols[key][:self._n] == i
+        return mask
+
+    def rate_points(self, frm=None, to=None) -> tuple[np.ndarray, np.ndarray]:
+        """Série (x en ms epoch réels, taux) pour le graphique et les analyses."""
+        epochs = self._cols["ts_epoch"][:self._n]
+        rates = self._cols["rate"][:self._n]
+        if frm is not None or to is not None:
+            mask = self.mask(frm, to)
+            epochs, rates = epochs[mask], rates[mask]
+        return naive_epoch_to_ms(epochs), rates.copy()
+
+    def iter_batches(self, batch_size: int = 1000, columns: str = "ts, from_cur, to_cur, amount, result, rate",
+                     newest_first: bool = False):
+        """Lots de tuples, même contrat que SQLiteRepository.iter_batches (exports)."""
+        names = [c.strip() for c in columns.split(",")]
+        for start in range(0, self._n, batch_size):
+            stop = min(start + batch_size, self._n)
+            if newest_first:
+                start, stop = self._n - stop, self._n - start
+            batch = list(zip(*(self._batch_column(name, start, stop) for name in names)))
+            yield batch[::-1] if newest_first else batch
+
+    def iter_rows(self, batch_size: int = 1000, newest_first: bool = False):
+        """Flux (ts, from_cur, to_cur, amount, result, rate), comme SQLiteRepository.iter_rows."""
+        for rows in self.iter_batches(batch_size, newest_first=newest_first):
+            yield from rows
+
+    def _batch_column(self, name, start, stop) -> list:
+        if name in _NUMERIC:
+            return self._cols[name][start:stop].tolist()
+        if name == "ts":
+            return [epoch_to_ts(e) for e in self._cols["ts_epoch"][start:stop].tolist()]
+        if name in ("from_cur", "to_cur"):
+            codes = self.codes
+            return [codes[i] for i in self._cols["from_id" if name == "from_cur" else "to_id"][start:stop].tolist()]
+        raise ValueError(f"unknown history column {name!r}")
+
+    @property
+    def nbytes(self) -> int:
+        """Mémoire des colonnes utilisées (hors capacité de réserve)."""
+        return sum(col[:self._n].nbytes for col in self._cols.values())
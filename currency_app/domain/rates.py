@@ -0,0 +1,152 @@
+"""
+Module: rates.py
+Responsabilité:
+    Table des taux de référence (jours × devises) sous forme de tableau NumPy.
+
+Design:
+    - Une ligne par jour calendaire depuis la première date du jeu de données
+    - Une colonne par devise (codes triés), taux exprimés contre la devise
+      de référence (EUR pour la BCE), NaN si absent
+    - Immuable : le tableau est en lecture seule, il peut être memory-mappé
+    - Les jours sans cotation (week-ends, fériés) peuvent être comblés par
+      colonne (dernier taux connu ou interpolation linéaire) ; les tables
+      comblées sont calculées une fois puis mises en cache
+"""
+
+from datetime import date, datetime
+from io import TextIOWrapper
+from typing import Iterable
+from zipfile import ZipFile
+
+import numpy as np
+from currency_converter import CURRENCY_FILE
+
+FALLBACKS = ("none", "last_known", "linear")
+
+
+class RateTable:
+    """Table dense et immuable des taux journaliers contre la devise de référence."""
+
+    def __init__(self, codes, first_ordinal: int, data: np.ndarray, ref: str = "EUR"):
+        self.codes = tuple(codes)
+        self.ids = {c: i for i, c in enumerate(self.codes)}
+        self.first_ordinal = int(first_ordinal)
+        self.ref = ref
+
+        if data.flags.writeable:
+            data.setflags(write=False)
+        self.data = data
+        self._filled = {"none": data}
+
+    @property
+    def first_date(self) -> date:
+        return date.fromordinal(self.first_ordinal)
+
+    @property
+    def last_date(self) -> date:
+        return date.fromordinal(self.first_ordinal + len(self.data) - 1)
+
+    def last_valid_index(self) -> np.ndarray:
+        """Index de la dernière ligne renseignée, par devise."""
+        valid = ~np.isnan(self.data)
+        return len(valid) - 1 - np.argmax(valid[::-1], axis=0)
+
+    def day_index(self, day) -> int:
+        """Décalage en jours de `day` (date, datetime ou "YYYY-MM-DD") ; peut sortir de la table."""
+        return _to_ordinal(day) - self.first_ordinal
+
+    def filled(self, fallback: str = "none") -> np.ndarray:
+        """
+        Tableau jours × devises où les jours manquants sont comblés :
+            - none       : NaN conservés
+            - last_known : dernier taux publié
+            - linear     : interpolation entre les deux cotations encadrantes
+        Hors de la plage cotée d'une devise (avant sa première ou après sa
+        dernière cotation), le taux reste NaN, comme dans CurrencyConverter.
+        """
+        cached = self._filled.get(fallback)
+        if cached is not None:
+            return cached
+        if fallback not in FALLBACKS:
+            raise ValueError(f"unknown fallback {fallback!r} (expected one of {', '.join(FALLBACKS)})")
+
+        data = np.asarray(self.data)
+        valid = ~np.isnan(data)
+        days = np.arange(len(data))
+        if fallback == "last_known":
+            last = np.maximum.accumulate(np.where(valid, days[:, None], -1), axis=0)
+            out = np.take_along_axis(data, np.maximum(last, 0), axis=0)
+            out[(last < 0) | (days[:, None] > self.last_valid_index())] = np.nan
+        else:
+            out = np.full_like(data, np.nan)
+            for k in range(data.shape[1]):
+                known = days[valid[:, k]]
+                if len(known):
+                    lo, hi = known[0], known[-1] + 1
+                    out[lo:hi, k] = np.interp(days[lo:hi], known, data[known, k])
+
+        out.setflags(write=False)
+        self._filled[fallback] = out
+        return out
+
+    # ------------------------------------------------------------------
+    # Chargement depuis le CSV BCE
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_ecb_file(cls, path=CURRENCY_FILE, ref: str = "EUR") -> "RateTable":
+        """Parse le fichier historique BCE (.zip ou .csv)."""
+        path = str(path)
+        if path.endswith(".zip"):
+            with ZipFile(path) as zf, zf.open(zf.namelist()[0]) as raw:
+                return cls.from_ecb_lines(TextIOWrapper(raw, encoding="utf-8"), ref)
+        with open(path, encoding="utf-8") as f:
+            return cls.from_ecb_lines(f, ref)
+
+    @classmethod
+    def from_ecb_lines(cls, lines: Iterable[str], ref: str = "EUR") -> "RateTable":
+        """
+        Construit la table à partir des lignes "Date,USD,JPY,..." de la BCE.
+        Les valeurs vides ou "N/A" deviennent NaN.
+        """
+        lines = iter(lines)
+        header = [c.strip() for c in next(lines).strip().split(",")[1:]]
+        cols = [k for k, c in enumerate(header) if c]
+
+        ordinals, rows = [], []
+        for line in lines:
+            cells = line.strip().split(",")
+            if not cells[0]:
+                continue
+            d = cells[0]
+            ordinals.append(date(int(d[:4]), int(d[5:7]), int(d[8:10])).toordinal())
+            values = cells[1:]
+            rows.append([_parse_rate(values[k]) if k < len(values) else np.nan for k in cols])
+
+        parsed = np.array(rows, dtype=np.float64).reshape(len(rows), len(cols))
+        ordinals = np.array(ordinals, dtype=np.int64)
+
+        codes = sorted({header[k] for k in cols} | {ref})
+        order = {c: i for i, c in enumerate(codes)}
+        first = int(ordinals.min())
+
+        data = np.full((int(ordinals.max()) - first + 1, len(codes)), np.nan)
+        for src, k in enumerate(cols):
+            data[ordinals - first, order[header[k]]] = parsed[:, src]
+        data[:, order[ref]] = 1.0
+
+        return cls(codes, first, data, ref)
+
+
+def _to_ordinal(day) -> int:
+    if isinstance(day, datetime):
+        return day.date().toordinal()
+    if isinstance(day, date):
+        return day.toordinal()
+    return date.fromisoformat(str(day)[:10]).toordinal()
+
+
+def _parse_rate(s: str) -> float:
+    try:
+        return float(s)
+    except ValueError:  # "N/A", vide
+        return np.nan
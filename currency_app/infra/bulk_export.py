@@ -0,0 +1,163 @@
+"""
+Module: bulk_export.py
+Responsabilité:
+    Export en masse de la table `conversions` pour l'analytique :
+    CSV et format binaire colonnaire compact (.ccol)
+
+Design:
+    - Lecture par lots de taille fixe via SQLiteRepository.iter_batches
+      (tuples bruts, aucun ConversionRecord créé) ; un HistoryStore expose
+      la même méthode et s'exporte directement depuis la mémoire
+    - Écriture en flux : mémoire bornée par la taille d'un lot
+    - Débit mesuré et retourné (lignes / seconde)
+
+Format .ccol (inspiré Arrow / Parquet):
+    MAGIC (8 o) | lots... | pied JSON | taille du pied u64 | MAGIC
+    lot = nb lignes u32 puis chaque colonne en tableau little-endian contigu
+          (int64 / float64, devises en codes uint16 d'un dictionnaire)
+    pied = schéma, dictionnaire des devises, nombre de lignes par lot
+"""
+
+import argparse
+import csv
+import json
+import logging
+import struct
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CCCOL01\x00"
+
+CSV_COLUMNS = ("id", "ts", "from_cur", "to_cur", "amount", "result", "rate")
+
+# (nom, type) — "dict" = code devise uint16 dans le dictionnaire du pied
+COLUMNAR_SCHEMA = (
+    ("id", "int64"),
+    ("ts_epoch", "int64"),
+    ("from_cur", "dict"),
+    ("to_cur", "dict"),
+    ("amount", "float64"),
+    ("result", "float64"),
+    ("rate", "float64"),
+)
+_DTYPES = {"int64": np.dtype("<i8"), "float64": np.dtype("<f8"), "dict": np.dtype("<u2")}
+
+
+@dataclass(frozen=True)
+class ExportStats:
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float("inf")
+
+
+def export_csv(repo, path, batch_size: int = 50_000) -> ExportStats:
+    """Écrit l'historique en CSV (en-tête + une ligne par conversion)."""
+    start, rows = time.perf_counter(), 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        for batch in repo.iter_batches(batch_size, ", ".join(CSV_COLUMNS)):
+            writer.writerows(batch)
+            rows += len(batch)
+    return _done("CSV", path, rows, start)
+
+
+def export_columnar(repo, path, batch_size: int = 50_000) -> ExportStats:
+    """Écrit l'historique au format colonnaire .ccol (un bloc par lot)."""
+    names = [name for name, _ in COLUMNAR_SCHEMA]
+    dictionary: dict[str, int] = {}
+    batch_rows = []
+
+    start = time.perf_counter()
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        for batch in repo.iter_batches(batch_size, ", ".join(names)):
+            f.write(struct.pack("<I", len(batch)))
+            for (name, kind), values in zip(COLUMNAR_SCHEMA, zip(*batch)):
+                if kind == "dict":
+                    values = [dictionary.setdefault(v, len(dictionary)) for v in values]
+                f.write(np.asarray(values, dtype=_DTYPES[kind]).tobytes())
+            batch_rows.append(len(batch))
+
+        footer = json.dumps({
+            "schema": [{"name": n, "type": k} for n, k in COLUMNAR_SCHEMA],
+            "dictionary": list(dictionary),
+            "batches": batch_rows,
+        }).encode("utf-8")
+        f.write(footer)
+        f.write(struct.pack("<Q", len(footer)))
+        f.write(MAGIC)
+    return _done("colonnaire", path, sum(batch_rows), start)
+
+
+def read_columnar(path) -> dict[str, np.ndarray]:
+    """Relit un fichier .ccol en colonnes NumPy (devises décodées en str)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:8] != MAGIC or data[-8:] != MAGIC:
+        raise ValueError(f"{path} n'est pas un fichier .ccol")
+
+    (footer_len,) = struct.unpack("<Q", data[-16:-8])
+    footer = json.loads(data[-16 - footer_len:-16])
+    schema = [(c["name"], c["type"]) for c in footer["schema"]]
+    dictionary = np.array(footer["dictionary"], dtype=object)
+
+    parts = {name: [] for name, _ in schema}
+    offset = len(MAGIC)
+    for n in footer["batches"]:
+        offset += 4  # nb lignes, déjà connu par le pied
+        for name, kind in schema:
+            dtype = _DTYPES[kind]
+            parts[name].append(np.frombuffer(data, dtype=dtype, count=n, offset=offset))
+            offset += n * dtype.itemsize
+
+    columns = {}
+    for name, kind in schema:
+        col = np.concatenate(parts[name]) if parts[name] else np.empty(0, _DTYPES[kind])
+        columns[name] = dictionary[col] if kind == "dict" else col
+    return columns
+
+
+def _done(label, path, rows, start) -> ExportStats:
+    stats = ExportStats(rows, time.perf_counter() - start)
+    logger.info("Export %s %s : %d lignes en %.2f s (%.0f lignes/s)",
+                label, path, stats.rows, stats.seconds, stats.rows_per_second)
+    return stats
+
+
+def main(argv=None) -> int:
+    from currency_app.infra.db import SQLiteRepository
+
+    parser = argparse.ArgumentParser(description="Export en masse de l'historique des conversions")
+    parser.add_argument("db", help="chemin de history.sqlite3")
+    parser.add_argument("out", help="fichier de sortie (.csv ou .ccol)")
+    parser.add_argument("--format", choices=("csv", "columnar"), default=None)
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    args = parser.parse_args(argv)
+
+    # SQLiteRepository créerait (et migrerait) une base vide : export « réussi » de 0 ligne
+    if not Path(args.db).is_file():
+        parser.error(f"base d'historique introuvable : {args.db}")
+
+    fmt = args.format or ("csv" if args.out.endswith(".csv") else "columnar")
+    repo = SQLiteRepository(args.db)
+    try:
+        export = export_csv if fmt == "csv" else export_columnar
+        stats = export(repo, args.out, args.batch_size)
+    finally:
+        repo.close()
+
+    print(f"{stats.rows} lignes en {stats.seconds:.2f} s — {stats.rows_per_second:,.0f} lignes/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
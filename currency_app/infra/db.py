@@ -7,11 +7,40 @@ Responsabilité:
 Design:
     - Isolé de l'UI
     - Appels simples (pas d'ORM volontairement pour la lisibilité)
+    - Mode write-behind optionnel : insert() dépose l'enregistrement dans une
+      file bornée, un thread écrivain la vide par lots (executemany + un seul
+      commit). Base en WAL, niveau `synchronous` configurable.
+    - Schéma versionné (PRAGMA user_version) : les migrations s'appliquent
+      en place à l'ouverture d'une base existante.
+    - Rétention : les lignes anciennes partent vers une HistoryArchive
+      (segments compressés) ; auto_vacuum INCREMENTAL + incremental_vacuum
+      par petits pas et ANALYZE borné, sur des connexions dédiées (jamais
+      la connexion partagée du thread GUI).
+    - Pool de lecture optionnel (read_pool_size > 0) : une connexion
+      d'écriture, N connexions WAL en lecture seule (ReadPool) ; exports,
+      analyses et chargements ne passent plus derrière le verrou des
+      insertions. busy_timeout configurable sur toutes les connexions.
 """
 
+import calendar
+import logging
+import queue
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
 from typing import Iterable
+
+import numpy as np
+from currency_app.core import metrics
+from currency_app.domain.history_store import HistoryStore, naive_epoch_to_ms
 from currency_app.domain.models import ConversionRecord
+from currency_app.infra.history_archive import SEGMENT_COLUMNS
+from currency_app.infra.read_pool import ReadPool
+
+logger = logging.getLogger(__name__)
 
 
 DDL = """
@@ -26,31 +55,447 @@ CREATE TABLE IF NOT EXISTS conversions (
 )
 """
 
+# Migrations : (version cible, instructions). user_version = dernière appliquée.
+# ts_epoch = secondes epoch du ts naïf, interprété comme strftime('%s')
+MIGRATIONS = [
+    (1, [
+        "ALTER TABLE conversions ADD COLUMN ts_epoch INTEGER",
+        "UPDATE conversions SET ts_epoch = CAST(strftime('%s', ts) AS INTEGER)",
+        "CREATE INDEX IF NOT EXISTS idx_conversions_pair_ts ON conversions (from_cur, to_cur, ts_epoch)",
+        "CREATE INDEX IF NOT EXISTS idx_conversions_ts ON conversions (ts_epoch)",
+    ]),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+INSERT_SQL = (
+    "INSERT INTO conversions (ts, from_cur, to_cur, amount, result, rate, ts_epoch) "
+    "VALUES (?1,?2,?3,?4,?5,?6, CAST(strftime('%s', ?1) AS INTEGER))"
+)
+RECORD_COLUMNS = "ts, from_cur, to_cur, amount, result, rate"
+
+# Compromis durabilité / débit (PRAGMA synchronous)
+SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# Lecture en bloc vers HistoryStore (codes devise ≤ 8 caractères)
+_STORE_DTYPE = np.dtype([("id", np.int64), ("ts_epoch", np.int64), ("from_cur", "U8"), ("to_cur", "U8"),
+                         ("amount", np.float64), ("result", np.float64), ("rate", np.float64)])
+
+_STOP = object()
+
 
 class SQLiteRepository:
     """Repository SQLite basique (CRUD minimal)."""
 
-    def __init__(self, db_path):
-        self.conn = sqlite3.connect(db_path)
+    def __init__(self, db_path, write_behind=False, batch_size=256, flush_interval=0.5,
+                 synchronous="NORMAL", queue_size=10_000, read_pool_size=0, busy_timeout=5.0):
+        if synchronous.upper() not in SYNCHRONOUS_LEVELS:
+            raise ValueError(f"synchronous must be one of {SYNCHRONOUS_LEVELS}")
+
+        self.db_path = db_path
+        self.synchronous = synchronous.upper()
+        self.busy_timeout = busy_timeout  # secondes d'attente sur une base verrouillée
+
+        # Connexion partagée GUI / worker de conversion, sérialisée par un verrou
+        self.conn = self._connect()
+        self.lock = threading.Lock()
         self.conn.execute(DDL)
         self.conn.commit()
+        self.migrate()
+
+        # Write-behind : file bornée + thread écrivain dédié
+        self.write_behind = write_behind
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = None
+        self._writer = None
+        if write_behind:
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._writer = threading.Thread(target=self._writer_loop, name="sqlite-writer", daemon=True)
+            self._writer.start()
 
+        # Lecteurs : ouverts après DDL / migrations (mode=ro exige la base et le WAL)
+        self.read_pool = ReadPool(db_path, read_pool_size, busy_timeout) if read_pool_size > 0 else None
+
+    def migrate(self) -> int:
+        """
+        Applique les migrations manquantes, chacune dans sa transaction
+        (DDL et PRAGMA user_version compris) : une migration interrompue
+        est annulée en entier et rejouée à l'ouverture suivante.
+        """
+        with self.lock:
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            for target, statements in MIGRATIONS:
+                if target <= version:
+                    continue
+                logger.info("Migration du schéma d'historique v%d → v%d", version, target)
+                with self.conn:
+                    # BEGIN explicite : sqlite3 n'ouvre pas de transaction avant un DDL
+                    self.conn.execute("BEGIN IMMEDIATE")
+                    for sql in statements:
+                        self.conn.execute(sql)
+                    self.conn.execute(f"PRAGMA user_version={target}")
+                version = target
+        return version
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        return conn
+
+    # ------------------------------------------------------------------
+    # Écriture
+    # ------------------------------------------------------------------
     def insert(self, rec: ConversionRecord) -> None:
-        """Insère un enregistrement dans l'historique."""
-        self.conn.execute(
-            "INSERT INTO conversions (ts, from_cur, to_cur, amount, result, rate) VALUES (?,?,?,?,?,?)",
-            (rec.ts, rec.from_cur, rec.to_cur, rec.amount, rec.result, rec.rate),
-        )
-        self.conn.commit()
+        """Insère un enregistrement dans l'historique (mis en file en write-behind)."""
+        row = (rec.ts, rec.from_cur, rec.to_cur, rec.amount, rec.result, rec.rate)
+        metrics.counter("db.insert").inc()
+        if self._queue is not None:
+            self._queue.put(row)  # bloque si la file est pleine (back-pressure)
+            return
+
+        with metrics.timer("db.write_batch"), self.lock:
+            self.conn.execute(INSERT_SQL, row)
+            self.conn.commit()
+
+    @metrics.timed("db.flush")
+    def flush(self) -> None:
+        """Attend que toutes les lignes en file soient commitées."""
+        if self._queue is None or self._writer is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self) -> None:
+        """Vide la file, arrête l'écrivain et ferme les connexions."""
+        if self._writer is not None:
+            self._queue.put(_STOP)
+            self._writer.join()
+            self._writer = None
+        if self.read_pool is not None:
+            self.read_pool.close()
+        with self.lock:
+            self.conn.close()
+
+    def _writer_loop(self):
+        """Regroupe les lignes par lots : un executemany + un commit par lot."""
+        conn = self._connect()
+        stop = False
+        while not stop:
+            batch, waiters = [], []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+
+            while True:
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+
+            if batch:
+                try:
+                    with metrics.timer("db.write_batch"):
+                        conn.executemany(INSERT_SQL, batch)
+                        conn.commit()
+                    metrics.histogram("db.batch_rows", unit="rows").observe(len(batch))
+                except sqlite3.Error:
+                    logger.exception("Écriture de %d lignes d'historique échouée", len(batch))
+                    conn.rollback()
+            for w in waiters:
+                w.set()
+        conn.close()
+
+    # ------------------------------------------------------------------
+    # Lecture / maintenance
+    # ------------------------------------------------------------------
+    @contextmanager
+    def _reading(self):
+        """Curseur de lecture : pool en lecture seule si actif, sinon connexion partagée."""
+        if self.read_pool is not None:
+            with self.read_pool.cursor() as cur:
+                yield cur
+            return
+        with self.lock:
+            cur = self.conn.cursor()
+            try:
+                yield cur
+            finally:
+                cur.close()
 
     def fetch_all(self) -> Iterable[ConversionRecord]:
         """Retourne l'historique complet."""
-        cur = self.conn.cursor()
-        cur.execute("SELECT ts, from_cur, to_cur, amount, result, rate FROM conversions ORDER BY ts ASC")
-        for ts, f, t, a, r, rate in cur.fetchall():
+        self.flush()
+        with metrics.timer("db.fetch_all"), self._reading() as cur:
+            cur.execute(f"SELECT {RECORD_COLUMNS} FROM conversions ORDER BY ts_epoch ASC, id ASC")
+            rows = cur.fetchall()
+        for ts, f, t, a, r, rate in rows:
             yield ConversionRecord(ts, f, t, a, r, rate)
 
-    def clear(self) -> None:
-        """Supprime tout l'historique."""
-        self.conn.execute("DELETE FROM conversions")
-        self.conn.commit()
+    def iter_batches(self, batch_size: int = 1000, columns: str = RECORD_COLUMNS,
+                     table_order: bool = False) -> Iterable[list[tuple]]:
+        """
+        Flux de tout l'historique, ordre chronologique (ou ordre d'insertion,
+        comme le tableau : table_order), par lots de `batch_size`
+        tuples bruts (aucun ConversionRecord n'est créé).
+        Utilise une connexion en lecture seule (du pool, ou dédiée) : appelable
+        depuis un worker sans bloquer les insertions.
+        """
+        self.flush()
+        order = "id ASC" if table_order else "ts_epoch ASC, id ASC"
+        sql = f"SELECT {columns} FROM conversions ORDER BY {order}"
+        if self.read_pool is not None:
+            with self.read_pool.cursor() as cur:
+                cur.execute(sql)
+                while rows := cur.fetchmany(batch_size):
+                    yield rows
+            return
+
+        conn = sqlite3.connect(Path(self.db_path).resolve().as_uri() + "?mode=ro", uri=True,
+                               timeout=self.busy_timeout)
+        try:
+            cur = conn.execute(sql)
+            while rows := cur.fetchmany(batch_size):
+                yield rows
+        finally:
+            conn.close()
+
+    def iter_rows(self, batch_size: int = 1000, table_order: bool = False) -> Iterable[tuple]:
+        """Flux ligne à ligne (ts, from_cur, to_cur, amount, result, rate), lu par lots."""
+        for rows in self.iter_batches(batch_size, table_order=table_order):
+            yield from rows
+
+    def max_id(self) -> int:
+        """Plus grand id de l'historique (0 si vide) — une descente de B-tree, pas de parcours."""
+        self.flush()
+        with self._reading() as cur:
+            return cur.execute("SELECT MAX(id) FROM conversions").fetchone()[0] or 0
+
+    @metrics.timed("db.fetch_page")
+    def fetch_page(self, after_id: int, limit: int, max_id: int | None = None) -> list[tuple]:
+        """
+        Page de l'historique, du plus ancien au plus récent (pagination par clé).
+        Retour:
+            lignes (id, ts, from_cur, to_cur, amount, result, rate) avec
+            after_id < id ≤ max_id
+        """
+        with self._reading() as cur:
+            return cur.execute(
+                "SELECT id, ts, from_cur, to_cur, amount, result, rate FROM conversions "
+                "WHERE id > ? AND id <= ? ORDER BY id ASC LIMIT ?",
+                (after_id, max_id if max_id is not None else 2 ** 63 - 1, limit),
+            ).fetchall()
+
+    @metrics.timed("db.fetch_rate_points")
+    def fetch_rate_points(self, frm=None, to=None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Série (x, taux) de l'historique (tout, ou une paire) pour le graphique,
+        en tableaux NumPy.
+        x = ms epoch réels (ts lu en heure locale, comme QDateTime.fromString).
+        """
+        self.flush()
+        where, params = self._where(frm, to)
+        with self._reading() as cur:
+            cur.execute(
+                f"SELECT ts_epoch, rate FROM conversions{where} ORDER BY ts_epoch ASC, id ASC", params
+            )
+            points = np.fromiter(cur, dtype=[("ts", np.int64), ("rate", np.float64)])
+        return naive_epoch_to_ms(points["ts"]), points["rate"]
+
+    # ------------------------------------------------------------------
+    # Requêtes par paire / plage de temps (index (from_cur, to_cur, ts_epoch))
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _where(frm=None, to=None, start=None, end=None) -> tuple[str, list]:
+        """Clause WHERE ; start inclus, end exclu (datetime ou epoch en secondes)."""
+        clauses, params = [], []
+        for column, value in (("from_cur", frm), ("to_cur", to)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if start is not None:
+            clauses.append("ts_epoch >= ?")
+            params.append(_epoch(start))
+        if end is not None:
+            clauses.append("ts_epoch < ?")
+            params.append(_epoch(end))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    @metrics.timed("db.fetch_store")
+    def fetch_store(self, frm=None, to=None, start=None, end=None) -> HistoryStore:
+        """
+        Historique (filtré) chargé en bloc dans un HistoryStore colonnaire,
+        par ordre chronologique : aucun objet Python par ligne.
+        """
+        where, params = self._where(frm, to, start, end)
+        self.flush()
+        with self._reading() as cur:
+            cur.execute(
+                f"SELECT id, ts_epoch, from_cur, to_cur, amount, result, rate FROM conversions{where} "
+                "ORDER BY ts_epoch ASC, id ASC", params
+            )
+            rows = np.fromiter(cur, dtype=_STORE_DTYPE)
+        return HistoryStore.from_columns(*(rows[name] for name in _STORE_DTYPE.names))
+
+    @metrics.timed("db.fetch_range")
+    def fetch_range(self, frm=None, to=None, start=None, end=None) -> list[ConversionRecord]:
+        """Conversions d'une paire et/ou d'une plage de temps, par ordre chronologique."""
+        where, params = self._where(frm, to, start, end)
+        self.flush()
+        with self._reading() as cur:
+            rows = cur.execute(
+                f"SELECT {RECORD_COLUMNS} FROM conversions{where} ORDER BY ts_epoch ASC, id ASC", params
+            ).fetchall()
+        return [ConversionRecord(*row) for row in rows]
+
+    def count(self, frm=None, to=None, start=None, end=None) -> int:
+        """Nombre de conversions correspondant aux filtres."""
+        where, params = self._where(frm, to, start, end)
+        self.flush()
+        with self._reading() as cur:
+            return cur.execute(f"SELECT COUNT(*) FROM conversions{where}", params).fetchone()[0]
+
+    def latest(self, n: int, frm=None, to=None) -> list[ConversionRecord]:
+        """Les n conversions les plus récentes (la plus récente en premier)."""
+        where, params = self._where(frm, to)
+        self.flush()
+        with self._reading() as cur:
+            rows = cur.execute(
+                f"SELECT {RECORD_COLUMNS} FROM conversions{where} ORDER BY ts_epoch DESC, id DESC LIMIT ?",
+                [*params, n],
+            ).fetchall()
+        return [ConversionRecord(*row) for row in rows]
+
+    def clear(self, archive=None) -> None:
+        """
+        Supprime tout l'historique (et rend les pages libérées si auto_vacuum
+        incrémental) ; avec `archive` (HistoryArchive), ses segments aussi.
+        """
+        self.flush()
+        with self.lock:
+            self.conn.execute("DELETE FROM conversions")
+            self.conn.commit()
+            self.conn.executescript("PRAGMA incremental_vacuum; PRAGMA wal_checkpoint(TRUNCATE);")
+        # Après la suppression : une passe d'archivage concurrente a fini sa transaction
+        if archive is not None:
+            archive.purge()
+
+    # ------------------------------------------------------------------
+    # Rétention / compaction (appelées hors thread GUI, connexions dédiées)
+    # ------------------------------------------------------------------
+    @metrics.timed("db.archive")
+    def archive_older_than(self, cutoff, archive, batch_size: int = 50_000) -> int:
+        """
+        Déplace vers `archive` (HistoryArchive) les lignes avec ts < cutoff
+        (datetime ou epoch en secondes), par segments de `batch_size` lignes.
+
+        Chaque lot : sélection, écriture du segment (fsync) puis suppression,
+        dans une même transaction d'écriture. Si une passe a été interrompue
+        après l'écriture d'un segment, sa suppression est rejouée d'abord.
+        Retour:
+            nombre de lignes archivées
+        """
+        self.flush()
+        cutoff = _epoch(cutoff)
+        conn = self._connect()
+        moved = 0
+        try:
+            last = archive.last_header()
+            if last is not None and last.get("cutoff") is not None:
+                with conn:
+                    conn.execute("DELETE FROM conversions WHERE id <= ? AND ts_epoch < ?",
+                                 (last["max_id"], last["cutoff"]))
+
+            while True:
+                with conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    rows = conn.execute(
+                        f"SELECT {SEGMENT_COLUMNS} FROM conversions WHERE ts_epoch < ? ORDER BY id LIMIT ?",
+                        (cutoff, batch_size),
+                    ).fetchall()
+                    if not rows:
+                        break
+                    archive.append(rows, cutoff)
+                    # Même ensemble que le SELECT : les nouvelles lignes ont un id plus grand
+                    conn.execute("DELETE FROM conversions WHERE id <= ? AND ts_epoch < ?",
+                                 (rows[-1][0], cutoff))
+                moved += len(rows)
+                metrics.counter("db.archived_rows").inc(len(rows))
+        finally:
+            conn.close()
+        if moved:
+            logger.info("%d lignes d'historique archivées dans %s", moved, archive.directory)
+        return moved
+
+    def incremental_vacuum_enabled(self) -> bool:
+        """True si la base est en auto_vacuum=INCREMENTAL."""
+        # Connexion neuve : le mode est lu à l'ouverture, une connexion existante
+        # ne voit pas la conversion faite par une autre
+        conn = self._connect()
+        try:
+            return conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        finally:
+            conn.close()
+
+    def enable_incremental_vacuum(self) -> bool:
+        """
+        Passe la base en auto_vacuum=INCREMENTAL (exige un VACUUM complet,
+        fait une seule fois). Retourne True si la conversion a eu lieu.
+        """
+        if self.incremental_vacuum_enabled():
+            return False
+        conn = self._connect()
+        try:
+            logger.info("Activation de l'auto_vacuum incrémental (VACUUM complet)")
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("VACUUM")
+            return True
+        finally:
+            conn.close()
+
+    @metrics.timed("db.vacuum_step")
+    def vacuum_step(self, max_pages: int = 1024) -> int:
+        """Rend au système jusqu'à `max_pages` pages libres ; retourne les pages libres restantes."""
+        conn = self._connect()
+        try:
+            # executescript : exécution jusqu'au bout (un execute() ne libère qu'une page)
+            conn.executescript(f"PRAGMA incremental_vacuum({int(max_pages)});")
+            free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if not free:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+            return free
+        finally:
+            conn.close()
+
+    @metrics.timed("db.analyze")
+    def analyze(self, analysis_limit: int = 1000) -> None:
+        """Met à jour les statistiques du planificateur (ANALYZE échantillonné)."""
+        conn = self._connect()
+        try:
+            conn.execute(f"PRAGMA analysis_limit={int(analysis_limit)}")
+            conn.execute("ANALYZE")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def file_size(self) -> int:
+        """Taille sur disque de la base (fichier principal + WAL)."""
+        path = Path(self.db_path)
+        wal = path.with_name(path.name + "-wal")
+        return sum(p.stat().st_size for p in (path, wal) if p.exists())
+
+
+def _epoch(value) -> int:
+    """datetime naïf → secondes epoch (même convention que strftime('%s'))."""
+    if isinstance(value, datetime):
+        return calendar.timegm(value.timetuple())
+    return int(value)
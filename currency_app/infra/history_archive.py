@@ -0,0 +1,231 @@
+"""
+Module: history_archive.py
+Responsabilité:
+    Archive de l'historique : segments compressés, en ajout seul, interrogeables
+
+Design:
+    - Un segment par passe d'archivage, jamais réécrit (nommé par plage d'id)
+    - Colonnes compressées (zlib) : ts_epoch / id int64, devises en codes
+      uint16 d'un dictionnaire, montants float64 ; le ts texte est recalculé
+      depuis ts_epoch (même convention naïve que strftime('%s'))
+    - En-tête JSON en clair (plage de ts, plage d'id, paires présentes) :
+      une requête écarte les segments hors filtre sans les décompresser
+    - Écriture atomique (fichier temporaire + fsync + rename)
+    - purge() efface tous les segments (effacement de l'historique)
+
+Format .ccz:
+    MAGIC (8 o) | taille en-tête u32 | en-tête JSON | colonnes zlib concaténées
+"""
+
+import argparse
+import csv
+import json
+import os
+import struct
+import sys
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+from currency_app.domain.history_store import HistoryStore, epoch_to_ts, ts_to_epoch
+from currency_app.domain.models import ConversionRecord
+
+MAGIC = b"CCSEG01\x00"
+SUFFIX = ".ccz"
+_PREFIX = struct.Struct("<8sI")
+
+# (nom, type) — "dict" = code devise uint16 dans le dictionnaire de l'en-tête
+SEGMENT_SCHEMA = (
+    ("id", "int64"),
+    ("ts_epoch", "int64"),
+    ("from_cur", "dict"),
+    ("to_cur", "dict"),
+    ("amount", "float64"),
+    ("result", "float64"),
+    ("rate", "float64"),
+)
+SEGMENT_COLUMNS = ", ".join(name for name, _ in SEGMENT_SCHEMA)
+_DTYPES = {"int64": np.dtype("<i8"), "float64": np.dtype("<f8"), "dict": np.dtype("<u2")}
+
+
+class HistoryArchive:
+    """Dossier de segments d'historique archivés."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self._headers = {}  # chemin → en-tête (segments immuables : cache sans invalidation)
+
+    # ------------------------------------------------------------------
+    # Écriture
+    # ------------------------------------------------------------------
+    def append(self, rows: list[tuple], cutoff: int | None = None) -> Path | None:
+        """
+        Écrit un segment à partir de lignes (SEGMENT_COLUMNS, triées par id).
+        `cutoff` (ts_epoch exclu de la passe) est gardé dans l'en-tête : il
+        permet de rejouer la suppression si la passe a été interrompue.
+        Retour:
+            chemin du segment, ou None si aucune ligne
+        """
+        if not rows:
+            return None
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        columns = list(zip(*rows))
+        dictionary: dict[str, int] = {}
+        blocks, layout = [], []
+        for (name, kind), values in zip(SEGMENT_SCHEMA, columns):
+            if kind == "dict":
+                values = [dictionary.setdefault(v, len(dictionary)) for v in values]
+            block = zlib.compress(np.asarray(values, dtype=_DTYPES[kind]).tobytes(), 6)
+            layout.append({"name": name, "type": kind, "size": len(block)})
+            blocks.append(block)
+
+        ids, epochs = columns[0], columns[1]
+        codes = list(dictionary)
+        header = json.dumps({
+            "rows": len(rows),
+            "min_id": min(ids), "max_id": max(ids),
+            "min_ts": min(epochs), "max_ts": max(epochs),
+            "cutoff": cutoff,
+            "dictionary": codes,
+            "pairs": sorted({f"{f}/{t}" for f, t in zip(columns[2], columns[3])}),
+            "columns": layout,
+        }).encode("utf-8")
+
+        path = self.directory / f"conversions-{min(ids):012d}-{max(ids):012d}{SUFFIX}"
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(_PREFIX.pack(MAGIC, len(header)))
+            f.write(header)
+            for block in blocks:
+                f.write(block)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        return path
+
+    def purge(self) -> int:
+        """Supprime tous les segments (et fichiers temporaires) ; retourne le nombre de segments."""
+        if not self.directory.is_dir():
+            return 0
+        removed = 0
+        for path in self.directory.glob(f"*{SUFFIX}*"):
+            removed += path.suffix == SUFFIX
+            path.unlink(missing_ok=True)
+        self._headers.clear()
+        return removed
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+    def segments(self) -> list[Path]:
+        """Segments par ordre d'id (le nom encode la plage)."""
+        if not self.directory.is_dir():
+            return []
+        return sorted(self.directory.glob(f"*{SUFFIX}"))
+
+    def header(self, path) -> dict:
+        path = Path(path)
+        cached = self._headers.get(path)
+        if cached is None:
+            with open(path, "rb") as f:
+                magic, header_len = _PREFIX.unpack(f.read(_PREFIX.size))
+                if magic != MAGIC:
+                    raise ValueError(f"{path} n'est pas un segment d'archive")
+                cached = json.loads(f.read(header_len))
+            cached["data_offset"] = _PREFIX.size + header_len
+            self._headers[path] = cached
+        return cached
+
+    def last_header(self) -> dict | None:
+        """En-tête du segment le plus récent (None si archive vide)."""
+        segments = self.segments()
+        return self.header(segments[-1]) if segments else None
+
+    def count(self) -> int:
+        return sum(self.header(p)["rows"] for p in self.segments())
+
+    def query(self, frm=None, to=None, start=None, end=None) -> dict[str, np.ndarray]:
+        """
+        Colonnes NumPy des lignes archivées filtrées (start inclus, end exclu,
+        en secondes epoch naïves), par ordre d'id ; devises décodées en str.
+        """
+        parts = {name: [] for name, _ in SEGMENT_SCHEMA}
+        for path in self.segments():
+            h = self.header(path)
+            if (start is not None and h["max_ts"] < start) or (end is not None and h["min_ts"] >= end):
+                continue
+            if (frm is not None or to is not None) and not any(
+                    (frm is None or f == frm) and (to is None or t == to)
+                    for f, t in (p.split("/") for p in h["pairs"])):
+                continue
+
+            columns = self._read(path, h)
+            mask = np.ones(h["rows"], dtype=bool)
+            if start is not None:
+                mask &= columns["ts_epoch"] >= start
+            if end is not None:
+                mask &= columns["ts_epoch"] < end
+            for name, value in (("from_cur", frm), ("to_cur", to)):
+                if value is not None:
+                    mask &= columns[name] == value
+            for name in parts:
+                parts[name].append(columns[name][mask])
+
+        return {
+            name: np.concatenate(parts[name]) if parts[name]
+            else np.empty(0, object if kind == "dict" else _DTYPES[kind])
+            for name, kind in SEGMENT_SCHEMA
+        }
+
+    def records(self, frm=None, to=None, start=None, end=None) -> list[ConversionRecord]:
+        """Lignes archivées en ConversionRecord (ts texte recalculé)."""
+        c = self.query(frm, to, start, end)
+        return [
+            ConversionRecord(epoch_to_ts(ts), f, t, a, r, rate)
+            for ts, f, t, a, r, rate in zip(c["ts_epoch"].tolist(), c["from_cur"], c["to_cur"],
+                                            c["amount"].tolist(), c["result"].tolist(), c["rate"].tolist())
+        ]
+
+    def store(self, frm=None, to=None, start=None, end=None) -> HistoryStore:
+        """Lignes archivées en HistoryStore colonnaire (graphique, analyses, exports)."""
+        c = self.query(frm, to, start, end)
+        return HistoryStore.from_columns(*(c[name] for name, _ in SEGMENT_SCHEMA))
+
+    def _read(self, path, h) -> dict[str, np.ndarray]:
+        with open(path, "rb") as f:
+            f.seek(h["data_offset"])
+            data = f.read()
+        dictionary = np.array(h["dictionary"], dtype=object)
+        columns, offset = {}, 0
+        for col in h["columns"]:
+            raw = zlib.decompress(data[offset:offset + col["size"]])
+            offset += col["size"]
+            values = np.frombuffer(raw, dtype=_DTYPES[col["type"]])
+            columns[col["name"]] = dictionary[values] if col["type"] == "dict" else values
+        return columns
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Interroge l'archive de l'historique (CSV sur stdout)")
+    parser.add_argument("directory", help="dossier des segments .ccz")
+    parser.add_argument("--from", dest="frm", default=None)
+    parser.add_argument("--to", default=None)
+    parser.add_argument("--start", default=None, help="YYYY-MM-DD[ HH:MM:SS] inclus")
+    parser.add_argument("--end", default=None, help="YYYY-MM-DD[ HH:MM:SS] exclu")
+    args = parser.parse_args(argv)
+
+    def epoch(text):
+        return None if text is None else ts_to_epoch(text)
+
+    archive = HistoryArchive(args.directory)
+    writer = csv.writer(sys.stdout, lineterminator="\n")
+    writer.writerow(("ts", "from_cur", "to_cur", "amount", "result", "rate"))
+    for rec in archive.records(args.frm, args.to, epoch(args.start), epoch(args.end)):
+        writer.writerow((rec.ts, rec.from_cur, rec.to_cur, rec.amount, rec.result, rec.rate))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,43 +2,102 @@
 Module: pdf_exporter.py
 Responsabilité:
     Exporter le tableau d'historique en PDF
+
+Design:
+    - Les lignes sont consommées en flux (itérable), jamais matérialisées
+    - Mise en page (hauteur de page, hauteur de ligne, colonnes) calculée une
+      fois et mise en cache par résolution / police
+    - Progression (toutes les PROGRESS_EVERY lignes) et annulation (à chaque
+      page) via callbacks : utilisable depuis un worker (QPainter sur QPrinter
+      est autorisé hors thread GUI)
 """
 
-from PySide6.QtGui import QPageSize, QPainter
+from functools import lru_cache
+from typing import Callable, Iterable
+
+from PySide6.QtGui import QFontMetrics, QPageSize, QPainter
 from PySide6.QtPrintSupport import QPrinter
 
-def export_table_to_pdf(path, title, headers, rows):
-    """Exporte un tableau en PDF avec pagination"""
+from currency_app.core import metrics
+
+# Colonnes en fraction de la largeur utile (Date, De, Vers, Montant, Résultat, Taux)
+COLUMNS = (0.0, 0.30, 0.42, 0.54, 0.70, 0.86)
+PROGRESS_EVERY = 1000
+
+_line_spacing_cache = {}
+
+
+def _line_spacing(painter: QPainter, printer: QPrinter) -> int:
+    """Interligne de la police courante pour cette résolution (mis en cache)."""
+    key = (painter.font().key(), printer.resolution())
+    if key not in _line_spacing_cache:
+        _line_spacing_cache[key] = QFontMetrics(painter.font(), printer).lineSpacing()
+    return _line_spacing_cache[key]
+
 
+@lru_cache(maxsize=8)
+def _layout(page_width: int, page_height: int, line_h: int):
+    """(marge, x des colonnes, y max avant saut de page) pour une page donnée."""
+    margin = page_width // 20
+    usable = page_width - 2 * margin
+    xs = tuple(margin + int(f * usable) for f in COLUMNS)
+    return margin, xs, page_height - margin - line_h
+
+
+@metrics.timed("pdf.export")
+def export_rows_to_pdf(path, title, headers, rows: Iterable,
+                       progress: Callable[[int], None] | None = None,
+                       is_cancelled: Callable[[], bool] | None = None) -> bool:
+    """
+    Exporte des lignes (itérable, consommé en flux) en PDF avec pagination.
+    Retour:
+        False si l'export a été annulé
+    """
     printer = QPrinter(QPrinter.HighResolution)
-    printer.setOutputFileName(path)
+    printer.setOutputFileName(str(path))
     printer.setPageSize(QPageSize(QPageSize.A4))
     printer.setOutputFormat(QPrinter.PdfFormat)
 
     painter = QPainter()
+    done = 0
     try:
         painter.begin(printer)
-        margin, y = 40, 40
+        page = printer.pageRect(QPrinter.DevicePixel)
+        line_h = _line_spacing(painter, printer)
+        margin, xs, y_max = _layout(int(page.width()), int(page.height()), line_h)
 
-        painter.setFont(QPainter().font())
+        y = margin + line_h
         painter.drawText(margin, y, title)
-        y += 30
+        y += 2 * line_h
 
         # Header row
-        x = [margin, 180, 250, 330, 420, 500]
-        for px, h in zip(x, headers):
+        for px, h in zip(xs, headers):
             painter.drawText(px, y, h)
-        y += 20
-
-        page_height = printer.pageRect(QPrinter.DevicePixel).height()
+        y += int(line_h * 1.5)
 
         for row in rows:
-            if y > page_height - margin:
+            if y > y_max:
+                if is_cancelled is not None and is_cancelled():
+                    return False
                 printer.newPage()
-                y = margin
+                y = margin + line_h
 
-            for px, v in zip(x, row):
+            for px, v in zip(xs, row):
                 painter.drawText(px, y, str(v))
-            y += 18
+            y += line_h
+
+            done += 1
+            if done % PROGRESS_EVERY == 0 and progress is not None:
+                progress(done)
     finally:
         painter.end()
+        metrics.counter("pdf.rows").inc(done)
+
+    if progress is not None:
+        progress(done)
+    return True
+
+
+def export_table_to_pdf(path, title, headers, rows):
+    """Exporte un tableau en PDF avec pagination"""
+    export_rows_to_pdf(path, title, headers, rows)
@@ -0,0 +1,144 @@
+"""
+Module: rate_snapshot.py
+Responsabilité:
+    Snapshot binaire compilé de la table des taux (jours × devises).
+
+Design:
+    - Premier lancement : parse du CSV BCE puis écriture du snapshot
+    - Lancements suivants : vérification de l'en-tête puis memory-map du tableau
+    - Invalidation automatique si le fichier source change (taille, mtime)
+    - Tables rafraîchies à chaud écrites sous la même empreinte dans un fichier
+      versionné `<snapshot>.<n>` (save_rate_table) : jamais de rename par-dessus
+      le snapshot memory-mappé par la table en service (refusé sous Windows) ;
+      le chargement prend la version valide la plus récente, un redémarrage
+      repart des derniers taux reçus
+
+Format:
+    MAGIC (8 o) | version u32 | taille en-tête u32 | en-tête JSON | padding 64 o
+    | tableau float64 little-endian (n_jours × n_devises, ordre C)
+"""
+
+import json
+import logging
+import os
+import struct
+import time
+from pathlib import Path
+
+import numpy as np
+from currency_converter import CURRENCY_FILE
+
+from currency_app.domain.rates import RateTable
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CCRATES\x00"
+FORMAT_VERSION = 1
+_PREFIX = struct.Struct("<8sII")
+_ALIGN = 64
+
+
+def source_fingerprint(source=CURRENCY_FILE) -> dict:
+    """Empreinte bon marché du jeu de données source."""
+    st = os.stat(source)
+    return {"path": os.path.realpath(source), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def write_snapshot(path, table: RateTable, fingerprint: dict) -> None:
+    """Écrit le snapshot de façon atomique (fichier temporaire + rename)."""
+    path = Path(path)
+    header = json.dumps({
+        "source": fingerprint,
+        "ref": table.ref,
+        "codes": list(table.codes),
+        "first_ordinal": table.first_ordinal,
+        "n_days": len(table.data),
+    }).encode("utf-8")
+
+    offset = _PREFIX.size + len(header)
+    padding = -offset % _ALIGN
+
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(header)))
+        f.write(header)
+        f.write(b"\x00" * padding)
+        f.write(np.ascontiguousarray(table.data, dtype="<f8").tobytes())
+    os.replace(tmp, path)
+
+
+def read_snapshot(path, fingerprint: dict) -> RateTable | None:
+    """Memory-map le snapshot s'il est valide pour cette source, sinon None."""
+    try:
+        with open(path, "rb") as f:
+            magic, version, header_len = _PREFIX.unpack(f.read(_PREFIX.size))
+            if magic != MAGIC or version != FORMAT_VERSION:
+                return None
+            header = json.loads(f.read(header_len))
+    except (OSError, struct.error, ValueError):
+        return None
+
+    if header.get("source") != fingerprint:
+        return None
+
+    offset = _PREFIX.size + header_len
+    offset += -offset % _ALIGN
+    shape = (header["n_days"], len(header["codes"]))
+    try:
+        data = np.memmap(path, dtype="<f8", mode="r", offset=offset, shape=shape)
+    except (OSError, ValueError):
+        return None
+    return RateTable(header["codes"], header["first_ordinal"], data, header["ref"])
+
+
+def _versions(path) -> list[Path]:
+    """Snapshots versionnés `<snapshot>.<n>`, du plus récent au plus ancien."""
+    path = Path(path)
+    found = [(int(p.name.rsplit(".", 1)[1]), p) for p in path.parent.glob(path.name + ".*")
+             if p.name.rsplit(".", 1)[1].isdigit()]
+    return [p for _, p in sorted(found, reverse=True)]
+
+
+def save_rate_table(snapshot_path, table: RateTable, source=CURRENCY_FILE) -> Path:
+    """
+    Écrit une table reçue à chaud dans un nouveau snapshot versionné (même
+    empreinte source : relu au prochain lancement) et retourne son chemin.
+    Les versions plus anciennes sont supprimées si possible (une version
+    encore memory-mappée reste en place jusqu'à la prochaine écriture).
+
+    Exception:
+        OSError si l'écriture échoue
+    """
+    path = Path(snapshot_path)
+    older = _versions(path)
+    version = time.time_ns()
+    if older:  # horloge ajustée : rester strictement croissant
+        version = max(version, int(older[0].name.rsplit(".", 1)[1]) + 1)
+    target = path.with_name(f"{path.name}.{version}")
+    write_snapshot(target, table, source_fingerprint(source))
+    for stale in older:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+    return target
+
+
+def load_rate_table(snapshot_path, source=CURRENCY_FILE) -> RateTable:
+    """
+    Retourne la table des taux : snapshot memory-mappé si à jour,
+    sinon parse de la source et (ré)écriture du snapshot.
+    """
+    fingerprint = source_fingerprint(source)
+    for path in (*_versions(snapshot_path), snapshot_path):
+        table = read_snapshot(path, fingerprint)
+        if table is not None:
+            return table
+
+    logger.info("Compilation du snapshot de taux depuis %s", source)
+    table = RateTable.from_ecb_file(source)
+    try:
+        write_snapshot(snapshot_path, table, fingerprint)
+    except OSError:
+        logger.warning("Impossible d'écrire le snapshot %s", snapshot_path, exc_info=True)
+    return table
@@ -0,0 +1,206 @@
+"""
+Module: rate_sources.py
+Responsabilité:
+    Sources locales de taux (format CSV BCE) interrogées périodiquement
+
+Sources:
+    - DropDirectorySource : dossier de dépôt, le fichier .csv/.zip le plus
+      récent fait foi ; parsé seulement quand sa taille et son mtime n'ont pas
+      bougé entre deux interrogations (écriture du producteur terminée) ;
+      fichiers cachés et temporaires (.tmp, .part) ignorés
+    - HttpSource : URL locale (GET conditionnel ETag / Last-Modified)
+
+Design:
+    - poll() retourne une nouvelle RateTable, ou None si rien n'a changé
+    - Détection bon marché d'abord (nom + taille + mtime, ou 304 Not Modified),
+      puis empreinte SHA-256 du contenu : un fichier touché mais identique
+      n'est jamais re-parsé
+    - poll() parse dans le thread appelant (jamais le thread GUI)
+
+Usage (serveur HTTP local de test):
+    python -m currency_app.infra.rate_sources eurofxref-hist.zip --port 8766
+"""
+
+import argparse
+import hashlib
+import io
+import logging
+import os
+import sys
+import urllib.error
+import urllib.request
+from email.utils import formatdate
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from zipfile import ZipFile, is_zipfile
+
+from currency_app.domain.rates import RateTable
+
+logger = logging.getLogger(__name__)
+
+SUFFIXES = (".csv", ".zip")
+
+
+def parse_payload(payload: bytes, ref: str = "EUR") -> RateTable:
+    """Contenu brut d'un fichier BCE (.zip ou .csv) → RateTable."""
+    buf = io.BytesIO(payload)
+    if is_zipfile(buf):
+        with ZipFile(buf) as zf, zf.open(zf.namelist()[0]) as raw:
+            return RateTable.from_ecb_lines(io.TextIOWrapper(raw, encoding="utf-8"), ref)
+    return RateTable.from_ecb_lines(io.StringIO(payload.decode("utf-8")), ref)
+
+
+class RateSource:
+    """Interface commune : poll() → RateTable | None."""
+
+    name = "source"
+
+    def __init__(self):
+        self.digest = None  # empreinte du dernier contenu publié
+
+    def poll(self) -> RateTable | None:
+        raise NotImplementedError
+
+    def _accept(self, payload: bytes) -> RateTable | None:
+        """Parse le contenu s'il diffère du dernier publié."""
+        digest = hashlib.sha256(payload).hexdigest()
+        if digest == self.digest:
+            return None
+        table = parse_payload(payload)
+        self.digest = digest
+        return table
+
+
+class DropDirectorySource(RateSource):
+    """Dossier de dépôt : le fichier de taux le plus récent est la source."""
+
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = Path(directory)
+        self.name = f"dir:{self.directory}"
+        self._stat = None     # (nom, taille, mtime_ns) du dernier fichier publié
+        self._pending = None  # idem, vu à l'interrogation précédente (écriture en cours ?)
+
+    def _latest(self):
+        best = None
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError:
+            return None
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.name.endswith(SUFFIXES) or not entry.is_file():
+                continue
+            st = entry.stat()
+            key = (st.st_mtime_ns, entry.name)
+            if best is None or key > best[0]:
+                best = (key, entry.path, (entry.name, st.st_size, st.st_mtime_ns))
+        return best
+
+    def poll(self) -> RateTable | None:
+        latest = self._latest()
+        if latest is None:
+            return None
+        _, path, stat = latest
+        if stat == self._stat:
+            return None
+        if stat != self._pending:  # nouveau ou encore en cours d'écriture : attendre un tour
+            self._pending = stat
+            return None
+
+        with open(path, "rb") as f:
+            payload = f.read()
+        table = self._accept(payload)
+        self._stat = stat
+        return table
+
+
+class HttpSource(RateSource):
+    """URL servant un fichier BCE ; requêtes conditionnelles (ETag, Last-Modified)."""
+
+    def __init__(self, url: str, timeout: float = 10.0):
+        super().__init__()
+        self.url = url
+        self.name = f"http:{url}"
+        self.timeout = timeout
+        self._etag = None
+        self._last_modified = None
+
+    def poll(self) -> RateTable | None:
+        request = urllib.request.Request(self.url)
+        if self._etag:
+            request.add_header("If-None-Match", self._etag)
+        if self._last_modified:
+            request.add_header("If-Modified-Since", self._last_modified)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                payload = response.read()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except urllib.error.HTTPError as exc:
+            if exc.code == HTTPStatus.NOT_MODIFIED:
+                return None
+            raise
+
+        table = self._accept(payload)
+        self._etag, self._last_modified = etag, last_modified
+        return table
+
+
+# ------------------------------------------------------------------
+# Serveur local de test (remplace un fournisseur HTTP)
+# ------------------------------------------------------------------
+def _make_handler(path: Path):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            try:
+                payload = path.read_bytes()
+                mtime = path.stat().st_mtime
+            except OSError:
+                self.send_error(HTTPStatus.NOT_FOUND)
+                return
+            etag = '"' + hashlib.sha256(payload).hexdigest()[:32] + '"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", formatdate(mtime, usegmt=True))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, fmt, *args):
+            logger.debug("%s - %s", self.address_string(), fmt % args)
+
+    return Handler
+
+
+def serve(path, host="127.0.0.1", port=8766) -> ThreadingHTTPServer:
+    """Serveur HTTP servant `path` (relu à chaque requête) ; non démarré."""
+    return ThreadingHTTPServer((host, port), _make_handler(Path(path)))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Sert un fichier de taux BCE en HTTP local (ETag)")
+    parser.add_argument("file", help="fichier .csv ou .zip au format BCE")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args(argv)
+
+    server = serve(args.file, args.host, args.port)
+    print(f"Taux servis sur http://{args.host}:{args.port}/", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
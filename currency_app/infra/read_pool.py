@@ -0,0 +1,101 @@
+"""
+Module: read_pool.py
+Responsabilité:
+    Pool de connexions SQLite en lecture seule pour le repository
+
+Design:
+    - Base en WAL : les lecteurs ne bloquent pas l'écrivain (et inversement),
+      chaque lecture voit le dernier état commité
+    - Connexions `mode=ro` ouvertes à la demande, au plus `size`
+    - Affinité de thread : un thread récupère de préférence la connexion qu'il
+      a utilisée en dernier (cache de pages et de requêtes préparées chaud)
+    - Un curseur par emprunt, jamais partagé entre threads
+    - busy_timeout sur chaque connexion (checkpoint, VACUUM de la maintenance) ;
+      pool épuisé plus longtemps que `timeout` → sqlite3.OperationalError
+"""
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from currency_app.core import metrics
+
+
+class ReadPool:
+    """Connexions en lecture seule partagées entre threads, empruntées le temps d'une lecture."""
+
+    def __init__(self, db_path, size: int = 4, timeout: float = 5.0):
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self.uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+        self.size = size
+        self.timeout = timeout
+        self._cond = threading.Condition()
+        self._idle = []       # [(connexion, ident du dernier thread utilisateur)]
+        self._opened = 0
+        self._closed = False
+
+    @contextmanager
+    def cursor(self):
+        """Curseur sur une connexion empruntée pour la durée du bloc."""
+        conn = self._acquire()
+        cur = conn.cursor()
+        try:
+            yield cur
+        finally:
+            cur.close()
+            self._release(conn)
+
+    def close(self) -> None:
+        """Ferme les connexions libres ; celles empruntées le seront à leur retour."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._opened -= len(idle)
+            self._cond.notify_all()
+        for conn, _ in idle:
+            conn.close()
+
+    def _acquire(self) -> sqlite3.Connection:
+        me = threading.get_ident()
+        deadline = time.monotonic() + self.timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise sqlite3.ProgrammingError("read pool is closed")
+                if self._idle:
+                    k = next((k for k, (_, owner) in enumerate(self._idle) if owner == me), -1)
+                    metrics.counter("db.read_pool.affine" if k >= 0 else "db.read_pool.migrated").inc()
+                    return self._idle.pop(k)[0]
+                if self._opened < self.size:
+                    self._opened += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    metrics.counter("db.read_pool.exhausted").inc()
+                    raise sqlite3.OperationalError(f"no read connection free after {self.timeout:.1f}s")
+                with metrics.timer("db.read_pool.wait"):
+                    self._cond.wait(remaining)
+
+        try:
+            conn = sqlite3.connect(self.uri, uri=True, timeout=self.timeout, check_same_thread=False)
+        except Exception:
+            with self._cond:
+                self._opened -= 1
+                self._cond.notify()
+            raise
+        metrics.counter("db.read_pool.opened").inc()
+        return conn
+
+    def _release(self, conn) -> None:
+        if conn.in_transaction:  # lecture abandonnée en cours : libère l'instantané WAL
+            conn.rollback()
+        with self._cond:
+            if not self._closed:
+                self._idle.append((conn, threading.get_ident()))
+                self._cond.notify()
+                return
+            self._opened -= 1
+        conn.close()
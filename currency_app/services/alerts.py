@@ -0,0 +1,318 @@
+"""
+Module: alerts.py
+Responsabilité:
+    Moteur d'alertes de taux multi-règles (indépendant de Qt)
+
+Règles:
+    - ABOVE : le taux monte jusqu'au seuil ou au-delà
+    - BELOW : le taux descend jusqu'au seuil ou en dessous
+    - CROSS : le seuil est franchi dans un sens ou dans l'autre
+    - MOVE  : variation de ±pct depuis le taux de référence (réarmée à chaque alerte)
+
+Design:
+    - Règle validée à l'ajout (seuil fini > 0, MOVE dans ]0, 1[, paire de deux
+      devises distinctes) : jamais de niveau qui ne se déclenche pas ou se
+      déclenche à chaque tick ; une règle invalide du fichier est ignorée
+    - Par paire sous règle uniquement, deux index triés de niveaux (montants,
+      descendants) ; un taux d'une paire sans règle est ignoré
+    - Une mise à jour prev → rate ne lit que la tranche ]prev, rate] (bisect),
+      jamais la liste complète des règles
+    - Une règle MOVE est deux niveaux ref × (1 ± pct), recalculés après déclenchement
+    - NotificationThrottle limite le débit et regroupe les alertes en rafale ;
+      un lot ne compte comme envoyé qu'une fois livré (mark_sent)
+    - Règles persistées en JSON (load_rules / save_rules, écriture atomique)
+"""
+
+import bisect
+import itertools
+import json
+import logging
+import math
+import os
+import time
+from pathlib import Path
+from dataclasses import dataclass, field
+from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+
+class RuleKind(str, Enum):
+    ABOVE = "above"
+    BELOW = "below"
+    CROSS = "cross"
+    MOVE = "move"
+
+
+@dataclass
+class AlertRule:
+    """Règle d'alerte sur une paire. `value` = seuil, ou fraction pour MOVE (0.02 = 2 %)."""
+    frm: str
+    to: str
+    kind: RuleKind
+    value: float
+    rule_id: int = field(default=0, compare=False)
+    reference: float | None = field(default=None, compare=False)  # MOVE uniquement
+
+
+@dataclass(frozen=True)
+class Alert:
+    """Déclenchement d'une règle."""
+    rule: AlertRule
+    prev: float | None
+    rate: float
+
+    def describe(self) -> str:
+        r = self.rule
+        pair = f"{r.frm}→{r.to} = {self.rate:.4f}"
+        if r.kind == RuleKind.ABOVE:
+            return f"{pair} (≥ {r.value:.4f})"
+        if r.kind == RuleKind.BELOW:
+            return f"{pair} (≤ {r.value:.4f})"
+        if r.kind == RuleKind.CROSS:
+            return f"{pair} ({'↗' if self.prev is not None and self.rate > self.prev else '↘'} {r.value:.4f})"
+        return f"{pair} (±{r.value * 100:.2f}% / {self.prev:.4f})"
+
+
+class _PairIndex:
+    """Niveaux triés (niveau, rule_id) d'une paire, dans chaque sens."""
+
+    def __init__(self):
+        self.up = []     # déclenchés quand le taux monte à travers le niveau
+        self.down = []   # déclenchés quand le taux descend à travers le niveau
+        self.last = None
+
+    @staticmethod
+    def _remove(levels, entry):
+        i = bisect.bisect_left(levels, entry)
+        if i < len(levels) and levels[i] == entry:
+            del levels[i]
+
+    def add(self, up=None, down=None, rule_id=0):
+        if up is not None:
+            bisect.insort(self.up, (up, rule_id))
+        if down is not None:
+            bisect.insort(self.down, (down, rule_id))
+
+    def remove(self, up=None, down=None, rule_id=0):
+        if up is not None:
+            self._remove(self.up, (up, rule_id))
+        if down is not None:
+            self._remove(self.down, (down, rule_id))
+
+    def crossed(self, prev, rate) -> list[int]:
+        """rule_id des niveaux franchis entre prev et rate."""
+        if rate > prev:
+            lo = bisect.bisect_right(self.up, (prev, float("inf")))
+            hi = bisect.bisect_right(self.up, (rate, float("inf")))
+            return [rid for _, rid in self.up[lo:hi]]
+        if rate < prev:
+            lo = bisect.bisect_left(self.down, (rate, -1))
+            hi = bisect.bisect_left(self.down, (prev, -1))
+            return [rid for _, rid in self.down[lo:hi]]
+        return []
+
+    def first(self, rate) -> tuple[list[int], list[int]]:
+        """Première observation : (niveaux montants ≤ rate, niveaux descendants ≥ rate)."""
+        up = [rid for _, rid in self.up[:bisect.bisect_right(self.up, (rate, float("inf")))]]
+        down = [rid for _, rid in self.down[bisect.bisect_left(self.down, (rate, -1)):]]
+        return up, down
+
+
+class AlertEngine:
+    """Registre de règles indexé par paire."""
+
+    def __init__(self):
+        self._rules: dict[int, AlertRule] = {}
+        self._pairs: dict[tuple[str, str], _PairIndex] = {}
+        self._ids = itertools.count(1)
+
+    # ------------------------------------------------------------------
+    # Gestion des règles
+    # ------------------------------------------------------------------
+    def add_rule(self, frm, to, kind, value) -> AlertRule:
+        """
+        Ajoute une règle et retourne-la (avec son rule_id).
+
+        Exception:
+            ValueError si la règle est invalide (voir validate_rule)
+        """
+        rule = validate_rule(frm, to, kind, value)
+        rule.rule_id = next(self._ids)
+        index = self._pairs.setdefault((rule.frm, rule.to), _PairIndex())
+        if rule.kind == RuleKind.MOVE:
+            rule.reference = index.last  # armée dès que la paire a un taux
+        self._rules[rule.rule_id] = rule
+        index.add(*self._levels(rule), rule.rule_id)
+        return rule
+
+    def remove_rule(self, rule_id) -> None:
+        rule = self._rules.pop(rule_id, None)
+        if rule is None:
+            return
+        pair = (rule.frm, rule.to)
+        self._pairs[pair].remove(*self._levels(rule), rule_id)
+        if not any((r.frm, r.to) == pair for r in self._rules.values()):
+            del self._pairs[pair]  # plus aucune règle : plus d'index
+
+    def rules(self, frm=None, to=None) -> list[AlertRule]:
+        return [r for r in self._rules.values()
+                if (frm is None or r.frm == frm) and (to is None or r.to == to)]
+
+    def pairs(self) -> list[tuple[str, str]]:
+        """Paires portant au moins une règle (à réévaluer après un changement de taux)."""
+        return list(dict.fromkeys((r.frm, r.to) for r in self._rules.values()))
+
+    @staticmethod
+    def _levels(rule) -> tuple[float | None, float | None]:
+        """(niveau montant, niveau descendant) indexés pour la règle."""
+        if rule.kind == RuleKind.ABOVE:
+            return rule.value, None
+        if rule.kind == RuleKind.BELOW:
+            return None, rule.value
+        if rule.kind == RuleKind.CROSS:
+            return rule.value, rule.value
+        if rule.reference is None:
+            return None, None
+        return rule.reference * (1 + rule.value), rule.reference * (1 - rule.value)
+
+    # ------------------------------------------------------------------
+    # Mises à jour de taux
+    # ------------------------------------------------------------------
+    def update(self, frm, to, rate) -> list[Alert]:
+        """Enregistre un nouveau taux pour la paire et retourne les alertes déclenchées."""
+        index = self._pairs.get((frm, to))
+        if index is None:  # paire sans règle
+            return []
+        prev, index.last = index.last, rate
+
+        if prev is None:
+            up, down = index.first(rate)
+            fired = [rid for rid in up if self._rules[rid].kind == RuleKind.ABOVE]
+            fired += [rid for rid in down if self._rules[rid].kind == RuleKind.BELOW]
+            self._arm_moves(index, frm, to, rate)
+        else:
+            fired = index.crossed(prev, rate)
+
+        alerts = []
+        for rid in dict.fromkeys(fired):  # une règle CROSS n'apparaît qu'une fois
+            rule = self._rules[rid]
+            if rule.kind == RuleKind.MOVE:
+                alerts.append(Alert(rule, rule.reference, rate))
+                index.remove(*self._levels(rule), rid)
+                rule.reference = rate
+                index.add(*self._levels(rule), rid)
+            else:
+                alerts.append(Alert(rule, prev, rate))
+        return alerts
+
+    def update_many(self, rates: dict[tuple[str, str], float]) -> list[Alert]:
+        """Met à jour plusieurs paires d'un coup."""
+        alerts = []
+        for (frm, to), rate in rates.items():
+            alerts.extend(self.update(frm, to, rate))
+        return alerts
+
+    def _arm_moves(self, index, frm, to, rate):
+        for rule in self._rules.values():
+            if rule.kind == RuleKind.MOVE and rule.reference is None and (rule.frm, rule.to) == (frm, to):
+                rule.reference = rate
+                index.add(*self._levels(rule), rule.rule_id)
+
+
+def validate_rule(frm, to, kind, value) -> AlertRule:
+    """
+    Règle normalisée (codes en majuscules), sans rule_id.
+
+    Exception:
+        ValueError si type inconnu, devises vides ou identiques, valeur non
+        numérique / non finie, seuil ≤ 0, ou MOVE hors de ]0, 1[
+    """
+    kind = RuleKind(kind)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"rule value must be a number, got {value!r}")
+    value = float(value)
+    if not math.isfinite(value) or value <= 0:
+        raise ValueError(f"rule value must be finite and > 0, got {value!r}")
+    if kind == RuleKind.MOVE and value >= 1:
+        raise ValueError(f"move rule is a fraction in ]0, 1[ (0.02 = 2 %), got {value!r}")
+    if not isinstance(frm, str) or not isinstance(to, str) or not frm.strip() or not to.strip():
+        raise ValueError("rule needs two currency codes")
+    frm, to = frm.strip().upper(), to.strip().upper()
+    if frm == to:
+        raise ValueError(f"rule pair must use two different currencies, got {frm}→{to}")
+    return AlertRule(frm, to, kind, value)
+
+
+class NotificationThrottle:
+    """
+    Limite le débit de notifications : au plus une toutes les `min_interval`
+    secondes ; les éléments arrivés entre-temps sont regroupés.
+    """
+
+    def __init__(self, min_interval=10.0, clock=time.monotonic):
+        self.min_interval = min_interval
+        self.clock = clock
+        self._pending = []
+        self._last_sent = None
+
+    def push(self, items) -> list:
+        """Ajoute des éléments ; retourne le lot à envoyer maintenant (ou [])."""
+        self._pending.extend(items)
+        return self.poll()
+
+    def poll(self) -> list:
+        """
+        Retourne le lot en attente si l'intervalle minimal est écoulé.
+        Le lot reste en attente jusqu'à mark_sent() : un envoi impossible
+        (pas encore de tray) ne perd rien et ne consomme pas l'intervalle.
+        """
+        if not self._pending or self.delay() > 0:
+            return []
+        return list(self._pending)
+
+    def mark_sent(self, batch) -> None:
+        """Le lot retourné par poll() a été livré : retiré, intervalle démarré."""
+        del self._pending[:len(batch)]
+        self._last_sent = self.clock()
+
+    def delay(self) -> float:
+        """Secondes avant le prochain envoi possible."""
+        if self._last_sent is None:
+            return 0.0
+        return max(0.0, self._last_sent + self.min_interval - self.clock())
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+
+# ----------------------------------------------------------------------
+# Persistance des règles (JSON)
+# ----------------------------------------------------------------------
+def load_rules(engine: AlertEngine, path) -> list[AlertRule]:
+    """Ajoute au moteur les règles du fichier ; fichier absent ou invalide → aucune."""
+    try:
+        entries = json.loads(Path(path).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError):
+        logger.warning("Règles d'alerte illisibles : %s", path, exc_info=True)
+        return []
+
+    rules = []
+    for entry in entries if isinstance(entries, list) else ():
+        try:
+            rules.append(engine.add_rule(entry["frm"], entry["to"], entry["kind"], entry["value"]))
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.warning("Règle d'alerte ignorée : %r (%s)", entry, exc)
+    return rules
+
+
+def save_rules(rules, path) -> None:
+    """Écrit les règles de façon atomique (fichier temporaire + rename)."""
+    path = Path(path)
+    data = [{"frm": r.frm, "to": r.to, "kind": r.kind.value, "value": r.value} for r in rules]
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
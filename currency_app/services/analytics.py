@@ -0,0 +1,195 @@
+"""
+Module: analytics.py
+Responsabilité:
+    Statistiques glissantes par paire sur l'historique des conversions
+    (indépendant de Qt)
+
+Indicateurs (fenêtre de N points):
+    - sma        : moyenne mobile des taux
+    - volatility : écart-type des rendements logarithmiques (en %)
+    - low / high : min / max glissants
+    - drawdown   : recul depuis le plus haut historique (en %, ≤ 0)
+    - max_drawdown : pire drawdown observé
+    - change_pct : variation entre le premier et le dernier taux de la fenêtre
+
+Design:
+    - Chargement initial vectorisé (cumsum, sliding_window_view, accumulate)
+    - Mises à jour incrémentales O(1) : somme glissante (SMA), moyenne et
+      somme des carrés des écarts des rendements par ajout / retrait de
+      Welford (pas de Σr² − (Σr)²/n : aucune annulation catastrophique, jamais
+      de variance négative), deques monotones pour min/max, plus haut et pire
+      drawdown courants
+    - Toutes les N mises à jour, somme et variance sont recalculées exactement
+      sur la fenêtre (math.fsum) : aucune dérive d'arrondi sur une longue session
+"""
+
+import math
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+OVERLAYS = ("sma", "low", "high")
+
+
+@dataclass(frozen=True)
+class PairStats:
+    """Indicateurs au dernier point d'une paire (NaN tant que la fenêtre n'est pas pleine)."""
+    x: float
+    rate: float
+    sma: float
+    volatility: float
+    low: float
+    high: float
+    drawdown: float
+    max_drawdown: float
+    change_pct: float
+
+
+def rolling_series(rates, window: int) -> dict[str, np.ndarray]:
+    """Indicateurs pour chaque point d'une série de taux, en tableaux NumPy."""
+    rates = np.asarray(rates, dtype=np.float64)
+    n = len(rates)
+    out = {k: np.full(n, np.nan) for k in ("sma", "volatility", "low", "high", "change_pct")}
+
+    if n >= window:
+        csum = np.concatenate(([0.0], np.cumsum(rates)))
+        out["sma"][window - 1:] = (csum[window:] - csum[:-window]) / window
+
+        windows = sliding_window_view(rates, window)
+        out["low"][window - 1:] = windows.min(axis=1)
+        out["high"][window - 1:] = windows.max(axis=1)
+        out["change_pct"][window - 1:] = (rates[window - 1:] / rates[:n - window + 1] - 1) * 100
+
+        returns = sliding_window_view(np.diff(np.log(rates)), window - 1)
+        out["volatility"][window - 1:] = returns.std(axis=1, ddof=1) * 100
+
+    peak = np.maximum.accumulate(rates) if n else rates
+    out["drawdown"] = (rates / peak - 1) * 100 if n else rates.copy()
+    out["max_drawdown"] = np.minimum.accumulate(out["drawdown"]) if n else rates.copy()
+    return out
+
+
+class RollingAnalytics:
+    """État glissant d'une paire : chargement vectorisé puis push() en O(1)."""
+
+    def __init__(self, window: int = 20):
+        if window < 3:
+            raise ValueError("window must be >= 3")
+        self.window = window
+        self.series: dict[str, np.ndarray] = {}  # résultat du dernier load()
+
+        self._rates = deque()            # N derniers taux
+        self._returns = deque()          # N-1 derniers rendements log
+        self._sum = 0.0
+        self._ret_mean = 0.0             # Welford : moyenne des rendements de la fenêtre
+        self._ret_m2 = 0.0               # Welford : Σ (r − moyenne)²
+        self._mins = deque()             # (indice, taux) croissants
+        self._maxs = deque()             # (indice, taux) décroissants
+        self._count = 0
+        self._peak = -math.inf
+        self._max_drawdown = 0.0
+        self._latest = None
+
+    @classmethod
+    def load(cls, xs, rates, window: int = 20) -> "RollingAnalytics":
+        """Calcule toute la série en vectorisé et prépare l'état incrémental."""
+        xs = np.asarray(xs, dtype=np.float64)
+        rates = np.asarray(rates, dtype=np.float64)
+
+        self = cls(window)
+        self.series = {"x": xs, **rolling_series(rates, window)}
+
+        # État incrémental = rejouer la dernière fenêtre, puis reprendre les
+        # extrêmes calculés sur toute la série
+        tail = max(len(rates) - window, 0)
+        self._count = tail
+        for x, rate in zip(xs[tail:].tolist(), rates[tail:].tolist()):
+            self.push(x, rate)
+        if len(rates):
+            self._peak = float(rates.max())
+            self._max_drawdown = float(self.series["max_drawdown"][-1])
+            self._latest = self._stats(float(xs[-1]), float(rates[-1]))
+        return self
+
+    def latest(self) -> PairStats | None:
+        return self._latest
+
+    def push(self, x: float, rate: float) -> PairStats:
+        """Ajoute un taux et retourne les indicateurs mis à jour."""
+        w = self.window
+        i = self._count
+        self._count += 1
+
+        if self._rates:
+            r = math.log(rate / self._rates[-1])
+            self._returns.append(r)
+            self._welford_add(r, len(self._returns))
+            if len(self._returns) > w - 1:
+                self._welford_remove(self._returns.popleft(), len(self._returns))
+
+        self._rates.append(rate)
+        self._sum += rate
+        if len(self._rates) > w:
+            self._sum -= self._rates.popleft()
+        if self._count % w == 0:
+            self._resync()
+
+        while self._mins and self._mins[-1][1] >= rate:
+            self._mins.pop()
+        self._mins.append((i, rate))
+        while self._maxs and self._maxs[-1][1] <= rate:
+            self._maxs.pop()
+        self._maxs.append((i, rate))
+        if self._mins[0][0] <= i - w:
+            self._mins.popleft()
+        if self._maxs[0][0] <= i - w:
+            self._maxs.popleft()
+
+        self._peak = max(self._peak, rate)
+        self._max_drawdown = min(self._max_drawdown, (rate / self._peak - 1) * 100)
+        self._latest = self._stats(x, rate)
+        return self._latest
+
+    def _welford_add(self, r, n):
+        """Ajoute r ; n = effectif après ajout."""
+        delta = r - self._ret_mean
+        self._ret_mean += delta / n
+        self._ret_m2 += delta * (r - self._ret_mean)
+
+    def _welford_remove(self, r, n):
+        """Retire r ; n = effectif après retrait."""
+        if n == 0:
+            self._ret_mean = self._ret_m2 = 0.0
+            return
+        delta = r - self._ret_mean
+        self._ret_mean -= delta / n
+        self._ret_m2 = max(self._ret_m2 - delta * (r - self._ret_mean), 0.0)
+
+    def _resync(self):
+        """Somme et variance recalculées exactement sur la fenêtre courante."""
+        self._sum = math.fsum(self._rates)
+        k = len(self._returns)
+        if k:
+            self._ret_mean = math.fsum(self._returns) / k
+            self._ret_m2 = math.fsum((r - self._ret_mean) ** 2 for r in self._returns)
+
+    def _stats(self, x, rate) -> PairStats:
+        nan = math.nan
+        drawdown = (rate / self._peak - 1) * 100
+        if len(self._rates) < self.window:
+            return PairStats(x, rate, nan, nan, nan, nan, drawdown, self._max_drawdown, nan)
+
+        var = self._ret_m2 / (len(self._returns) - 1)
+        return PairStats(
+            x=x,
+            rate=rate,
+            sma=self._sum / self.window,
+            volatility=math.sqrt(max(var, 0.0)) * 100,
+            low=self._mins[0][1],
+            high=self._maxs[0][1],
+            drawdown=drawdown,
+            max_drawdown=self._max_drawdown,
+            change_pct=(rate / self._rates[0] - 1) * 100,
+        )
@@ -2,11 +2,21 @@
 Module: chart_service.py
 Responsabilité:
     Service QtCharts encapsulé pour tracer les taux
+
+Design:
+    - Bornes min/max maintenues incrémentalement (pas de relecture de la série)
+    - load_points() : chargement en bloc via replaceNp + un seul rescale
+    - Séries superposées optionnelles (analyses) créées à la demande, par nom
 """
 
+import numpy as np
 from PySide6.QtCharts import QChart, QChartView, QLineSeries, QDateTimeAxis, QValueAxis
 from PySide6.QtCore import Qt, QDateTime
-from PySide6.QtGui import QPainter
+from PySide6.QtGui import QColor, QPainter, QPen
+
+from currency_app.core import metrics
+
+OVERLAY_COLORS = {"sma": "#FFFFFF", "low": "#4FC3F7", "high": "#FF8A65"}
 
 class RateChart:
     """Gère un graphique linéaire de taux"""
@@ -32,31 +42,101 @@ class RateChart:
         self.view = QChartView(self.chart)
         self.view.setRenderHint(QPainter.Antialiasing)
 
+        # Bornes courantes (x en ms epoch) — None tant que la série est vide
+        self._bounds = None
+
+        # Séries superposées (nom → QLineSeries)
+        self.overlays = {}
+        self._overlays_visible = False
+
     def widget(self):
         return self.view
 
-    def add_point(self, ts_str: str, rate: float):
-        """Ajoute un point (timestamp ms, taux)"""
-        dt = QDateTime.fromString(ts_str, "yyyy-MM-dd HH:mm:ss")
-        self.series.append(dt.toMSecsSinceEpoch(), rate)
+    @metrics.timed("chart.add_point")
+    def add_point(self, ts_str: str, rate: float) -> float:
+        """Ajoute un point (timestamp ms, taux) ; retourne x"""
+        x = QDateTime.fromString(ts_str, "yyyy-MM-dd HH:mm:ss").toMSecsSinceEpoch()
+        self.series.append(x, rate)
+
+        if self._bounds is None:
+            self._bounds = (x, x, rate, rate)
+        else:
+            x0, x1, y0, y1 = self._bounds
+            self._bounds = (min(x0, x), max(x1, x), min(y0, rate), max(y1, rate))
+        self.rescale()
+        return x
+
+    @metrics.timed("chart.load_points")
+    def load_points(self, timestamps, rates):
+        """Remplace la série en bloc (timestamps en ms epoch) puis un seul rescale"""
+        xs = np.ascontiguousarray(timestamps, dtype=np.float64)
+        ys = np.ascontiguousarray(rates, dtype=np.float64)
+        self.series.replaceNp(xs, ys)
+
+        self._bounds = None if len(xs) == 0 else (xs.min(), xs.max(), ys.min(), ys.max())
         self.rescale()
 
     def clear(self):
         self.series.clear()
+        self._bounds = None
+        self.clear_overlays()
+
+    # ------------------------------------------------------------------
+    # Séries superposées
+    # ------------------------------------------------------------------
+    def _overlay(self, name):
+        series = self.overlays.get(name)
+        if series is None:
+            series = QLineSeries()
+            series.setName(name)
+            pen = QPen(QColor(OVERLAY_COLORS.get(name, "#C7C7C7")))
+            pen.setStyle(Qt.DashLine)
+            series.setPen(pen)
+            series.setVisible(self._overlays_visible)
+            self.chart.addSeries(series)
+            series.attachAxis(self.axis_x)
+            series.attachAxis(self.axis_y)
+            self.overlays[name] = series
+        return series
+
+    @metrics.timed("chart.set_overlays")
+    def set_overlays(self, xs, values: dict):
+        """Remplace les séries superposées en bloc (NaN ignorés)."""
+        xs = np.asarray(xs, dtype=np.float64)
+        for name, ys in values.items():
+            ys = np.asarray(ys, dtype=np.float64)
+            keep = ~np.isnan(ys)
+            self._overlay(name).replaceNp(np.ascontiguousarray(xs[keep]), np.ascontiguousarray(ys[keep]))
+
+    def append_overlays(self, x, values: dict):
+        """Ajoute un point à chaque série superposée (NaN ignorés)."""
+        for name, y in values.items():
+            if y == y:
+                self._overlay(name).append(x, y)
+
+    def clear_overlays(self):
+        for series in self.overlays.values():
+            series.clear()
+
+    def set_overlays_visible(self, visible: bool):
+        self._overlays_visible = visible
+        for series in self.overlays.values():
+            series.setVisible(visible)
+        self.chart.legend().setVisible(visible)
+        for marker in self.chart.legend().markers(self.series):
+            marker.setVisible(False)  # série principale sans nom
 
     def rescale(self):
-        """Réajuste les axes selon les valeurs actuelles"""
-        if self.series.count() == 0:
+        """Réajuste les axes selon les bornes courantes"""
+        if self._bounds is None:
             return
 
-        xs = [self.series.at(i).x() for i in range(self.series.count())]
-        ys = [self.series.at(i).y() for i in range(self.series.count())]
-
+        x0, x1, mn, mx = self._bounds
         self.axis_x.setRange(
-            QDateTime.fromMSecsSinceEpoch(int(xs[0])),
-            QDateTime.fromMSecsSinceEpoch(int(xs[-1]))
+            QDateTime.fromMSecsSinceEpoch(int(x0)),
+            QDateTime.fromMSecsSinceEpoch(int(x1))
         )
 
-        mn, mx = min(ys), max(ys)
         pad = (mx - mn) * 0.1 if mx != mn else 0.1
         self.axis_y.setRange(mn - pad, mx + pad)
+
@@ -0,0 +1,173 @@
+"""
+Module: conversion_pipeline.py
+Responsabilité:
+    Pipeline de conversion hors thread GUI (debounce + QThreadPool)
+
+Design:
+    - submit() redémarre un QTimer : une rafale de frappes = une seule requête
+    - Chaque requête reçoit un numéro de séquence croissant
+    - Le worker (pool à 1 thread, donc FIFO) saute les requêtes périmées
+      avant conversion + insertion SQLite
+    - Les résultats reviennent au thread GUI par signal (connexion en file),
+      ceux plus anciens que le dernier appliqué sont ignorés
+    - Persistance découplée de l'affichage : chaque résultat appliqué passe
+      par un RecordCoalescer ; seul l'enregistrement stabilisé d'une rafale
+      est inséré (même pool à 1 thread : ordre conservé) puis émis (`settled`)
+"""
+
+import logging
+from datetime import datetime
+
+from PySide6 import QtCore
+
+from currency_app.core import metrics
+from currency_app.domain.models import ConversionRecord
+from currency_app.services.record_coalescer import RecordCoalescer
+
+logger = logging.getLogger(__name__)
+
+
+class _ConversionJob(QtCore.QRunnable):
+    """Conversion d'une requête, exécutée dans le pool."""
+
+    def __init__(self, pipeline, seq, ts, amount, frm, to):
+        super().__init__()
+        self.pipeline = pipeline
+        self.args = (seq, ts, amount, frm, to)
+
+    def run(self):
+        seq, ts, amount, frm, to = self.args
+        if self.pipeline.is_stale(seq):
+            metrics.counter("conversion.stale_skipped").inc()
+            return
+
+        try:
+            with metrics.timer("conversion.convert"):
+                result, rate = self.pipeline.converter.convert(amount, frm, to)
+            rec = ConversionRecord(ts, frm, to, amount, result, rate)
+        except Exception as exc:
+            logger.debug("Conversion %s %s→%s échouée: %s", amount, frm, to, exc)
+            metrics.counter("conversion.failed").inc()
+            self.pipeline.failed.emit(seq, str(exc))
+            return
+
+        self.pipeline.converted.emit(seq, rec)
+
+
+class _PersistJob(QtCore.QRunnable):
+    """Insertion d'un enregistrement stabilisé, exécutée dans le pool."""
+
+    def __init__(self, repo, rec):
+        super().__init__()
+        self.repo = repo
+        self.rec = rec
+
+    def run(self):
+        try:
+            self.repo.insert(self.rec)
+        except Exception:
+            logger.exception("Insertion de l'historique échouée")
+
+
+class ConversionPipeline(QtCore.QObject):
+    """Convertit en arrière-plan, applique les résultats dans l'ordre, persiste les rafales stabilisées."""
+
+    converted = QtCore.Signal(int, object)  # (seq, ConversionRecord)
+    failed = QtCore.Signal(int, str)
+    applied = QtCore.Signal(object)  # ConversionRecord, côté GUI, dans l'ordre (affichage)
+    settled = QtCore.Signal(object)  # ConversionRecord stabilisé, envoyé à la base
+
+    def __init__(self, converter, repo, debounce_ms=250, settle_ms=2000, parent=None):
+        super().__init__(parent)
+        self.converter = converter
+        self.repo = repo
+
+        self._seq = 0
+        self._applied_seq = 0
+        self._settle_seq = 0  # les résultats jusqu'à ce numéro sont stabilisés dès leur arrivée
+        self._request = None
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._dispatch)
+
+        # Un seul worker : les insertions restent dans l'ordre des requêtes
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+        self.coalescer = RecordCoalescer(settle_ms, self)
+        self.coalescer.settled.connect(self._persist)
+
+        self.converted.connect(self._on_converted)
+
+    def submit(self, amount, frm, to, immediate=False):
+        """
+        Enregistre la dernière requête ; la lance après le délai de debounce.
+        `immediate` (action Convertir) : lancée tout de suite et stabilisée
+        dès son résultat.
+        """
+        self._request = (amount, frm, to)
+        if immediate:
+            self.settle()
+        else:
+            self._timer.start()
+
+    def settle(self):
+        """
+        Stabilise la saisie courante (perte de focus, Convertir) : une requête
+        en attente de debounce part tout de suite, et le dernier résultat
+        est persisté sans attendre le délai d'inactivité.
+        """
+        if self._request is not None:
+            self._timer.stop()
+            self._dispatch()
+        self._settle_seq = self._seq
+        if self._applied_seq >= self._seq:  # rien en vol : le dernier résultat est déjà là
+            self.coalescer.settle()
+
+    def is_stale(self, seq) -> bool:
+        """Vrai si une requête plus récente a été émise depuis `seq`."""
+        return seq != self._seq
+
+    def cancel(self):
+        """Annule les requêtes en attente, attend le worker et ignore ses résultats."""
+        self.coalescer.discard()
+        self._stop()
+
+    def close(self):
+        """Persiste le dernier résultat affiché, puis arrête le pipeline."""
+        self.coalescer.settle()
+        self._stop()
+
+    def _stop(self):
+        self._timer.stop()
+        self._request = None
+        self._seq += 1
+        self._pool.waitForDone()
+        self._applied_seq = self._seq
+
+    def _dispatch(self):
+        if self._request is None:
+            return
+        amount, frm, to = self._request
+        self._request = None
+
+        self._seq += 1
+        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._pool.start(_ConversionJob(self, self._seq, ts, amount, frm, to))
+
+    @QtCore.Slot(int, object)
+    def _on_converted(self, seq, rec):
+        if seq <= self._applied_seq:
+            return
+        self._applied_seq = seq
+        self.applied.emit(rec)
+        self.coalescer.offer(rec)
+        if seq <= self._settle_seq:
+            self.coalescer.settle()
+
+    @QtCore.Slot(object)
+    def _persist(self, rec):
+        self._pool.start(_PersistJob(self.repo, rec))
+        self.settled.emit(rec)
@@ -0,0 +1,43 @@
+"""
+Module: history_loader.py
+Responsabilité:
+    Chargement de l'historique en HistoryStore en arrière-plan (QThreadPool)
+
+Design:
+    - repo.fetch_store() s'exécute dans un worker : une fenêtre ouverte sur un
+      historique d'un million de lignes reste aussi réactive qu'à vide
+    - Signal `loaded(store)` (reçu dans le thread GUI, connexion en file) ;
+      `failed(message)` si la lecture échoue
+    - `generation` : l'appelant ignore un chargement devenu obsolète (par ex.
+      historique effacé pendant la lecture)
+"""
+
+import logging
+
+from PySide6 import QtCore
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryStoreLoader(QtCore.QObject):
+    """Lecture unique de l'historique en colonnes, hors thread GUI."""
+
+    loaded = QtCore.Signal(object)   # HistoryStore
+    failed = QtCore.Signal(str)
+
+    def __init__(self, repo, generation=0, parent=None):
+        super().__init__(parent)
+        self.repo = repo
+        self.generation = generation
+
+    def start(self):
+        QtCore.QThreadPool.globalInstance().start(self.run)
+
+    def run(self):
+        try:
+            store = self.repo.fetch_store()
+        except Exception as exc:
+            logger.exception("Chargement de l'historique échoué")
+            self.failed.emit(str(exc))
+            return
+        self.loaded.emit(store)
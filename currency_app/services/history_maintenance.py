@@ -0,0 +1,96 @@
+"""
+Module: history_maintenance.py
+Responsabilité:
+    Rétention et compaction planifiées de l'historique SQLite, en arrière-plan
+
+Design:
+    - Conversion unique en auto_vacuum INCREMENTAL (VACUUM complet) :
+      explicite, via enable_compaction(), ou au démarrage du thread si
+      `compact` est demandé (l'application le demande seulement quand une
+      rétention est configurée) ; jamais dans la passe périodique
+    - Un thread démon exécute une passe toutes les `interval` secondes :
+        1. archivage des lignes plus vieilles que `retention_days` jours
+        2. incremental_vacuum par pas de `vacuum_pages` pages, avec une courte
+           pause entre les pas, si la base est en auto_vacuum INCREMENTAL :
+           les écritures de l'UI ne sont jamais bloquées longtemps
+        3. ANALYZE échantillonné pour garder de bons plans de requête
+    - Chaque étape passe par une connexion dédiée du repository
+    - Aucune dépendance Qt
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryMaintenance:
+    """Archive, compacte et analyse la base d'historique périodiquement."""
+
+    def __init__(self, repo, archive=None, retention_days: int | None = None,
+                 interval: float = 3600.0, vacuum_pages: int = 1024, vacuum_pause: float = 0.05,
+                 initial_delay: float = 0.0, compact: bool = False):
+        self.repo = repo
+        self.archive = archive
+        self.retention_days = retention_days
+        self.interval = interval
+        self.vacuum_pages = vacuum_pages
+        self.vacuum_pause = vacuum_pause
+        self.initial_delay = initial_delay  # laisse passer le démarrage de l'UI
+        self.compact = compact
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> "HistoryMaintenance":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="history-maintenance", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def enable_compaction(self) -> bool:
+        """
+        Passe la base en auto_vacuum INCREMENTAL (VACUUM complet, une seule
+        fois par base). Retourne True si la conversion a eu lieu.
+        """
+        return self.repo.enable_incremental_vacuum()
+
+    def run_once(self) -> dict:
+        """Une passe complète ; retourne un résumé (lignes archivées, tailles avant / après)."""
+        before = self.repo.file_size()
+
+        archived = 0
+        if self.retention_days is not None and self.archive is not None:
+            cutoff = datetime.now() - timedelta(days=self.retention_days)
+            archived = self.repo.archive_older_than(cutoff, self.archive)
+
+        # Sans auto_vacuum INCREMENTAL, incremental_vacuum ne libère rien
+        if self.repo.incremental_vacuum_enabled():
+            while self.repo.vacuum_step(self.vacuum_pages) and not self._stop.wait(self.vacuum_pause):
+                pass
+        self.repo.analyze()
+
+        summary = {"archived": archived, "size_before": before, "size_after": self.repo.file_size()}
+        logger.info("Maintenance de l'historique : %s", summary)
+        return summary
+
+    def _run(self):
+        if self._stop.wait(self.initial_delay):
+            return
+        if self.compact:
+            try:
+                self.enable_compaction()
+            except Exception:
+                logger.warning("Activation de l'auto_vacuum incrémental en échec", exc_info=True)
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                logger.warning("Maintenance de l'historique en échec", exc_info=True)
+            self._stop.wait(self.interval)
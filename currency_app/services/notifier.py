@@ -2,14 +2,49 @@
 Module: notifier.py
 Responsabilité:
     Gérer les notifications système via QSystemTrayIcon
+
+Design:
+    - Les règles d'alerte vivent dans un AlertEngine (index triés par paire)
+    - Règles utilisateur chargées depuis / enregistrées dans `rules_path` (JSON) ;
+      la règle "seuil" de l'UI n'est pas persistée
+    - Taux soumis par paire (conversion) ou par lot : toutes les paires sous
+      règle après un swap de table (check_table), la ligne de la watchlist (on_rates)
+    - Les alertes passent par un NotificationThrottle : débit limité et
+      rafales regroupées en un seul message tray ; rien n'est perdu avant la
+      création du tray (lot livré à ensure())
 """
 
-from PySide6 import QtWidgets
+import logging
+import math
+
+import numpy as np
+from PySide6 import QtCore, QtWidgets
+
+from currency_app.services.alerts import (
+    AlertEngine,
+    NotificationThrottle,
+    RuleKind,
+    load_rules,
+    save_rules,
+)
+
+logger = logging.getLogger(__name__)
+
 
 class SystemNotifier:
-    def __init__(self):
+    def __init__(self, min_interval=10.0, rules_path=None):
         self.tray = None
-        self.last_rate = {}  # mémorise le dernier taux par paire
+        self.alerts = AlertEngine()
+        self.throttle = NotificationThrottle(min_interval)
+        self.rules_path = rules_path
+        self._ui_rules = {}  # règle "seuil" pilotée par l'UI, par paire
+        self._title = ""
+        if rules_path is not None:
+            load_rules(self.alerts, rules_path)
+
+        self._flush_timer = QtCore.QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush)
 
     def ensure(self, parent=None):
         """Initialise l'icône tray si pas encore créée"""
@@ -18,18 +53,96 @@ class SystemNotifier:
             icon = QtWidgets.QApplication.style().standardIcon(QtWidgets.QStyle.SP_MessageBoxInformation)
             self.tray.setIcon(icon)
             self.tray.setVisible(True)
+            self._flush()  # alertes arrivées avant le tray
 
-    def maybe_notify_threshold(self, frm, to, rate, threshold, enabled, title, body_tpl):
-        """Envoie une alerte si un seuil a été franchi"""
-        if not enabled:
+    # ------------------------------------------------------------------
+    # Règles
+    # ------------------------------------------------------------------
+    def add_rule(self, frm, to, kind, value):
+        """Ajoute une règle (above / below / cross / move) au moteur d'alertes et l'enregistre."""
+        rule = self.alerts.add_rule(frm, to, kind, value)
+        self._save_rules()
+        return rule
+
+    def remove_rule(self, rule_id):
+        self.alerts.remove_rule(rule_id)
+        self._save_rules()
+
+    def user_rules(self):
+        """Règles configurées par l'utilisateur (hors seuil de l'UI)."""
+        ui_ids = {r.rule_id for r in self._ui_rules.values()}
+        return [r for r in self.alerts.rules() if r.rule_id not in ui_ids]
+
+    def _save_rules(self):
+        if self.rules_path is None:
             return
+        try:
+            save_rules(self.user_rules(), self.rules_path)
+        except OSError:
+            logger.warning("Règles d'alerte non enregistrées : %s", self.rules_path, exc_info=True)
 
-        key = f"{frm}->{to}"
-        prev = self.last_rate.get(key)
+    def on_rate(self, frm, to, rate, title, body_tpl=None):
+        """Soumet un nouveau taux au moteur et notifie les règles franchies."""
+        self._notify(title, self._messages(self.alerts.update(frm, to, rate), body_tpl))
 
-        crossed = (prev is not None and prev < threshold <= rate) or (prev is None and rate >= threshold)
-        self.last_rate[key] = rate
+    def on_rates(self, rates, title, body_tpl=None):
+        """Soumet plusieurs taux {(frm, to): taux} d'un coup (NaN = pas de taux, ignoré)."""
+        rates = {pair: rate for pair, rate in rates.items() if math.isfinite(rate)}
+        self._notify(title, self._messages(self.alerts.update_many(rates), body_tpl))
 
-        if crossed and self.tray:
-            self.tray.showMessage(title, body_tpl.format(frm=frm, to=to, rate=rate, th=threshold),
-                                  QtWidgets.QSystemTrayIcon.Information, 5000)
+    def check_table(self, converter, title, body_tpl=None):
+        """Réévalue toutes les paires sous règle sur la table courante (un seul calcul vectorisé)."""
+        known = set(converter.list_currencies())
+        pairs = [(frm, to) for frm, to in self.alerts.pairs() if frm in known and to in known]
+        if not pairs:
+            return
+        frms, tos = zip(*pairs)
+        _, rates = converter.convert_matrix(np.ones(len(pairs)), frms, tos)
+        self.on_rates(dict(zip(pairs, rates.tolist())), title, body_tpl)
+
+    def _messages(self, alerts, body_tpl):
+        messages = []
+        for alert in alerts:
+            r = alert.rule
+            if body_tpl is not None and r is self._ui_rules.get((r.frm, r.to)):
+                messages.append(body_tpl.format(frm=r.frm, to=r.to, rate=alert.rate, th=r.value))
+            else:
+                messages.append(alert.describe())
+        return messages
+
+    def maybe_notify_threshold(self, frm, to, rate, threshold, enabled, title, body_tpl):
+        """Envoie une alerte si le seuil de l'UI (taux ≥ seuil) a été franchi"""
+        rule = self._ui_rules.get((frm, to))
+        if rule is not None and (not enabled or rule.value != threshold):
+            self.alerts.remove_rule(rule.rule_id)
+            del self._ui_rules[(frm, to)]
+            rule = None
+        if enabled and rule is None and threshold > 0:  # seuil 0 : aucune règle (toujours vraie)
+            self._ui_rules[(frm, to)] = self.alerts.add_rule(frm, to, RuleKind.ABOVE, threshold)
+
+        self.on_rate(frm, to, rate, title, body_tpl)
+
+    # ------------------------------------------------------------------
+    # Envoi limité / regroupé
+    # ------------------------------------------------------------------
+    def _notify(self, title, messages):
+        if not messages:
+            return
+        self._title = title
+        self._show(self.throttle.push(messages))
+        if self.throttle.pending and not self._flush_timer.isActive():
+            self._flush_timer.start(int(self.throttle.delay() * 1000) + 1)
+
+    def _flush(self):
+        self._show(self.throttle.poll())
+
+    def _show(self, batch):
+        """Affiche le lot ; il ne compte comme envoyé (intervalle démarré) qu'une fois affiché."""
+        if not batch or not self.tray:
+            return
+        if len(batch) == 1:
+            title, body = self._title, batch[0]
+        else:
+            title, body = f"{self._title} ({len(batch)})", "\n".join(batch[-5:])
+        self.tray.showMessage(title, body, QtWidgets.QSystemTrayIcon.Information, 5000)
+        self.throttle.mark_sent(batch)
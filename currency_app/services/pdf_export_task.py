@@ -0,0 +1,100 @@
+"""
+Module: pdf_export_task.py
+Responsabilité:
+    Export PDF de l'historique en arrière-plan (QThreadPool)
+
+Design:
+    - Les lignes sont lues en flux depuis le repository (curseur dédié),
+      dans l'ordre du tableau (ordre d'insertion) : mémoire constante
+      quelle que soit la taille de l'historique
+    - Le rendu se fait dans un worker : l'UI reste fluide
+    - Signaux progress / finished / failed, annulation coopérative
+      (vérifiée à chaque page)
+    - Pas de parent Qt : l'appelant garde la référence jusqu'à la fin ; à la
+      fermeture de la fenêtre, cancel() puis wait() (aucun signal émis sur
+      un objet détruit) ; une tâche encore en file n'est pas attendue
+    - Le fichier partiel est supprimé en cas d'annulation ou d'erreur
+"""
+
+import logging
+import os
+import threading
+
+from PySide6 import QtCore
+
+from currency_app.utils.formatting import format_history_row
+
+logger = logging.getLogger(__name__)
+
+
+class PdfExportTask(QtCore.QObject):
+    """Tâche d'export PDF annulable, exécutée dans le pool global."""
+
+    progress = QtCore.Signal(int)        # lignes écrites
+    finished = QtCore.Signal(str)        # chemin du PDF
+    cancelled = QtCore.Signal()
+    failed = QtCore.Signal(str)
+
+    def __init__(self, path, title, headers, repo, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.title = title
+        self.headers = headers
+        self.repo = repo
+        self._cancel = threading.Event()
+        self._running = threading.Event()
+        self._done = threading.Event()
+
+    def start(self):
+        QtCore.QThreadPool.globalInstance().start(self.run)
+
+    @QtCore.Slot()
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def running(self) -> bool:
+        """run() a démarré dans le pool (une tâche encore en file n'écrit rien si annulée)."""
+        return self._running.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Attend la fin de run() ; False si `timeout` expire avant."""
+        return self._done.wait(timeout)
+
+    def run(self):
+        self._running.set()
+        try:
+            if self._cancel.is_set():  # annulée avant d'avoir quitté la file
+                self.cancelled.emit()
+                return
+            self._run()
+        finally:
+            self._done.set()
+
+    def _run(self):
+        from currency_app.infra.pdf_exporter import export_rows_to_pdf  # QtPrintSupport à la demande
+
+        rows = (format_history_row(*row) for row in self.repo.iter_rows(table_order=True))
+        try:
+            completed = export_rows_to_pdf(
+                self.path, self.title, self.headers, rows,
+                progress=self.progress.emit,
+                is_cancelled=self._cancel.is_set,
+            )
+        except Exception as exc:
+            logger.exception("Export PDF échoué")
+            self._discard()
+            self.failed.emit(str(exc))
+            return
+
+        if completed:
+            self.finished.emit(self.path)
+        else:
+            self._discard()
+            self.cancelled.emit()
+
+    def _discard(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,105 @@
+"""
+Module: rate_refresher.py
+Responsabilité:
+    Rafraîchissement des taux en arrière-plan, sans redémarrer l'application
+
+Design:
+    - Un thread démon interroge chaque source toutes les `interval` secondes
+    - Lecture, parse et précalculs (matrice croisée, table comblée) se font
+      dans ce thread ; le convertisseur ne voit qu'un swap de référence
+      (OfflineConverter.swap) : jamais de table à moitié mise à jour
+    - Les abonnés sont appelés depuis ce thread : côté Qt, passer un
+      signal.emit (connexion en file vers le thread GUI) ; subscribe_currencies
+      ne prévient que si l'ensemble des devises change (combos, index)
+    - `persist(table)` optionnel (ex. save_rate_table) : la table reçue est
+      écrite sur disque, un redémarrage ne repart pas des anciens taux ;
+      un échec est journalisé et compté (rates.persist_failed), le swap reste
+    - Aucune dépendance Qt : utilisable par le serveur HTTP et la CLI
+"""
+
+import logging
+import threading
+
+from currency_app.core import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class RateRefresher:
+    """Interroge des RateSource et publie les nouvelles tables dans le convertisseur."""
+
+    def __init__(self, converter, sources, interval: float = 30.0, persist=None):
+        self.converter = converter
+        self.sources = list(sources)
+        self.interval = interval
+        self.persist = persist
+        self._listeners = []
+        self._currency_listeners = []
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def subscribe(self, callback) -> None:
+        """callback(nom_source, table) après chaque swap (thread du rafraîchisseur)."""
+        self._listeners.append(callback)
+
+    def subscribe_currencies(self, callback) -> None:
+        """callback(codes) quand un swap change l'ensemble des devises (thread du rafraîchisseur)."""
+        self._currency_listeners.append(callback)
+
+    def start(self) -> "RateRefresher":
+        if self._thread is None and self.sources:
+            self._thread = threading.Thread(target=self._run, name="rate-refresher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def refresh_now(self) -> None:
+        """Demande un passage immédiat (sans attendre l'intervalle)."""
+        self._wake.set()
+
+    def poll_once(self) -> int:
+        """Interroge toutes les sources une fois ; retourne le nombre de swaps."""
+        swapped = 0
+        for source in self.sources:
+            try:
+                with metrics.timer("rates.poll"):
+                    table = source.poll()
+                if table is None:
+                    continue
+                with metrics.timer("rates.swap"):
+                    previous = self.converter.swap(table)
+            except Exception:
+                logger.warning("Source de taux %s en échec", source.name, exc_info=True)
+                metrics.counter("rates.poll_failed").inc()
+                continue
+
+            swapped += 1
+            metrics.counter("rates.swapped").inc()
+            logger.info("Taux mis à jour depuis %s (jusqu'au %s)", source.name, table.last_date)
+            if self.persist is not None:
+                try:
+                    with metrics.timer("rates.persist"):
+                        self.persist(table)
+                except Exception:
+                    logger.error("Taux de %s non persistés : un redémarrage repartira "
+                                 "des taux précédents", source.name, exc_info=True)
+                    metrics.counter("rates.persist_failed").inc()
+            for callback in self._listeners:
+                callback(source.name, table)
+            if list(previous.codes) != list(table.codes):
+                for callback in self._currency_listeners:
+                    callback(tuple(table.codes))
+        return swapped
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.poll_once()
+            self._wake.wait(self.interval)
+            self._wake.clear()
@@ -0,0 +1,60 @@
+"""
+Module: record_coalescer.py
+Responsabilité:
+    Regroupe les conversions successives d'une même paire en un seul
+    enregistrement « stabilisé » avant persistance
+
+Design:
+    - offer(rec) : le résultat est affiché tout de suite par l'appelant,
+      mais l'enregistrement reste en attente ; une nouvelle offre pour la
+      même paire le remplace (1 → 12 → 125 → 1250 → 12500 = une ligne)
+    - Stabilisé (signal `settled`) quand :
+        * aucune saisie pendant `idle_ms` (QTimer mono-coup),
+        * la paire change (l'ancienne paire est stabilisée d'abord),
+        * settle() est appelé (bouton Convertir, perte de focus, fermeture)
+    - discard() abandonne l'enregistrement en attente (effacement de l'historique)
+"""
+
+from PySide6 import QtCore
+
+from currency_app.core import metrics
+
+
+class RecordCoalescer(QtCore.QObject):
+    settled = QtCore.Signal(object)  # ConversionRecord à persister
+
+    def __init__(self, idle_ms=2000, parent=None):
+        super().__init__(parent)
+        self._pending = None
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(idle_ms)
+        self._timer.timeout.connect(self.settle)
+
+    @property
+    def pending(self):
+        return self._pending
+
+    def offer(self, rec):
+        """Nouvel enregistrement affiché ; remplace l'attente de la même paire."""
+        pending = self._pending
+        if pending is not None:
+            if (pending.from_cur, pending.to_cur) != (rec.from_cur, rec.to_cur):
+                self.settle()
+            else:
+                metrics.counter("conversion.coalesced").inc()
+        self._pending = rec
+        self._timer.start()
+
+    def settle(self):
+        """Émet l'enregistrement en attente (s'il y en a un)."""
+        self._timer.stop()
+        rec, self._pending = self._pending, None
+        if rec is not None:
+            metrics.counter("conversion.settled").inc()
+            self.settled.emit(rec)
+
+    def discard(self):
+        self._timer.stop()
+        self._pending = None
@@ -0,0 +1,108 @@
+"""
+Module: alert_rules_dialog.py
+Responsabilité:
+    Configuration des règles d'alerte (ajout / suppression, toutes paires)
+
+Design:
+    - Passe par SystemNotifier.add_rule / remove_rule : chaque modification
+      est enregistrée aussitôt (fichier de règles JSON)
+    - Règle MOVE saisie en pourcentage, stockée en fraction (2 % → 0.02)
+    - Règle refusée par le moteur (validate_rule) : message, rien d'enregistré
+    - La règle "seuil" de la carte Notifications n'apparaît pas ici
+"""
+
+from PySide6 import QtCore, QtWidgets
+
+from currency_app.core.i18n import t
+from currency_app.services.alerts import RuleKind
+
+COLUMNS = ["Paire", "Règle", "Valeur"]
+KIND_LABELS = {
+    RuleKind.ABOVE: "≥ seuil",
+    RuleKind.BELOW: "≤ seuil",
+    RuleKind.CROSS: "franchit le seuil",
+    RuleKind.MOVE: "variation ± %",
+}
+
+
+def _fmt_value(rule) -> str:
+    if rule.kind == RuleKind.MOVE:
+        return f"±{rule.value * 100:.2f} %"
+    return f"{rule.value:.4f}"
+
+
+class AlertRulesDialog(QtWidgets.QDialog):
+    def __init__(self, notifier, currencies, lang, parent=None):
+        super().__init__(parent)
+        self.notifier = notifier
+        self.setWindowTitle(t("alert_rules", lang))
+        self.resize(560, 380)
+
+        self.tbl = QtWidgets.QTableWidget(0, len(COLUMNS))
+        self.tbl.setHorizontalHeaderLabels(COLUMNS)
+        self.tbl.verticalHeader().hide()
+        self.tbl.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.tbl.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.tbl.horizontalHeader().setStretchLastSection(True)
+
+        self.cbb_from = QtWidgets.QComboBox()
+        self.cbb_to = QtWidgets.QComboBox()
+        self.cbb_from.addItems(currencies)
+        self.cbb_to.addItems(currencies)
+        self.cbb_kind = QtWidgets.QComboBox()
+        for kind, label in KIND_LABELS.items():
+            self.cbb_kind.addItem(label, kind)
+        self.spn_value = QtWidgets.QDoubleSpinBox()
+        self.spn_value.setDecimals(4)
+        self.spn_value.setRange(0.0, 1_000_000.0)
+
+        btn_add = QtWidgets.QPushButton(t("rule_add", lang))
+        btn_add.clicked.connect(self._add)
+        btn_remove = QtWidgets.QPushButton(t("rule_remove", lang))
+        btn_remove.clicked.connect(self._remove)
+
+        form = QtWidgets.QHBoxLayout()
+        for widget in (self.cbb_from, self.cbb_to, self.cbb_kind, self.spn_value, btn_add):
+            form.addWidget(widget)
+
+        bottom = QtWidgets.QHBoxLayout()
+        bottom.addStretch()
+        bottom.addWidget(btn_remove)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addWidget(self.tbl)
+        layout.addLayout(form)
+        layout.addLayout(bottom)
+
+        self.refresh()
+
+    def refresh(self):
+        rules = self.notifier.user_rules()
+        self.tbl.setRowCount(len(rules))
+        for r, rule in enumerate(rules):
+            pair = QtWidgets.QTableWidgetItem(f"{rule.frm}→{rule.to}")
+            pair.setData(QtCore.Qt.UserRole, rule.rule_id)
+            self.tbl.setItem(r, 0, pair)
+            self.tbl.setItem(r, 1, QtWidgets.QTableWidgetItem(KIND_LABELS[rule.kind]))
+            self.tbl.setItem(r, 2, QtWidgets.QTableWidgetItem(_fmt_value(rule)))
+
+    def _add(self):
+        frm, to = self.cbb_from.currentText(), self.cbb_to.currentText()
+        if not frm or frm == to:
+            return
+        kind = self.cbb_kind.currentData()
+        value = self.spn_value.value()
+        if kind == RuleKind.MOVE:
+            value /= 100.0
+        try:
+            self.notifier.add_rule(frm, to, kind, value)
+        except ValueError as exc:  # seuil nul, variation ≥ 100 %
+            QtWidgets.QMessageBox.warning(self, self.windowTitle(), str(exc))
+            return
+        self.refresh()
+
+    def _remove(self):
+        rows = {index.row() for index in self.tbl.selectionModel().selectedRows()}
+        for row in rows:
+            self.notifier.remove_rule(self.tbl.item(row, 0).data(QtCore.Qt.UserRole))
+        self.refresh()
@@ -0,0 +1,112 @@
+"""
+Module: currency_model.py
+Responsabilité:
+    Modèle Qt unique des devises, partagé par les deux sélecteurs
+
+Design:
+    - CurrencyListModel : une ligne par devise de CurrencyIndex, construite
+      une fois (drapeau, code, nom localisé) ; les deux QComboBox l'utilisent
+    - CurrencySearchProxy : filtre + tri par pertinence via CurrencyIndex.search
+      (préfixes / trigrammes précalculés), branché sur un QCompleter par combo
+"""
+
+from PySide6 import QtCore, QtWidgets
+
+CodeRole = QtCore.Qt.UserRole + 1
+
+
+class CurrencyListModel(QtCore.QAbstractListModel):
+    def __init__(self, currencies, lang="fr", parent=None):
+        super().__init__(parent)
+        self.currencies = currencies  # CurrencyIndex
+        self.lang = lang
+        self._labels = [f"{e.flag}  {e.code}" for e in currencies.entries]
+
+    def set_currencies(self, currencies):
+        """Remplace l'index (devises ajoutées / retirées par un rafraîchissement des taux)."""
+        self.beginResetModel()
+        self.currencies = currencies
+        self._labels = [f"{e.flag}  {e.code}" for e in currencies.entries]
+        self.endResetModel()
+
+    def set_lang(self, lang):
+        self.lang = lang
+        if self._labels:
+            self.dataChanged.emit(self.index_of(0), self.index_of(len(self._labels) - 1),
+                                  [QtCore.Qt.ToolTipRole])
+
+    def index_of(self, row):
+        return self.createIndex(row, 0)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._labels)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return self._labels[row]
+        if role == QtCore.Qt.ToolTipRole:
+            return self.currencies.entries[row].name(self.lang)
+        if role == CodeRole:
+            return self.currencies.codes[row]
+        return None
+
+
+class CurrencySearchProxy(QtCore.QSortFilterProxyModel):
+    """Résultats de recherche classés ; affiche « drapeau  CODE — nom » dans la liste."""
+
+    def __init__(self, source, parent=None):
+        super().__init__(parent)
+        self.setSourceModel(source)
+        self._ranks = None  # code → rang ; None = pas de filtre
+
+    def set_query(self, text):
+        # Le drapeau d'un item affiché (« 🇺🇸  USD ») ne compte pas dans la requête
+        query = " ".join(w for w in text.split() if any(ch.isalnum() for ch in w))
+        currencies = self.sourceModel().currencies
+        self._ranks = {c: r for r, c in enumerate(currencies.search(query))} if query else None
+        self.invalidate()
+        self.sort(0)
+
+    def filterAcceptsRow(self, row, parent):
+        return self._ranks is None or self.sourceModel().currencies.codes[row] in self._ranks
+
+    def lessThan(self, left, right):
+        if self._ranks is None:
+            return left.row() < right.row()
+        codes = self.sourceModel().currencies.codes
+        return self._ranks[codes[left.row()]] < self._ranks[codes[right.row()]]
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole:
+            src = self.sourceModel()
+            row = self.mapToSource(index).row()
+            return f"{src.data(src.index_of(row))} — {src.currencies.entries[row].name(src.lang)}"
+        return super().data(index, role)
+
+
+def attach_search(combo: QtWidgets.QComboBox, model: CurrencyListModel) -> QtWidgets.QCompleter:
+    """Branche le modèle partagé et une complétion par recherche sur un combo éditable."""
+    combo.setEditable(True)
+    combo.setInsertPolicy(QtWidgets.QComboBox.NoInsert)
+    combo.setModel(model)
+
+    proxy = CurrencySearchProxy(model, combo)
+    completer = QtWidgets.QCompleter(proxy, combo)
+    completer.setCompletionMode(QtWidgets.QCompleter.UnfilteredPopupCompletion)
+    completer.setCompletionRole(QtCore.Qt.EditRole)
+    combo.setCompleter(completer)
+
+    combo.lineEdit().textEdited.connect(proxy.set_query)
+
+    def activated(index):
+        # index du modèle de complétion interne → proxy de recherche → modèle partagé
+        if index.model() is not proxy:
+            index = completer.completionModel().mapToSource(index)
+        row = proxy.mapToSource(index).row()
+        if row >= 0:
+            combo.setCurrentIndex(row)
+    completer.activated[QtCore.QModelIndex].connect(activated)
+    return completer
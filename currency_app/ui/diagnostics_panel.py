@@ -0,0 +1,108 @@
+"""
+Module: diagnostics_panel.py
+Responsabilité:
+    Panneau de diagnostic caché (Ctrl+Shift+D) : métriques des chemins critiques
+
+Design:
+    - Lit le registre currency_app.core.metrics (aucun calcul côté UI)
+    - Rafraîchi chaque seconde, uniquement tant que le panneau est visible
+    - Activer / réinitialiser la collecte, exporter le snapshot en JSON
+"""
+
+from PySide6 import QtCore, QtWidgets
+
+from currency_app.core import metrics
+
+COLUMNS = ["Métrique", "Nombre", "Moyenne", "p50", "p95", "p99", "Max"]
+
+
+def _fmt_seconds(v: float) -> str:
+    if v >= 1:
+        return f"{v:.3f} s"
+    if v >= 1e-3:
+        return f"{v * 1e3:.2f} ms"
+    return f"{v * 1e6:.1f} µs"
+
+
+class DiagnosticsPanel(QtWidgets.QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Diagnostics — métriques")
+        self.resize(760, 420)
+
+        self.chk_enabled = QtWidgets.QCheckBox("Collecte activée")
+        self.chk_enabled.setChecked(metrics.is_enabled())
+        self.chk_enabled.toggled.connect(metrics.set_enabled)
+
+        btn_reset = QtWidgets.QPushButton("Réinitialiser")
+        btn_reset.clicked.connect(self._reset)
+        btn_dump = QtWidgets.QPushButton("Exporter JSON")
+        btn_dump.clicked.connect(self._dump)
+
+        self.tbl = QtWidgets.QTableWidget(0, len(COLUMNS))
+        self.tbl.setHorizontalHeaderLabels(COLUMNS)
+        self.tbl.verticalHeader().hide()
+        self.tbl.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.tbl.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
+        self.tbl.horizontalHeader().setStretchLastSection(True)
+
+        self.lbl_info = QtWidgets.QLabel("")
+
+        top = QtWidgets.QHBoxLayout()
+        top.addWidget(self.chk_enabled)
+        top.addStretch()
+        top.addWidget(btn_reset)
+        top.addWidget(btn_dump)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addLayout(top)
+        layout.addWidget(self.tbl)
+        layout.addWidget(self.lbl_info)
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(1000)
+        self._timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.chk_enabled.setChecked(metrics.is_enabled())
+        self.refresh()
+        self._timer.start()
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        snap = metrics.REGISTRY.snapshot()
+        rows = []
+        for name, h in snap["histograms"].items():
+            if not h["count"]:
+                continue
+            fmt = _fmt_seconds if h["unit"] == "s" else "{:.0f}".format
+            rows.append((name, str(h["count"]), fmt(h["mean"]), fmt(h["p50"]),
+                         fmt(h["p95"]), fmt(h["p99"]), fmt(h["max"])))
+        for name, value in snap["counters"].items():
+            if value:
+                rows.append((name, str(value), "", "", "", "", ""))
+
+        self.tbl.setRowCount(len(rows))
+        for r, row in enumerate(rows):
+            for c, text in enumerate(row):
+                item = QtWidgets.QTableWidgetItem(text)
+                if c:
+                    item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+                self.tbl.setItem(r, c, item)
+
+        self.lbl_info.setText(f"PID {snap['pid']} · depuis {snap['uptime_s']:.0f} s"
+                              + ("" if snap["enabled"] else " · collecte désactivée"))
+
+    def _reset(self):
+        metrics.REGISTRY.reset()
+        self.refresh()
+
+    def _dump(self):
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Exporter les métriques", "metrics.json",
+                                                        "JSON (*.json)")
+        if path:
+            metrics.REGISTRY.dump_json(path)
@@ -0,0 +1,129 @@
+"""
+Module: history_model.py
+Responsabilité:
+    Modèle Qt virtuel de l'historique (QTableView), paginé depuis SQLite
+
+Design:
+    - Lignes du plus ancien au plus récent (ordre d'insertion, comme l'ancien
+      QTableWidget) ; les conversions de la session s'ajoutent en fin
+    - canFetchMore / fetchMore : la vue charge une page quand on défile
+    - Pagination par clé (id > borne, id ≤ max_id lu au reset) : coût constant
+      quelle que soit la page, aucun COUNT(*) sur le thread GUI (la fin est
+      détectée par une page incomplète)
+    - Cache LRU de pages borné : une page évincée est relue à la demande
+    - Les conversions de la session sont affichées sans relire la base
+      (leurs ids dépassent max_id : jamais lues en double)
+"""
+
+from collections import OrderedDict
+
+from PySide6 import QtCore
+
+from currency_app.utils.formatting import format_history_row
+
+HEADERS = ["Date", "De", "Vers", "Montant", "Résultat", "Taux"]
+
+
+class HistoryModel(QtCore.QAbstractTableModel):
+    """Vue tabulaire paginée de la table `conversions`."""
+
+    def __init__(self, repo, page_size=500, max_cached_pages=16, parent=None):
+        super().__init__(parent)
+        self.repo = repo
+        self.page_size = page_size
+        self.max_cached_pages = max_cached_pages
+
+        self._tail = []           # conversions de la session (plus récente en dernier)
+        self._max_id = 0          # plus grand id en base au moment du reset
+        self._loaded = 0          # lignes de base exposées à la vue
+        self._exhausted = True    # toutes les lignes de base jusqu'à max_id exposées
+        self._page_keys = []      # borne exclusive (id) de chaque page
+        self._pages = OrderedDict()
+
+        self.reload()
+
+    # ------------------------------------------------------------------
+    # Chargement
+    # ------------------------------------------------------------------
+    def reload(self):
+        """Repart de l'état de la base (aucune ligne n'est lue ici)."""
+        self.beginResetModel()
+        self._max_id = self.repo.max_id()
+        self._tail.clear()
+        self._loaded = 0
+        self._exhausted = self._max_id == 0
+        self._page_keys = [0]
+        self._pages.clear()
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        page = len(self._page_keys) - 1
+        rows = self._page(page)
+        if len(rows) < self.page_size:
+            self._exhausted = True  # dernière page
+        else:
+            self._page_keys.append(rows[-1][0])
+        if not rows:
+            return
+
+        first = self._loaded  # avant les conversions de la session
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(rows) - 1)
+        self._loaded += len(rows)
+        self.endInsertRows()
+
+    def _page(self, page):
+        """Lignes formatées d'une page, depuis le cache LRU ou la base."""
+        rows = self._pages.get(page)
+        if rows is not None:
+            self._pages.move_to_end(page)
+            return rows
+
+        raw = self.repo.fetch_page(self._page_keys[page], self.page_size, self._max_id)
+        rows = [(rid, *format_history_row(*values)) for rid, *values in raw]
+        self._pages[page] = rows
+        if len(self._pages) > self.max_cached_pages:
+            self._pages.popitem(last=False)
+        return rows
+
+    def append(self, rec):
+        """Ajoute une conversion de la session en fin de tableau."""
+        row = self.rowCount()
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._tail.append(format_history_row(rec.ts, rec.from_cur, rec.to_cur, rec.amount, rec.result, rec.rate))
+        self.endInsertRows()
+
+    # ------------------------------------------------------------------
+    # API QAbstractTableModel
+    # ------------------------------------------------------------------
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self._loaded + len(self._tail)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return HEADERS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == QtCore.Qt.TextAlignmentRole:
+            return int(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter) if index.column() >= 3 else None
+        if role != QtCore.Qt.DisplayRole:
+            return None
+
+        row = index.row()
+        if row >= self._loaded:
+            return self._tail[row - self._loaded][index.column()]
+
+        page, offset = divmod(row, self.page_size)
+        rows = self._page(page)
+        return rows[offset][index.column() + 1] if offset < len(rows) else None
@@ -7,18 +7,26 @@ Respect UI/UX Desktop:
 - spacing and readable hierarchy
 """
 
-from PySide6 import QtWidgets, QtCore
-from datetime import datetime
+from PySide6 import QtWidgets, QtCore, QtGui
 
 from currency_app.core.i18n import Lang, t
-from currency_app.domain.models import ConversionRecord
+from currency_app.domain.currencies import CurrencyIndex
+from currency_app.domain.history_store import HistoryStore, ts_to_epoch
+from currency_app.services.analytics import OVERLAYS, RollingAnalytics
+from currency_app.services.conversion_pipeline import ConversionPipeline
+from currency_app.services.history_loader import HistoryStoreLoader
+from currency_app.ui.currency_model import CurrencyListModel, attach_search
+from currency_app.ui.history_model import HEADERS, HistoryModel
+from currency_app.ui.watchlist_model import WatchlistModel
 from currency_app.utils.flags import flag_for_currency
 from currency_app.ui.styles import apply_black_orange_white
-from currency_app.infra.pdf_exporter import export_table_to_pdf
 
 
 class MainWindow(QtWidgets.QWidget):
-    def __init__(self, settings, repo, converter, notifier, chart):
+    rates_swapped = QtCore.Signal(str, str)  # (source, dernier jour coté) — émis hors thread GUI
+    currencies_changed = QtCore.Signal(object)  # codes devise de la nouvelle table — émis hors thread GUI
+
+    def __init__(self, settings, repo, converter, notifier, chart, archive=None):
         super().__init__()
 
         # Services
@@ -27,10 +35,26 @@ class MainWindow(QtWidgets.QWidget):
         self.converter = converter
         self.notifier = notifier
         self.chart = chart
+        self.archive = archive  # HistoryArchive : effacée avec l'historique
+        self.store = None  # HistoryStore colonnaire, chargé en arrière-plan au premier besoin
+        self._store_loader = None
+        self._store_generation = 0   # incrémentée à l'effacement : chargement en cours obsolète
+        self._store_pending = []     # conversions stabilisées pendant le chargement
+        self.pipeline = ConversionPipeline(converter, repo, self.s.convert_debounce_ms,
+                                           self.s.history_settle_ms, parent=self)
+        self.pipeline.applied.connect(self._on_converted)
+        self.pipeline.settled.connect(self._on_settled)
+        self.rates_swapped.connect(self._on_rates_swapped)
+        self.currencies_changed.connect(self._on_currencies_changed)
 
         # State interne
         self.lang = Lang.FR
         self._ui_ready = False
+        self._deferred_done = False
+        self._analytics = None        # RollingAnalytics de la paire affichée
+        self._analytics_pair = None
+        self._diagnostics = None      # panneau caché, créé au premier Ctrl+Shift+D
+        self._pdf_tasks = set()       # exports PDF en cours (sans parent Qt)
 
         self.setWindowTitle(self.s.app_title)
         self.setMinimumSize(1200, 800)  # Desktop format
@@ -42,7 +66,35 @@ class MainWindow(QtWidgets.QWidget):
         self._populate_defaults()
         self._ui_ready = True
         self._load_history()
+        if self._chart_ready():
+            self.notifier.ensure(self)
+            self._check_alerts(table=True)
+            self._deferred_done = True
+
+    # ================================================================================
+    # ✅ Deferred subsystems (chart, tray) — construits à l'idle après le 1er paint
+    # ================================================================================
+    def _chart_ready(self):
+        return getattr(self.chart, "loaded", True)
+
+    def _notifier_ready(self):
+        return getattr(self.notifier, "loaded", True)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._deferred_done:
+            self._deferred_done = True
+            QtCore.QTimer.singleShot(0, self._init_deferred)
+
+    def _init_deferred(self):
+        """Construit le graphique et le tray, puis charge les points d'historique."""
+        self.chart_box.removeWidget(self.chart_placeholder)
+        self.chart_placeholder.deleteLater()
+        self.chart_box.addWidget(self.chart.widget())
+
+        self._load_chart()
         self.notifier.ensure(self)
+        self._check_alerts(table=True)  # règles chargées : 1re évaluation de la table courante
 
     # ================================================================================
     # ✅ Build UI
@@ -126,6 +178,35 @@ class MainWindow(QtWidgets.QWidget):
         self.main_layout.addWidget(grp_convert)
         self.main_layout.addWidget(self.lbl_rate)
 
+        # ================================================================================
+        # ✅ Watchlist card (un montant → toutes les devises, en un calcul vectorisé)
+        # ================================================================================
+        self.grp_watch = QtWidgets.QGroupBox(t("watchlist", self.lang))
+        watch = QtWidgets.QVBoxLayout()
+
+        self.chk_watch_all = QtWidgets.QCheckBox(t("watchlist_all", self.lang))
+        self.chk_watch_all.setChecked(self.s.watchlist_all)
+        self.lbl_watch_hint = QtWidgets.QLabel(t("watchlist_hint", self.lang))
+        self.lbl_watch_hint.setStyleSheet("font-size:12px; color:#C7C7C7;")
+
+        self.watchlist = WatchlistModel(self.converter, self.s.watchlist, self.s.watchlist_all, parent=self)
+        self.tbl_watch = QtWidgets.QTableView()
+        self.tbl_watch.setModel(self.watchlist)
+        self.tbl_watch.setMinimumHeight(220)
+        self.tbl_watch.verticalHeader().hide()
+        self.tbl_watch.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.tbl_watch.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+
+        watch_top = QtWidgets.QHBoxLayout()
+        watch_top.addWidget(self.chk_watch_all)
+        watch_top.addStretch()
+        watch_top.addWidget(self.lbl_watch_hint)
+        watch.addLayout(watch_top)
+        watch.addWidget(self.tbl_watch)
+
+        self.grp_watch.setLayout(watch)
+        self.main_layout.addWidget(self.grp_watch)
+
         # ================================================================================
         # ✅ Notifications card
         # ================================================================================
@@ -141,6 +222,9 @@ class MainWindow(QtWidgets.QWidget):
         notif.addWidget(self.chk_notify)
         notif.addWidget(QtWidgets.QLabel(t("threshold", self.lang)))
         notif.addWidget(self.spn_threshold)
+        notif.addStretch()
+        self.btn_rules = QtWidgets.QPushButton(t("alert_rules", self.lang))
+        notif.addWidget(self.btn_rules)
 
         grp_notify.setLayout(notif)
         self.main_layout.addWidget(grp_notify)
@@ -148,8 +232,10 @@ class MainWindow(QtWidgets.QWidget):
         # ================================================================================
         # ✅ Table (history)
         # ================================================================================
-        self.tbl = QtWidgets.QTableWidget(0, 6)
-        self.tbl.setHorizontalHeaderLabels(["Date", "De", "Vers", "Montant", "Résultat", "Taux"])
+        self.history = HistoryModel(self.repo, parent=self)
+        self.tbl = QtWidgets.QTableView()
+        self.tbl.setModel(self.history)
+        self.tbl.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
         self.tbl.horizontalHeader().setStretchLastSection(True)
         self.tbl.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
         self.main_layout.addWidget(self.tbl)
@@ -157,7 +243,22 @@ class MainWindow(QtWidgets.QWidget):
         # ================================================================================
         # ✅ Chart
         # ================================================================================
-        self.main_layout.addWidget(self.chart.widget())
+        self.chart_box = QtWidgets.QVBoxLayout()
+        if self._chart_ready():
+            self.chart_box.addWidget(self.chart.widget())
+        else:
+            self.chart_placeholder = QtWidgets.QWidget()
+            self.chart_placeholder.setMinimumHeight(300)
+            self.chart_box.addWidget(self.chart_placeholder)
+        self.main_layout.addLayout(self.chart_box)
+
+        self.chk_analytics = QtWidgets.QCheckBox(t("analytics", self.lang))
+        self.chk_analytics.setChecked(self.s.analytics_overlay)
+        self.lbl_stats = QtWidgets.QLabel("")
+        self.lbl_stats.setStyleSheet("font-size:12px; color:#C7C7C7;")
+        self.lbl_stats.setVisible(self.s.analytics_overlay)
+        self.main_layout.addWidget(self.chk_analytics)
+        self.main_layout.addWidget(self.lbl_stats)
 
         # ================================================================================
         # ✅ Buttons bar
@@ -174,100 +275,259 @@ class MainWindow(QtWidgets.QWidget):
         # ---- Events ----
         self.cmb_lang.currentIndexChanged.connect(self._on_change_lang)
         self.btn_swap.clicked.connect(self._swap)
-        self.btn_convert.clicked.connect(self.convert)
+        self.btn_convert.clicked.connect(lambda: self.convert(immediate=True))
         self.btn_pdf.clicked.connect(self._export_pdf_clicked)
         self.btn_clear.clicked.connect(self._clear_history_clicked)
         self.spn_from.valueChanged.connect(self.convert)
+        self.spn_from.editingFinished.connect(self.pipeline.settle)  # Entrée / perte de focus
+        self.spn_from.valueChanged.connect(self._update_watchlist)
+        self.cbb_from.currentTextChanged.connect(self._update_watchlist)
+        self.chk_watch_all.toggled.connect(self.watchlist.set_show_all)
+        self.cbb_from.currentTextChanged.connect(self._check_alerts)
+        self.chk_watch_all.toggled.connect(self._check_alerts)
+        self.btn_rules.clicked.connect(self._open_alert_rules)
+        self.tbl_watch.doubleClicked.connect(lambda index: self.watchlist.toggle_pin(index.row()))
         self.cbb_from.currentTextChanged.connect(self.convert)
         self.cbb_to.currentTextChanged.connect(self.convert)
+        self.cbb_from.currentTextChanged.connect(self._load_analytics)
+        self.cbb_to.currentTextChanged.connect(self._load_analytics)
+        self.chk_analytics.toggled.connect(self._toggle_analytics)
+        QtGui.QShortcut(QtGui.QKeySequence("Ctrl+Shift+D"), self, self._open_diagnostics)
 
     # ================================================================================
     # ✅ Populate currencies
     # ================================================================================
     def _populate_defaults(self):
-        currencies = self.converter.list_currencies()
-
-        self.cbb_from.setEditable(True)
-        self.cbb_to.setEditable(True)
-
-        for c in currencies:
-            self.cbb_from.addItem(f"{flag_for_currency(c)}  {c}", c)
-            self.cbb_to.addItem(f"{flag_for_currency(c)}  {c}", c)
-
-        self.cbb_from.setCurrentText(f"{flag_for_currency(self.s.default_from)}  {self.s.default_from}")
-        self.cbb_to.setCurrentText(f"{flag_for_currency(self.s.default_to)}  {self.s.default_to}")
+        # Index de recherche + un seul modèle pour les deux sélecteurs
+        self.currencies = CurrencyIndex(self.converter.list_currencies())
+        self.currency_model = CurrencyListModel(self.currencies, self.lang.value, self)
+        attach_search(self.cbb_from, self.currency_model)
+        attach_search(self.cbb_to, self.currency_model)
+
+        self._select(self.cbb_from, self.s.default_from)
+        self._select(self.cbb_to, self.s.default_to)
         self.spn_from.setValue(self.s.default_amount)
         self.chk_notify.setChecked(self.s.notify_default_enabled)
+        self._update_watchlist()
 
-        comp = QtWidgets.QCompleter(currencies)
-        comp.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
-        self.cbb_from.setCompleter(comp)
-        self.cbb_to.setCompleter(comp)
+    def _on_currencies_changed(self, codes):
+        """Nouvel ensemble de devises : index de recherche et modèle reconstruits, sélection gardée."""
+        frm, to = self._get_code(self.cbb_from), self._get_code(self.cbb_to)
+        self.currencies = CurrencyIndex(codes)
+        self.currency_model.set_currencies(self.currencies)
+        self._select(self.cbb_from, frm)
+        self._select(self.cbb_to, to)
+        self.watchlist.set_currencies(codes)
 
     def _get_code(self, combo):
         return combo.currentText().split()[-1].upper()
 
+    def _select(self, combo, code):
+        row = self.currencies.row_of(code)
+        if row >= 0:
+            combo.setCurrentIndex(row)
+        else:
+            combo.setCurrentText(f"{flag_for_currency(code)}  {code}")
+
     # ================================================================================
     # ✅ Convert
     # ================================================================================
-    def convert(self):
+    def convert(self, *_, immediate=False):
+        """Envoie la saisie au pipeline (debounce, conversion hors GUI, insertion regroupée)."""
         if not self._ui_ready:
             return
 
         try:
             frm = self._get_code(self.cbb_from)
             to = self._get_code(self.cbb_to)
-            amount = float(self.spn_from.value())
+        except IndexError:  # combo vide pendant la saisie
+            return
 
-            result, rate = self.converter.convert(amount, frm, to)
-            self.spn_to.setValue(result)
-            self.lbl_rate.setText(f"{t('rate', self.lang)} : 1 {frm} = {rate:.4f} {to}")
+        amount = float(self.spn_from.value())
+        self.pipeline.submit(amount, frm, to, immediate=immediate)
+
+    def _on_converted(self, rec):
+        """Affiche un résultat du pipeline (thread GUI, dans l'ordre) — chaque frappe."""
+        self.spn_to.setValue(rec.result)
+        self.lbl_rate.setText(f"{t('rate', self.lang)} : 1 {rec.from_cur} = {rec.rate:.4f} {rec.to_cur}")
+
+    def _on_settled(self, rec):
+        """Conversion stabilisée (une par rafale de saisies) : historique, graphique, alertes."""
+        self._add_row(rec)
+        if self.store is not None:
+            self.store.append(rec)
+        elif self._store_loader is not None:
+            self._store_pending.append(rec)
+        if self._chart_ready():
+            x = self.chart.add_point(rec.ts, rec.rate)
+            if self._analytics is not None and (rec.from_cur, rec.to_cur) == self._analytics_pair:
+                stats = self._analytics.push(x, rec.rate)
+                self.chart.append_overlays(x, {k: getattr(stats, k) for k in OVERLAYS})
+                self._show_stats()
+
+        self.notifier.maybe_notify_threshold(
+            rec.from_cur, rec.to_cur, rec.rate,
+            float(self.spn_threshold.value()),
+            self.chk_notify.isChecked(),
+            t("notif_title", self.lang),
+            t("notif_body", self.lang),
+        )
 
-            ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            rec = ConversionRecord(ts, frm, to, amount, result, rate)
+    def _add_row(self, rec):
+        self.history.append(rec)
 
-            self.repo.insert(rec)
-            self._add_row(rec)
-            self.chart.add_point(ts, rate)
+    def _load_history(self):
+        # Le tableau est paginé par HistoryModel : seul le graphique lit tout
+        if self._chart_ready():
+            self._load_chart()
 
-            self.notifier.maybe_notify_threshold(
-                frm, to, rate,
-                float(self.spn_threshold.value()),
-                self.chk_notify.isChecked(),
-                t("notif_title", self.lang),
-                t("notif_body", self.lang),
-            )
+    def _request_store(self):
+        """Lance la lecture de l'historique en colonnes (une fois, hors thread GUI)."""
+        if self.store is not None or self._store_loader is not None:
+            return
+        self._store_loader = HistoryStoreLoader(self.repo, self._store_generation, parent=self)
+        self._store_loader.loaded.connect(self._on_store_loaded)
+        self._store_loader.failed.connect(self._on_store_failed)
+        self._store_loader.start()
+
+    def _on_store_loaded(self, store):
+        loader, self._store_loader = self._store_loader, None
+        loader.deleteLater()
+        pending, self._store_pending = self._store_pending, []
+        if loader.generation != self._store_generation:
+            return  # historique effacé pendant la lecture
+
+        # Conversions stabilisées pendant la lecture : ajoutées si la base ne les avait pas encore
+        if pending:
+            known = {tuple(row) for row in store.since(ts_to_epoch(pending[0].ts))}
+            for rec in pending:
+                if (rec.ts, rec.from_cur, rec.to_cur, rec.amount, rec.result, rec.rate) not in known:
+                    store.append(rec)
+        self.store = store
+        if self._chart_ready():
+            self._load_chart()
+
+    def _on_store_failed(self, _message):
+        self._store_loader.deleteLater()
+        self._store_loader = None
+        self._store_pending = []
+
+    def _load_chart(self):
+        """Charge toute la série d'historique dans le graphique, en bloc (dès que le store est lu)."""
+        if self.store is None:
+            self._request_store()
+            return
+        xs, rates = self.store.rate_points()
+        self.chart.load_points(xs, rates)
+        self.chart.set_overlays_visible(self.chk_analytics.isChecked())
+        self._load_analytics()
 
-        except Exception:
-            pass
+    # ================================================================================
+    # ✅ Watchlist — recalculée à chaque saisie (pas de debounce : un seul calcul vectorisé)
+    # ================================================================================
+    def _update_watchlist(self, *_):
+        try:
+            frm = self._get_code(self.cbb_from)
+        except IndexError:
+            return
+        self.watchlist.set_source(self.spn_from.value(), frm)
 
-    def _add_row(self, rec):
-        r = self.tbl.rowCount()
-        self.tbl.insertRow(r)
+    # ================================================================================
+    # ✅ Taux rafraîchis à chaud — la table a déjà été remplacée (hors thread GUI)
+    # ================================================================================
+    def _on_rates_swapped(self, source, day):
+        self.watchlist.refresh()
+        self._check_alerts(table=True)
+        try:
+            frm = self._get_code(self.cbb_from)
+            to = self._get_code(self.cbb_to)
+            result, rate = self.converter.convert(self.spn_from.value(), frm, to)
+        except Exception:  # paire incomplète ou sans taux : seul le message change
+            rate = None
+        else:
+            self.spn_to.setValue(result)
 
-        values = [
-            rec.ts, rec.from_cur, rec.to_cur,
-            f"{rec.amount:.2f}", f"{rec.result:.2f}", f"{rec.rate:.4f}"
-        ]
+        text = t("rates_updated", self.lang).format(source=source, day=day)
+        if rate is not None:
+            text = f"{t('rate', self.lang)} : 1 {frm} = {rate:.4f} {to} — {text}"
+        self.lbl_rate.setText(text)
 
-        for c, v in enumerate(values):
-            item = QtWidgets.QTableWidgetItem(v)
-            if c >= 3:
-                item.setTextAlignment(QtCore.Qt.AlignRight)
-            self.tbl.setItem(r, c, item)
+    # ================================================================================
+    # ✅ Alertes — toutes les paires sous règle (swap) et la ligne de la watchlist
+    # ================================================================================
+    def _check_alerts(self, *_, table=False):
+        """Soumet les taux au moteur d'alertes ; rien tant que le notifier est différé."""
+        if not self._notifier_ready():
+            return
+        title = t("alert_title", self.lang)
+        if table:
+            self.notifier.check_table(self.converter, title)
+        self.notifier.on_rates(self.watchlist.rates(), title)
 
-    def _load_history(self):
-        for rec in self.repo.fetch_all():
-            self._add_row(rec)
-            self.chart.add_point(rec.ts, rec.rate)
+    def _open_alert_rules(self):
+        from currency_app.ui.alert_rules_dialog import AlertRulesDialog
+        dialog = AlertRulesDialog(self.notifier, self.converter.list_currencies(), self.lang, self)
+        dialog.exec()
+        self._check_alerts(table=True)  # nouvelles règles armées sur les taux courants
+
+    # ================================================================================
+    # ✅ Analytics (paire courante) — chargement vectorisé, puis mises à jour O(1)
+    # ================================================================================
+    def _load_analytics(self, *_):
+        if not self._ui_ready or not self._chart_ready() or self.store is None:
+            return
+        try:
+            pair = (self._get_code(self.cbb_from), self._get_code(self.cbb_to))
+        except IndexError:
+            return
+
+        xs, rates = self.store.rate_points(*pair)
+        self._analytics = RollingAnalytics.load(xs, rates, self.s.analytics_window)
+        self._analytics_pair = pair
+        self.chart.set_overlays(xs, {k: self._analytics.series[k] for k in OVERLAYS})
+        self._show_stats()
+
+    def _toggle_analytics(self, checked):
+        self.lbl_stats.setVisible(checked)
+        if self._chart_ready():
+            self.chart.set_overlays_visible(checked)
+
+    def _show_stats(self):
+        stats = self._analytics.latest() if self._analytics is not None else None
+        if stats is None or stats.sma != stats.sma:  # fenêtre pas encore pleine
+            self.lbl_stats.setText("")
+            return
+        frm, to = self._analytics_pair
+        self.lbl_stats.setText(t("analytics_stats", self.lang).format(
+            pair=f"{frm}→{to}", n=self._analytics.window, sma=stats.sma, vol=stats.volatility,
+            low=stats.low, high=stats.high, dd=stats.drawdown, mdd=stats.max_drawdown,
+            chg=stats.change_pct,
+        ))
 
     # ================================================================================
     # ✅ Clear history
     # ================================================================================
     def _clear_history_clicked(self):
-        self.repo.clear()
-        self.tbl.setRowCount(0)
-        self.chart.clear()
+        self.pipeline.cancel()
+        self.repo.clear(self.archive)
+        # Base vide : store vide, un chargement en cours est ignoré à son retour
+        self._store_generation += 1
+        self._store_pending = []
+        self.store = HistoryStore()
+        self.history.reload()
+        if self._chart_ready():
+            self.chart.clear()
+            self._load_analytics()
+
+    def closeEvent(self, event):
+        self.pipeline.close()  # la dernière conversion affichée est enregistrée
+        for task in self._pdf_tasks:  # export en cours : annulé (fichier partiel supprimé)
+            task.blockSignals(True)
+            task.cancel()
+            if task.running:
+                task.wait()
+        self._pdf_tasks.clear()
+        super().closeEvent(event)
 
     # ================================================================================
     # ✅ Swap
@@ -275,8 +535,8 @@ class MainWindow(QtWidgets.QWidget):
     def _swap(self):
         f = self._get_code(self.cbb_from)
         t = self._get_code(self.cbb_to)
-        self.cbb_from.setCurrentText(f"{flag_for_currency(t)}  {t}")
-        self.cbb_to.setCurrentText(f"{flag_for_currency(f)}  {f}")
+        self._select(self.cbb_from, t)
+        self._select(self.cbb_to, f)
 
     # ================================================================================
     # ✅ Export PDF
@@ -286,11 +546,43 @@ class MainWindow(QtWidgets.QWidget):
         if not path:
             return
 
-        headers = [self.tbl.horizontalHeaderItem(i).text() for i in range(self.tbl.columnCount())]
-        rows = [[self.tbl.item(r, c).text() for c in range(self.tbl.columnCount())] for r in range(self.tbl.rowCount())]
+        from currency_app.services.pdf_export_task import PdfExportTask
+
+        # Rendu en arrière-plan, lignes lues en flux depuis la base (ordre du tableau)
+        progress = QtWidgets.QProgressDialog(
+            t("pdf_progress", self.lang), t("cancel", self.lang), 0, self.repo.count(), self
+        )
+        progress.setWindowModality(QtCore.Qt.WindowModal)
+        progress.setMinimumDuration(300)
+
+        # Sans parent (exécutée dans le pool) : référence gardée ici jusqu'à la fin
+        task = PdfExportTask(path, "Historique Convertisseur", HEADERS, self.repo)
+        self._pdf_tasks.add(task)
+        task.progress.connect(progress.setValue)
+        progress.canceled.connect(task.cancel)
+
+        def done(title_key, text, warn=False):
+            self._pdf_tasks.discard(task)
+            progress.reset()
+            progress.deleteLater()
+            task.deleteLater()
+            box = QtWidgets.QMessageBox.warning if warn else QtWidgets.QMessageBox.information
+            box(self, t(title_key, self.lang), text)
+
+        task.finished.connect(lambda _path: done("dialog_success", t("pdf_done", self.lang)))
+        task.cancelled.connect(lambda: done("dialog_success", t("pdf_cancelled", self.lang)))
+        task.failed.connect(lambda err: done("dialog_error", err, warn=True))
+        task.start()
 
-        export_table_to_pdf(path, "Historique Convertisseur", headers, rows)
-        QtWidgets.QMessageBox.information(self, t("dialog_success", self.lang), t("pdf_done", self.lang))
+    # ================================================================================
+    # ✅ Diagnostics (caché) — métriques des chemins critiques
+    # ================================================================================
+    def _open_diagnostics(self):
+        if self._diagnostics is None:
+            from currency_app.ui.diagnostics_panel import DiagnosticsPanel
+            self._diagnostics = DiagnosticsPanel(self)
+        self._diagnostics.show()
+        self._diagnostics.raise_()
 
     # ================================================================================
     # ✅ Language switch
@@ -301,4 +593,11 @@ class MainWindow(QtWidgets.QWidget):
         self.btn_pdf.setText(t("export_pdf", self.lang))
         self.btn_clear.setText(t("clear_history", self.lang))
         self.chk_notify.setText(t("notify_enable", self.lang))
+        self.btn_rules.setText(t("alert_rules", self.lang))
+        self.chk_analytics.setText(t("analytics", self.lang))
+        self.grp_watch.setTitle(t("watchlist", self.lang))
+        self.chk_watch_all.setText(t("watchlist_all", self.lang))
+        self.lbl_watch_hint.setText(t("watchlist_hint", self.lang))
+        self.currency_model.set_lang(self.lang.value)
+        self._show_stats()
         self.lbl_rate.setText(f"{t('rate', self.lang)} : —")
@@ -98,7 +98,7 @@ def apply_black_orange_white(widget):
         }}
 
         /* TABLE */
-        QTableWidget {{
+        QTableView {{
             background: {SURFACE};
             border: 1px solid {BORDER};
             gridline-color: {BORDER};
@@ -112,7 +112,7 @@ def apply_black_orange_white(widget):
             font-weight: 600;
             border: none;
         }}
-        QTableWidget::item {{
+        QTableView::item {{
             padding: 6px;
         }}
 
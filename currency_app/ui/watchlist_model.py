@@ -0,0 +1,156 @@
+"""
+Module: watchlist_model.py
+Responsabilité:
+    Modèle Qt de la watchlist : un montant affiché dans toutes les devises
+    (ou dans les devises épinglées)
+
+Design:
+    - Toute la ligne de résultats vient d'un seul appel vectorisé
+      (OfflineConverter.fan_out) : aucune conversion par cellule
+    - Les valeurs précédentes sont gardées : un recalcul compare les tableaux
+      et n'émet dataChanged que pour les plages de cellules modifiées
+    - Changement de liste (épingler, « toutes les devises ») = reset du modèle
+"""
+
+import numpy as np
+from PySide6 import QtCore
+
+from currency_app.core import metrics
+from currency_app.domain.currencies import minor_unit_exponent
+from currency_app.utils.flags import flag_for_currency
+
+WATCHLIST_HEADERS = ["Devise", "Montant", "Taux"]
+COL_VALUE, COL_RATE = 1, 2
+
+
+def _changed(old: np.ndarray, new: np.ndarray) -> np.ndarray:
+    """Masque des éléments différents (NaN == NaN)."""
+    return ~((old == new) | (np.isnan(old) & np.isnan(new)))
+
+
+def _runs(mask: np.ndarray):
+    """Plages contiguës (début, fin incluse) des indices vrais d'un masque."""
+    idx = np.flatnonzero(mask)
+    if not len(idx):
+        return
+    breaks = np.flatnonzero(np.diff(idx) > 1)
+    starts = np.concatenate(([idx[0]], idx[breaks + 1]))
+    ends = np.concatenate((idx[breaks], [idx[-1]]))
+    yield from zip(starts.tolist(), ends.tolist())
+
+
+class WatchlistModel(QtCore.QAbstractTableModel):
+    def __init__(self, converter, pinned=(), show_all=False, parent=None):
+        super().__init__(parent)
+        self.converter = converter
+        known = set(converter.list_currencies())
+        self.pinned = [c for c in pinned if c in known]
+        self.show_all = show_all
+
+        self._amount = 0.0
+        self._frm = None
+        self._src = None       # devise source des valeurs affichées
+        self._codes = ()
+        self._values = np.empty(0)
+        self._rates = np.empty(0)
+
+    # ------------------------------------------------------------------
+    # Entrées
+    # ------------------------------------------------------------------
+    def set_source(self, amount, frm):
+        """Nouveau montant / devise source : seules les cellules changées sont émises."""
+        self._amount, self._frm = float(amount), frm
+        self.refresh()
+
+    def set_show_all(self, show_all):
+        self.show_all = bool(show_all)
+        self._reset()
+
+    def toggle_pin(self, row):
+        code = self._codes[row]
+        if code in self.pinned:
+            self.pinned.remove(code)
+        else:
+            self.pinned.append(code)
+        if self.show_all:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, 0))
+        else:
+            self._reset()
+
+    def set_currencies(self, codes):
+        """Nouvel ensemble de devises (swap à chaud) : épinglées absentes retirées, reset."""
+        known = set(codes)
+        self.pinned = [c for c in self.pinned if c in known]
+        self._reset()
+
+    def refresh(self, reset=False):
+        """Recalcule la ligne (montant ou taux changés) et notifie les cellules modifiées."""
+        if self._frm is None:
+            return
+        with metrics.timer("watchlist.update"):
+            snap = self.converter.snapshot()
+            if self._frm not in snap.ids:
+                # Saisie en cours : valeurs affichées gardées, sauf liste changée ou devise disparue
+                if reset or (self._src is not None and self._src not in snap.ids):
+                    self._show((), np.empty(0), np.empty(0), None)
+                return
+            tos = None if self.show_all else [c for c in self.pinned if c in snap.ids]
+            codes, values, rates = self.converter.fan_out(self._amount, self._frm, tos, snap)
+
+            if reset or codes != self._codes:
+                self._show(codes, values, rates, self._frm)
+                return
+
+            self._src = self._frm
+            changed_values = _changed(self._values, values)
+            changed_rates = _changed(self._rates, rates)
+            self._values, self._rates = values, rates
+            for col, mask in ((COL_VALUE, changed_values), (COL_RATE, changed_rates)):
+                for first, last in _runs(mask):
+                    self.dataChanged.emit(self.index(first, col), self.index(last, col),
+                                          [QtCore.Qt.DisplayRole])
+
+    def _show(self, codes, values, rates, src):
+        self.beginResetModel()
+        self._codes, self._values, self._rates, self._src = codes, values, rates, src
+        self.endResetModel()
+
+    def rates(self) -> dict[tuple[str, str], float]:
+        """Taux affichés {(source, cible): taux} — NaN pour les cibles sans taux."""
+        return {(self._src, code): rate for code, rate in zip(self._codes, self._rates.tolist())}
+
+    def _reset(self):
+        self.refresh(reset=True)
+
+    # ------------------------------------------------------------------
+    # Qt
+    # ------------------------------------------------------------------
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._codes)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(WATCHLIST_HEADERS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return WATCHLIST_HEADERS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == QtCore.Qt.DisplayRole:
+            code = self._codes[row]
+            if col == 0:
+                star = " ★" if self.show_all and code in self.pinned else ""
+                return f"{flag_for_currency(code)}  {code}{star}"
+            value = self._values[row] if col == COL_VALUE else self._rates[row]
+            if value != value:  # NaN : pas de taux
+                return "—"
+            if col == COL_VALUE:
+                return f"{value:,.{max(minor_unit_exponent(code), 0)}f}"
+            return f"{value:.6f}"
+        if role == QtCore.Qt.TextAlignmentRole and col:
+            return int(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+        return None
@@ -2,14 +2,25 @@
 Module: flags.py
 Responsabilité:
     Retourne un emoji drapeau selon la devise
+
+Design:
+    - Table construite une seule fois au chargement du module
 """
 
+FLAGS = {
+    "USD": "🇺🇸", "EUR": "🇪🇺", "GBP": "🇬🇧", "JPY": "🇯🇵", "CNY": "🇨🇳",
+    "CAD": "🇨🇦", "AUD": "🇦🇺", "CHF": "🇨🇭", "XOF": "🌍", "XAF": "🌍",
+    "NGN": "🇳🇬", "GHS": "🇬🇭", "MAD": "🇲🇦", "TND": "🇹🇳", "MRU": "🇲🇷",
+    "BGN": "🇧🇬", "BRL": "🇧🇷", "CYP": "🇨🇾", "CZK": "🇨🇿", "DKK": "🇩🇰",
+    "EEK": "🇪🇪", "HKD": "🇭🇰", "HRK": "🇭🇷", "HUF": "🇭🇺", "IDR": "🇮🇩",
+    "ILS": "🇮🇱", "INR": "🇮🇳", "ISK": "🇮🇸", "KRW": "🇰🇷", "LTL": "🇱🇹",
+    "LVL": "🇱🇻", "MTL": "🇲🇹", "MXN": "🇲🇽", "MYR": "🇲🇾", "NOK": "🇳🇴",
+    "NZD": "🇳🇿", "PHP": "🇵🇭", "PLN": "🇵🇱", "ROL": "🇷🇴", "RON": "🇷🇴",
+    "RUB": "🇷🇺", "SEK": "🇸🇪", "SGD": "🇸🇬", "SIT": "🇸🇮", "SKK": "🇸🇰",
+    "THB": "🇹🇭", "TRL": "🇹🇷", "TRY": "🇹🇷", "ZAR": "🇿🇦",
+}
+
+
 def flag_for_currency(code: str) -> str:
     """Renvoie un emoji drapeau associé à une devise ISO"""
-
-    flags = {
-        "USD":"🇺🇸","EUR":"🇪🇺","GBP":"🇬🇧","JPY":"🇯🇵","CNY":"🇨🇳",
-        "CAD":"🇨🇦","AUD":"🇦🇺","CHF":"🇨🇭","XOF":"🌍","XAF":"🌍",
-        "NGN":"🇳🇬","GHS":"🇬🇭","MAD":"🇲🇦","TND":"🇹🇳","MRU":"🇲🇷"
-    }
-    return flags.get(code.upper(), "🏳️")
+    return FLAGS.get(code.upper(), "🏳️")
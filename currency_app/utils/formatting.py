@@ -0,0 +1,9 @@
+"""
+Module: formatting.py
+Responsabilité:
+    Formatage texte d'une ligne d'historique (tableau, exports)
+"""
+
+def format_history_row(ts, frm, to, amount, result, rate) -> tuple:
+    """(ts, de, vers, montant, résultat, taux) formatés pour l'affichage"""
+    return (ts, frm, to, f"{amount:.2f}", f"{result:.2f}", f"{rate:.4f}")
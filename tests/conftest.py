@@ -0,0 +1,38 @@
+"""
+Configuration pytest commune : racine du dépôt importable, Qt sans affichage.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Petite table BCE déterministe ; ISK sans cotation récente (taux absent)
+ECB_LINES = [
+    "Date,USD,JPY,GBP,KWD,ISK,",
+    "2024-01-03,1.0919,155.52,0.86518,0.3361,N/A,",
+    "2024-01-02,1.0956,155.09,0.86560,0.3372,N/A,",
+    "2023-12-29,1.1050,156.33,0.86905,0.3393,150.10,",
+]
+
+
+@pytest.fixture
+def table():
+    from currency_app.domain.rates import RateTable
+    return RateTable.from_ecb_lines(ECB_LINES)
+
+
+@pytest.fixture
+def converter(table):
+    from currency_app.domain.converter import OfflineConverter
+    return OfflineConverter(table)
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PySide6 import QtWidgets
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
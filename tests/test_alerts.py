@@ -0,0 +1,134 @@
+"""
+Moteur d'alertes, persistance des règles et envoi limité des notifications.
+"""
+
+import json
+import math
+
+import pytest
+
+from currency_app.services.alerts import AlertEngine, NotificationThrottle, RuleKind, load_rules, save_rules
+from currency_app.services.notifier import SystemNotifier
+
+
+class FakeTray:
+    def __init__(self):
+        self.shown = []
+
+    def showMessage(self, title, body, *_):
+        self.shown.append((title, body))
+
+
+def _fired(alerts):
+    return sorted(a.rule.rule_id for a in alerts)
+
+
+def test_engine_fires_only_crossed_rules():
+    engine = AlertEngine()
+    above = engine.add_rule("EUR", "USD", "above", 1.10)
+    below = engine.add_rule("EUR", "USD", "below", 1.05)
+    cross = engine.add_rule("EUR", "USD", "cross", 1.08)
+    move = engine.add_rule("EUR", "JPY", "move", 0.02)
+
+    assert engine.update("EUR", "USD", 1.07) == []  # 1re observation, aucun seuil atteint
+    assert _fired(engine.update("EUR", "USD", 1.11)) == [above.rule_id, cross.rule_id]
+    assert _fired(engine.update("EUR", "USD", 1.04)) == [below.rule_id, cross.rule_id]
+    assert engine.update("EUR", "USD", 1.04) == []
+
+    assert engine.update_many({("EUR", "JPY"): 150.0}) == []  # référence armée
+    assert engine.update_many({("EUR", "JPY"): 152.0}) == []
+    assert _fired(engine.update_many({("EUR", "JPY"): 153.5})) == [move.rule_id]
+    assert move.reference == 153.5
+    assert engine.pairs() == [("EUR", "USD"), ("EUR", "JPY")]
+
+
+def test_invalid_rules_are_rejected_and_skipped_at_load(tmp_path):
+    engine = AlertEngine()
+    for kind, value in (("above", 0), ("below", -1.0), ("cross", "1.1"), ("above", float("nan")),
+                        ("move", 0.0), ("move", -0.02), ("move", 1.5), ("above", True)):
+        with pytest.raises(ValueError):
+            engine.add_rule("EUR", "USD", kind, value)
+    with pytest.raises(ValueError):
+        engine.add_rule("EUR", "eur", "above", 1.0)
+
+    path = tmp_path / "alert-rules.json"
+    path.write_text(json.dumps([
+        {"frm": "EUR", "to": "USD", "kind": "above", "value": -3},
+        {"frm": "EUR", "to": "USD", "kind": "move", "value": 0},
+        {"frm": "EUR", "to": "USD", "kind": "sideways", "value": 1.0},
+        {"frm": "EUR", "to": "USD", "kind": "below", "value": "x"},
+        {"frm": "eur", "to": "jpy", "kind": "move", "value": 0.05},
+    ]), encoding="utf-8")
+    [rule] = load_rules(engine, path)
+    assert (rule.frm, rule.to, rule.kind, rule.value) == ("EUR", "JPY", RuleKind.MOVE, 0.05)
+
+
+def test_pairs_without_rules_get_no_index():
+    engine = AlertEngine()
+    assert engine.update_many({("EUR", "USD"): 1.1, ("EUR", "GBP"): 0.86}) == []
+    assert engine._pairs == {}
+
+    rule = engine.add_rule("EUR", "USD", "above", 1.2)
+    engine.update("EUR", "USD", 1.1)
+    engine.update("EUR", "GBP", 0.86)
+    assert list(engine._pairs) == [("EUR", "USD")]
+    engine.remove_rule(rule.rule_id)
+    assert engine._pairs == {} and engine.pairs() == []
+
+
+def test_rules_round_trip(tmp_path):
+    path = tmp_path / "alert-rules.json"
+    engine = AlertEngine()
+    engine.add_rule("EUR", "USD", RuleKind.ABOVE, 1.1)
+    engine.add_rule("GBP", "JPY", RuleKind.MOVE, 0.015)
+    save_rules(engine.rules(), path)
+
+    restored = AlertEngine()
+    assert load_rules(restored, path) == engine.rules()
+    assert load_rules(AlertEngine(), tmp_path / "absent.json") == []
+
+    path.write_text("{not json", encoding="utf-8")
+    assert load_rules(AlertEngine(), path) == []
+
+
+def test_throttle_keeps_batch_until_marked_sent():
+    now = [0.0]
+    throttle = NotificationThrottle(10.0, clock=lambda: now[0])
+    batch = throttle.push(["a"])
+    assert batch == ["a"] and throttle.pending == 1  # pas encore livré
+    throttle.mark_sent(batch)
+    assert throttle.pending == 0 and throttle.push(["b", "c"]) == []
+    now[0] = 10.0
+    assert throttle.poll() == ["b", "c"]
+
+
+def test_notifier_persists_user_rules_only(qapp, tmp_path):
+    path = tmp_path / "alert-rules.json"
+    notifier = SystemNotifier(rules_path=path)
+    rule = notifier.add_rule("EUR", "USD", "above", 1.2)
+    notifier.maybe_notify_threshold("EUR", "GBP", 0.8, 0.9, True, "t", "{frm}{to}{rate}{th}")
+    assert notifier.user_rules() == [rule]
+
+    assert SystemNotifier(rules_path=path).user_rules() == [rule]
+    notifier.remove_rule(rule.rule_id)
+    assert SystemNotifier(rules_path=path).user_rules() == []
+
+
+def test_notifier_checks_every_rule_pair_and_delivers_after_tray(qapp, converter):
+    notifier = SystemNotifier(min_interval=0.0)
+    notifier.add_rule("USD", "JPY", "above", 100.0)
+    notifier.add_rule("EUR", "GBP", "below", 0.9)
+    notifier.add_rule("EUR", "ISK", "above", 1.0)  # pas de taux : ignorée
+    notifier.add_rule("EUR", "XXX", "above", 1.0)  # devise inconnue : ignorée
+
+    notifier.check_table(converter, "Alerte")
+    assert notifier.throttle.pending == 2  # pas de tray : rien n'est perdu
+
+    notifier.tray = FakeTray()
+    notifier._flush()
+    assert notifier.throttle.pending == 0
+    title, body = notifier.tray.shown[0]
+    assert title == "Alerte (2)" and "USD→JPY" in body and "EUR→GBP" in body
+
+    notifier.on_rates({("EUR", "USD"): math.nan}, "Alerte")  # NaN ignoré
+    assert len(notifier.tray.shown) == 1
@@ -0,0 +1,46 @@
+"""
+Statistiques glissantes : mises à jour incrémentales face au calcul vectorisé.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from currency_app.services.analytics import RollingAnalytics, rolling_series
+
+
+def test_incremental_volatility_survives_tiny_spread_on_large_returns():
+    rng = np.random.default_rng(7)
+    # taux ~1e4 en tendance régulière : rendements ≈ 1e-3, écart-type ≈ 1e-10
+    returns = 1e-3 + rng.normal(0, 1e-10, 5_000)
+    rates = 9876.5 * np.exp(np.cumsum(returns))
+    window = 20
+    expected = rolling_series(rates, window)
+
+    live = RollingAnalytics(window)
+    for k, rate in enumerate(rates.tolist()):
+        stats = live.push(float(k), rate)
+        if k >= window - 1 and k % 997 == 0:
+            assert stats.volatility == pytest.approx(expected["volatility"][k], rel=1e-3)
+            assert stats.sma == pytest.approx(expected["sma"][k], rel=1e-12)
+    assert not math.isnan(stats.volatility)
+
+
+def test_constant_rates_have_zero_volatility():
+    live = RollingAnalytics(5)
+    for k in range(50):
+        stats = live.push(float(k), 1234.5678)
+    assert stats.volatility == 0.0 and stats.change_pct == 0.0
+
+
+def test_load_then_push_continues_the_series():
+    rates = np.linspace(1.0, 1.2, 60) + 0.01 * np.sin(np.arange(60))
+    xs = np.arange(60, dtype=np.float64)
+    live = RollingAnalytics.load(xs[:40], rates[:40], window=10)
+    for x, rate in zip(xs[40:].tolist(), rates[40:].tolist()):
+        stats = live.push(x, rate)
+    expected = rolling_series(rates, 10)
+    assert stats.volatility == pytest.approx(expected["volatility"][-1], rel=1e-9)
+    assert (stats.low, stats.high) == (expected["low"][-1], expected["high"][-1])
+    assert stats.max_drawdown == pytest.approx(expected["max_drawdown"][-1])
@@ -0,0 +1,42 @@
+"""
+Suite de benchmarks : format JSON, baselines et détection des régressions.
+"""
+
+from pathlib import Path
+
+from benchmarks import compare, run
+from benchmarks.harness import Result, load, save
+
+BASELINES = Path(__file__).resolve().parents[1] / "benchmarks" / "baselines"
+
+
+def _results(**values):
+    return {"meta": {"quick": True}, "results": {
+        name: {"value": v, "unit": "x", "higher_is_better": name.endswith("_per_s")}
+        for name, v in values.items()}}
+
+
+def test_compare_respects_the_better_direction():
+    base = _results(load_ms=10.0, rows_per_s=1000.0, gone_ms=1.0)
+    current = _results(load_ms=13.0, rows_per_s=700.0, added_ms=1.0)
+    rows, regressions = compare.compare(base, current, threshold=0.2)
+    assert regressions == ["load_ms", "rows_per_s"]
+    assert {name: status for name, *_, status in rows} == {
+        "added_ms": "new", "gone_ms": "missing", "load_ms": "REGRESSION", "rows_per_s": "REGRESSION"}
+
+    _, regressions = compare.compare(base, _results(load_ms=5.0, rows_per_s=2000.0), threshold=0.2)
+    assert regressions == []
+
+
+def test_quick_run_matches_the_shipped_baseline(tmp_path, capsys):
+    out = tmp_path / "latest.json"
+    assert run.main(["--quick", "--only", "converter", "--out", str(out)]) == 0
+    current, baseline = load(out), load(BASELINES / "reference-quick.json")
+    assert current["meta"]["quick"] and set(current["results"]) <= set(baseline["results"])
+
+    slower = tmp_path / "slower.json"
+    save(slower, [Result(name, r["value"] * (0.5 if r["higher_is_better"] else 2.0), r["unit"],
+                         r["higher_is_better"]) for name, r in current["results"].items()], quick=True)
+    assert compare.main([str(out), str(out)]) == 0
+    assert compare.main([str(out), str(slower)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
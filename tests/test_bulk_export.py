@@ -0,0 +1,43 @@
+"""
+Export en masse : aller-retour CSV / colonnaire et base introuvable.
+"""
+
+import csv
+
+import pytest
+
+from currency_app.domain.models import ConversionRecord
+from currency_app.infra.bulk_export import main, read_columnar
+from currency_app.infra.db import SQLiteRepository
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "history.sqlite3"
+    repo = SQLiteRepository(path)
+    for k in range(25):
+        repo.insert(ConversionRecord(f"2026-02-01 10:00:{k:02d}", "EUR", "USD", k, k * 1.1, 1.1))
+    repo.close()
+    return path
+
+
+def test_export_csv_and_columnar(db_path, tmp_path):
+    assert main([str(db_path), str(tmp_path / "out.csv"), "--batch-size", "7"]) == 0
+    assert main([str(db_path), str(tmp_path / "out.ccol"), "--batch-size", "7"]) == 0
+
+    with open(tmp_path / "out.csv", encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    columns = read_columnar(tmp_path / "out.ccol")
+    assert [float(r["amount"]) for r in rows] == list(range(25))
+    assert columns["amount"].tolist() == list(range(25))
+    assert list(columns["to_cur"]) == ["USD"] * 25
+
+
+def test_missing_database_fails_without_creating_it(tmp_path, capsys):
+    missing = tmp_path / "nope" / "history.sqlite3"
+    with pytest.raises(SystemExit) as exc:
+        main([str(missing), str(tmp_path / "out.csv")])
+    assert exc.value.code == 2
+    assert "introuvable" in capsys.readouterr().err
+    assert not missing.exists()
+    assert not (tmp_path / "out.csv").exists()
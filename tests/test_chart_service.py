@@ -0,0 +1,48 @@
+"""
+RateChart : bornes tenues à jour point par point, chargement en bloc.
+"""
+
+import numpy as np
+import pytest
+from PySide6.QtCore import QDateTime
+
+from currency_app.services.chart_service import RateChart
+
+
+def _ms(ts):
+    return QDateTime.fromString(ts, "yyyy-MM-dd HH:mm:ss").toMSecsSinceEpoch()
+
+
+def _axes(chart):
+    return (chart.axis_x.min().toMSecsSinceEpoch(), chart.axis_x.max().toMSecsSinceEpoch(),
+            chart.axis_y.min(), chart.axis_y.max())
+
+
+def test_incremental_bounds_match_the_series(qapp):
+    chart = RateChart()
+    chart.add_point("2026-03-01 10:00:00", 1.10)
+    assert _axes(chart)[2:] == pytest.approx((1.0, 1.2))  # un seul taux : marge fixe
+
+    for ts, rate in (("2026-03-01 09:00:00", 1.05), ("2026-03-01 12:00:00", 1.30), ("2026-03-01 11:00:00", 1.20)):
+        chart.add_point(ts, rate)
+    xs = [p.x() for p in chart.series.points()]
+    ys = [p.y() for p in chart.series.points()]
+    assert chart._bounds == (min(xs), max(xs), min(ys), max(ys))
+    assert _axes(chart) == pytest.approx((_ms("2026-03-01 09:00:00"), _ms("2026-03-01 12:00:00"), 1.025, 1.325))
+
+
+def test_bulk_load_then_append_and_clear(qapp):
+    chart = RateChart()
+    xs = np.array([_ms("2026-03-02 08:00:00") + k * 60_000 for k in range(500)], dtype=np.int64)
+    ys = 1.1 + 0.01 * np.sin(np.arange(500))
+    chart.load_points(xs, ys)
+    assert chart.series.count() == 500
+    assert _axes(chart)[:2] == (xs[0], xs[-1])
+
+    x = chart.add_point("2026-03-03 08:00:00", 0.9)
+    assert chart._bounds == (xs[0], x, 0.9, ys.max())
+
+    chart.clear()
+    assert chart.series.count() == 0 and chart._bounds is None
+    chart.load_points([], [])
+    assert chart._bounds is None
@@ -0,0 +1,74 @@
+"""
+CLI batch : ordre de sortie, lignes en erreur, JSONL strict.
+"""
+
+import csv
+import json
+
+import pytest
+
+from currency_app.cli import convert_chunk, run
+
+
+def _strict_json(line):
+    def reject(name):
+        raise ValueError(f"non-standard JSON constant {name}")
+    return json.loads(line, parse_constant=reject)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_csv_output_keeps_input_order(tmp_path, table, workers):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    amounts = list(range(1, 501))
+    src.write_text("amount,from,to\n" + "".join(f"{a},EUR,USD\n" for a in amounts), encoding="utf-8")
+
+    n = run(src, dst, workers=workers, chunk_size=37, table=table)
+
+    with open(dst, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert n == len(rows) == len(amounts)
+    assert [float(r["amount"]) for r in rows] == amounts
+    assert all(float(r["result"]) == pytest.approx(float(r["amount"]) * 1.0919) for r in rows)
+
+
+def test_csv_error_rows(converter):
+    lines = ["abc,EUR,USD\n", "10,EUR,XXX\n", "10,EUR,ISK\n", "10,EUR,USD,2024-13-01\n", "10,EUR,USD\n"]
+    rows = list(csv.reader(convert_chunk(list(csv.reader(lines)), "csv", converter).splitlines()))
+
+    assert rows[0][6].startswith("invalid row:")
+    assert rows[1][6] == "unsupported currency: XXX"
+    assert rows[2][6] == "rate not found"
+    assert rows[3][6] == "invalid date: 2024-13-01"
+    assert rows[4][4:] == [str(10 * 1.0919), "1.0919", ""]
+
+
+def test_csv_header_detection_and_quoted_newlines(tmp_path, table):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    # 1re ligne de données au montant invalide : erreur, pas un en-tête ignoré
+    src.write_text('abc,EUR,USD\n"1\n0",EUR,USD\n\n5,EUR,"U\nSD"\n2,EUR,USD\n', encoding="utf-8")
+    assert run(src, dst, workers=1, table=table) == 4
+    with open(dst, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["error"].startswith("invalid row:")
+    assert rows[1]["error"].startswith("invalid row:")  # champ "1\n0" : une seule rangée
+    assert rows[2]["error"] == "unsupported currency: U\nSD"
+    assert float(rows[3]["result"]) == pytest.approx(2 * 1.0919)
+
+    src.write_text(" Amount , From , To , Date \n3,EUR,USD,2024-01-02\n", encoding="utf-8")
+    assert run(src, dst, workers=1, table=table) == 1
+
+
+def test_jsonl_is_strict_json_for_invalid_rows(converter):
+    lines = [
+        '{"amount": "nan", "from": "EUR", "to": "USD"}\n',
+        '{"amount": "x", "from": "EUR", "to": "USD"}\n',
+        '{"amount": 2, "from": "EUR", "to": "ISK"}\n',
+        '{"amount": 2, "from": "eur", "to": "usd", "date": "2024-01-02"}\n',
+    ]
+    out = [_strict_json(line) for line in convert_chunk(lines, "jsonl", converter).splitlines()]
+
+    assert out[0]["amount"] is None and out[0]["error"].startswith("invalid row: amount must be finite")
+    assert out[1]["amount"] is None and out[1]["error"].startswith("invalid row:")
+    assert out[2]["error"] == "rate not found"
+    assert out[3]["result"] == pytest.approx(2 * 1.0956)
+    assert out[3]["date"] == "2024-01-02"
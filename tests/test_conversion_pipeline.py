@@ -0,0 +1,80 @@
+"""
+Pipeline de conversion : debounce, ordre d'application, persistance stabilisée.
+"""
+
+import time
+
+from PySide6.QtTest import QTest
+
+from currency_app.services.conversion_pipeline import ConversionPipeline
+
+
+class FakeRepo:
+    def __init__(self):
+        self.inserted = []
+
+    def insert(self, rec):
+        self.inserted.append(rec)
+
+
+def _wait_until(condition, timeout=2.0):
+    """Fait tourner la boucle Qt jusqu'à `condition()` (signaux en file du pool)."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        QTest.qWait(5)
+    assert condition()
+
+
+def _pipeline(converter, debounce_ms=20, settle_ms=60_000):
+    repo = FakeRepo()
+    pipeline = ConversionPipeline(converter, repo, debounce_ms=debounce_ms, settle_ms=settle_ms)
+    applied, settled = [], []
+    pipeline.applied.connect(lambda rec: applied.append(rec.amount))
+    pipeline.settled.connect(lambda rec: settled.append(rec.amount))
+    return pipeline, repo, applied, settled
+
+
+def test_burst_is_debounced_into_one_conversion(qapp, converter):
+    pipeline, repo, applied, settled = _pipeline(converter, settle_ms=50)
+    for amount in (1, 12, 125):
+        pipeline.submit(amount, "EUR", "USD")
+    _wait_until(lambda: settled)
+    pipeline.close()
+
+    assert applied == [125] and settled == [125]
+    assert [(r.amount, r.result) for r in repo.inserted] == [(125, 125 * 1.0919)]
+
+
+def test_immediate_submit_settles_without_idle_delay(qapp, converter):
+    pipeline, repo, applied, settled = _pipeline(converter)
+    pipeline.submit(1, "EUR", "USD")
+    pipeline.submit(5, "EUR", "USD", immediate=True)  # Convertir : la saisie en attente part tout de suite
+    _wait_until(lambda: settled)
+    assert applied == [5] and settled == [5]
+
+    pipeline.submit(7, "EUR", "USD")
+    _wait_until(lambda: applied[-1] == 7)
+    pipeline.submit(3, "EUR", "GBP", immediate=True)  # changement de paire : l'ancienne d'abord
+    _wait_until(lambda: len(settled) == 3)
+    pipeline.close()
+    assert applied == [5, 7, 3] and settled == [5, 7, 3]
+    assert [r.to_cur for r in repo.inserted] == ["USD", "USD", "GBP"]
+
+
+def test_stale_results_are_never_applied(qapp, converter):
+    pipeline, repo, applied, settled = _pipeline(converter)
+    records = []
+    pipeline.applied.connect(records.append)
+    pipeline.submit(1, "EUR", "USD", immediate=True)
+    _wait_until(lambda: applied)
+    pipeline.submit(2, "EUR", "USD", immediate=True)
+    _wait_until(lambda: len(applied) == 2)
+
+    pipeline.converted.emit(1, records[0])  # résultat d'une requête antérieure arrivé en retard
+    pipeline.cancel()
+    assert applied == [1, 2] and settled == [1, 2]
+
+    pipeline.submit(9, "EUR", "USD")
+    pipeline.cancel()  # effacement : la saisie en attente est abandonnée
+    QTest.qWait(60)
+    assert applied == [1, 2] and len(repo.inserted) == 2
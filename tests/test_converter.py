@@ -0,0 +1,82 @@
+"""
+OfflineConverter face à CurrencyConverter (référence) sur le fichier BCE embarqué.
+"""
+
+from datetime import date
+
+import numpy as np
+import pytest
+from currency_converter import CurrencyConverter, RateNotFoundError
+
+from currency_app.domain.converter import OfflineConverter
+from currency_app.domain.rates import RateTable
+
+METHODS = {"none": None, "last_known": "last_known", "linear": "linear_interpolation"}
+
+
+@pytest.fixture(scope="module")
+def offline():
+    return OfflineConverter(RateTable.from_ecb_file())
+
+
+@pytest.fixture(scope="module")
+def reference():
+    return {fallback: CurrencyConverter(fallback_on_missing_rate=method is not None,
+                                        fallback_on_missing_rate_method=method or "linear_interpolation")
+            for fallback, method in METHODS.items()}
+
+
+def _rate(convert):
+    try:
+        return convert()
+    except RateNotFoundError:
+        return None
+
+
+def _grid(offline, reference, on, fallback):
+    """(taux de référence, taux hors ligne) pour toutes les paires."""
+    codes = offline.list_currencies()
+    for frm in codes:
+        for to in codes:
+            expected = _rate(lambda: reference.convert(1, frm, to, on))
+            got = _rate(lambda: offline.convert(1, frm, to, on=on, fallback=fallback)[1])
+            yield (frm, to), expected, got
+
+
+@pytest.mark.parametrize("on, fallback", [
+    (None, "none"),
+    (date(2001, 1, 2), "none"),
+    (date(2020, 3, 2), "none"),
+    (date(2010, 5, 8), "last_known"),   # samedi
+    (date(2016, 12, 25), "last_known"),
+    (date(2010, 5, 8), "linear"),
+    (date(2005, 6, 12), "linear"),
+])
+def test_matches_currency_converter(offline, reference, on, fallback):
+    for pair, expected, got in _grid(offline, reference[fallback], on, fallback):
+        if expected is None:
+            assert got is None, pair
+        else:
+            assert got == pytest.approx(expected, rel=1e-12), pair
+
+
+def test_batch_apis_match_single_conversions(offline, reference):
+    cc = reference["none"]
+    codes = [c for c in ("USD", "JPY", "GBP", "CHF", "EUR") if c in offline.list_currencies()]
+    frms = [f for f in codes for _ in codes]
+    tos = codes * len(codes)
+    amounts = np.arange(1, len(frms) + 1, dtype=np.float64)
+
+    results, _ = offline.convert_matrix(amounts, frms, tos)
+    expected = [cc.convert(a, f, t) for a, f, t in zip(amounts, frms, tos)]
+    np.testing.assert_allclose(results, expected, rtol=1e-12)
+
+    targets, values, _ = offline.fan_out(250.0, "USD", codes)
+    np.testing.assert_allclose(values, [cc.convert(250.0, "USD", t) for t in targets], rtol=1e-12)
+
+
+def test_unknown_currency_and_out_of_range_date(offline):
+    with pytest.raises(ValueError):
+        offline.convert(1, "EUR", "XXX")
+    with pytest.raises(RateNotFoundError):
+        offline.convert(1, "EUR", "USD", on=date(1990, 1, 1))
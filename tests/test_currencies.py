@@ -0,0 +1,42 @@
+"""
+Index des devises : classement code / préfixe / sous-chaîne / trigrammes, proxy Qt.
+"""
+
+from currency_app.domain.currencies import CURRENCIES, CurrencyIndex, currency_info, normalize
+from currency_app.ui.currency_model import CurrencyListModel, CurrencySearchProxy
+
+INDEX = CurrencyIndex(sorted(CURRENCIES))
+
+
+def test_prefix_hit_ranks_above_trigram_hit():
+    assert INDEX.search("rand")[:2] == ["ZAR", "FKP"]  # « rand » préfixe ; « falkland » par trigrammes
+    krona = INDEX.search("krona")
+    assert krona[:2] == ["ISK", "SEK"] and "NOK" in krona[2:]  # « krone » : approché, après
+
+
+def test_exact_code_then_code_prefix_then_word():
+    assert INDEX.search("cad")[0] == "CAD"
+    assert INDEX.search("us")[0] == "USD"
+    assert INDEX.search("eur") == ["EUR"]
+    assert INDEX.search("dolar", limit=3) == ["AUD", "BBD", "BMD"]  # faute de frappe : trigrammes
+    assert INDEX.search("") == INDEX.codes
+
+
+def test_accents_and_aliases_are_normalised():
+    assert normalize("Złoty") == "zloty" and INDEX.search("Złoty") == ["PLN"]
+    assert INDEX.search("réal") == ["BRL"]
+    assert INDEX.search("renminbi") == ["CNY"]
+    assert "GBP" in INDEX.search("quid")
+    assert currency_info("XXX").name() == "XXX" and INDEX.row_of("XXX") == -1
+
+
+def test_search_proxy_filters_and_orders_by_rank(qapp):
+    model = CurrencyListModel(CurrencyIndex(["EUR", "FKP", "NZD", "USD", "ZAR"]))
+    proxy = CurrencySearchProxy(model)
+    proxy.set_query("🇿🇦  rand")  # le drapeau affiché est ignoré
+    rows = [proxy.mapToSource(proxy.index(r, 0)).row() for r in range(proxy.rowCount())]
+    assert [model.currencies.codes[r] for r in rows][:2] == ["ZAR", "FKP"]
+    assert proxy.index(0, 0).data().endswith("Rand sud-africain")
+
+    proxy.set_query("")
+    assert proxy.rowCount() == 5
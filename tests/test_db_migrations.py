@@ -0,0 +1,63 @@
+"""
+Migrations du schéma d'historique : une migration interrompue ne doit pas
+laisser la base dans un état intermédiaire.
+"""
+
+import sqlite3
+
+import pytest
+
+from currency_app.infra import db
+from currency_app.infra.db import SCHEMA_VERSION, SQLiteRepository
+
+
+def _legacy_db(path):
+    """Base v0 : table d'origine, sans ts_epoch ni user_version."""
+    conn = sqlite3.connect(path)
+    conn.execute(db.DDL)
+    conn.execute(
+        "INSERT INTO conversions (ts, from_cur, to_cur, amount, result, rate) "
+        "VALUES ('2026-01-02 03:04:05', 'EUR', 'USD', 10, 11, 1.1)"
+    )
+    conn.commit()
+    conn.close()
+
+
+def _columns(path):
+    conn = sqlite3.connect(path)
+    try:
+        return [row[1] for row in conn.execute("PRAGMA table_info(conversions)")]
+    finally:
+        conn.close()
+
+
+def test_migrate_upgrades_legacy_database(tmp_path):
+    path = tmp_path / "h.sqlite3"
+    _legacy_db(path)
+
+    repo = SQLiteRepository(path)
+    try:
+        assert repo.conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        assert repo.count(start=0) == 1
+    finally:
+        repo.close()
+
+
+def test_interrupted_migration_rolls_back_and_reopens(tmp_path, monkeypatch):
+    path = tmp_path / "h.sqlite3"
+    _legacy_db(path)
+
+    # Échec juste après l'ALTER TABLE de la migration 1
+    target, statements = db.MIGRATIONS[0]
+    monkeypatch.setattr(db, "MIGRATIONS", [(target, [statements[0], "SELECT * FROM no_such_table"])])
+    with pytest.raises(sqlite3.OperationalError):
+        SQLiteRepository(path)
+    assert "ts_epoch" not in _columns(path)
+
+    monkeypatch.undo()
+    repo = SQLiteRepository(path)
+    try:
+        assert repo.conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        assert [r.amount for r in repo.fetch_range(start=0)] == [10.0]
+    finally:
+        repo.close()
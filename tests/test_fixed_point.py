@@ -0,0 +1,76 @@
+"""
+Moteur exact en unités mineures : comparaison avec Decimal, bornes int64,
+et mode --exact de la CLI ligne par ligne.
+"""
+
+import csv
+from decimal import ROUND_HALF_EVEN, Decimal
+
+import numpy as np
+import pytest
+
+from currency_app.cli import convert_chunk
+from currency_app.domain.fixed_point import (
+    RATE_DECIMALS, FixedPointConverter, exponents, multiply, overflows, round_half_even_div,
+)
+
+
+def _decimal_reference(converter, amount, frm, to):
+    """Même calcul en Decimal : montant et taux arrondis comme le moteur entier."""
+    _, rate = converter.convert(1.0, frm, to)
+    e_frm, e_to = exponents([frm, to]).tolist()
+    minor = (Decimal(str(amount)).scaleb(e_frm)).to_integral_value(ROUND_HALF_EVEN)
+    scaled = Decimal(rate).scaleb(e_to - e_frm + RATE_DECIMALS).to_integral_value(ROUND_HALF_EVEN)
+    result = (minor * scaled).scaleb(-RATE_DECIMALS).to_integral_value(ROUND_HALF_EVEN)
+    return int(result)
+
+
+def test_round_half_even_div():
+    num = np.array([5, 15, 25, -5, -15, 7, -7], dtype=np.int64)
+    assert round_half_even_div(num, 10).tolist() == [0, 2, 2, 0, -2, 1, -1]
+
+
+@pytest.mark.parametrize("frm, to", [("EUR", "USD"), ("USD", "JPY"), ("JPY", "KWD"), ("KWD", "GBP")])
+def test_convert_minor_matches_decimal(converter, frm, to):
+    fixed = FixedPointConverter(converter)
+    rng = np.random.default_rng(7)
+    amounts = np.round(rng.uniform(-1e7, 1e7, 500), 2)
+    amounts[:4] = [0.0, 0.01, 0.005, 123456.785]
+
+    minor = fixed.to_minor(amounts, [frm] * len(amounts))
+    results, _ = fixed.convert_minor(minor, [frm] * len(amounts), [to] * len(amounts))
+    expected = [_decimal_reference(converter, a, frm, to) for a in amounts.tolist()]
+    assert results.tolist() == expected
+
+
+def test_convert_scalar_returns_decimals(converter):
+    result, rate = FixedPointConverter(converter).convert("100.25", "EUR", "USD")
+    assert rate == Decimal("1.091900000")
+    assert result == Decimal("109.46")
+
+
+def test_overflow_is_detected_per_row():
+    minor = np.array([100, 2 ** 61, 5], dtype=np.int64)
+    rates = np.array([10 ** RATE_DECIMALS, 4 * 10 ** RATE_DECIMALS, 10 ** RATE_DECIMALS], dtype=np.int64)
+    assert overflows(minor, rates).tolist() == [False, True, False]
+    with pytest.raises(OverflowError):
+        multiply(minor, rates)
+
+
+def test_representable_masks_only_out_of_range_amounts(converter):
+    fixed = FixedPointConverter(converter)
+    mask = fixed.representable([1.0, 1e20, float("nan"), 2.5], ["EUR", "EUR", "EUR", "JPY"])
+    assert mask.tolist() == [True, False, False, True]
+    with pytest.raises(OverflowError):
+        fixed.to_minor([1.0, 1e20], ["EUR", "EUR"])
+
+
+def test_cli_exact_flags_only_the_offending_rows(converter):
+    lines = ["100,EUR,USD\n", "1e20,EUR,USD\n", "5,EUR,ISK\n", "1e20,EUR,ISK\n", "7,USD,JPY\n"]
+    out = convert_chunk(list(csv.reader(lines)), "csv", FixedPointConverter(converter)).splitlines()
+
+    assert out[0].endswith(",109.19,1.091900000,")
+    assert out[1].endswith("amount too large to be represented exactly from a float")
+    assert out[2].endswith("rate not found")
+    assert out[3].endswith("rate not found")
+    assert out[4].split(",")[4] == "997"
@@ -0,0 +1,115 @@
+"""
+Archive de l'historique : aller-retour des segments, archivage par
+rétention (et reprise après interruption), effacement, maintenance.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from currency_app.domain.models import ConversionRecord
+from currency_app.infra.db import SQLiteRepository, _epoch
+from currency_app.infra.history_archive import SEGMENT_COLUMNS, HistoryArchive
+from currency_app.services.history_maintenance import HistoryMaintenance
+
+NOW = datetime(2026, 6, 1, 12, 0, 0)
+PAIRS = [("EUR", "USD"), ("USD", "JPY"), ("GBP", "EUR")]
+
+
+def _record(k):
+    ts = (NOW - timedelta(days=100) + timedelta(hours=k)).strftime("%Y-%m-%d %H:%M:%S")
+    frm, to = PAIRS[k % len(PAIRS)]
+    return ConversionRecord(ts, frm, to, float(k), k * 1.5, 1.5)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = SQLiteRepository(tmp_path / "h.sqlite3")
+    for k in range(2400):  # 100 jours, une conversion par heure
+        repo.insert(_record(k))
+    yield repo
+    repo.close()
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return HistoryArchive(tmp_path / "archive")
+
+
+def _key(rec):
+    return rec.ts, rec.from_cur, rec.to_cur, rec.amount, rec.result, rec.rate
+
+
+def _all_rows(repo, archive):
+    return sorted(map(_key, [*archive.records(), *repo.fetch_range()]))
+
+
+def test_segment_round_trip(archive):
+    rows = [(k + 1, 1_700_000_000 + k, *PAIRS[k % 3], float(k), k * 2.0, 2.0) for k in range(10)]
+    path = archive.append(rows, cutoff=1_700_000_100)
+
+    assert path.name == "conversions-000000000001-000000000010.ccz"
+    assert archive.count() == 10
+    assert archive.last_header()["cutoff"] == 1_700_000_100
+    assert archive.query()["id"].tolist() == list(range(1, 11))
+    assert [r.amount for r in archive.records("USD", "JPY")] == [1.0, 4.0, 7.0]
+    assert len(archive.query(start=1_700_000_005)["id"]) == 5
+    store = archive.store("EUR", "USD")
+    assert [tuple(r) for r in store] == [_key(r) for r in archive.records("EUR", "USD")]
+
+
+def test_archive_older_than_moves_rows(repo, archive):
+    before = _all_rows(repo, archive)
+    cutoff = NOW - timedelta(days=30)
+
+    moved = repo.archive_older_than(cutoff, archive, batch_size=500)
+
+    assert moved == 2400 - repo.count()
+    assert repo.count(end=cutoff) == 0
+    assert len(archive.segments()) == -(-moved // 500)
+    assert _all_rows(repo, archive) == before
+
+
+def test_interrupted_pass_is_replayed(repo, archive):
+    before = _all_rows(repo, archive)
+    cutoff = _epoch(NOW - timedelta(days=60))
+    # Segment écrit mais suppression perdue (arrêt entre les deux)
+    rows = repo.conn.execute(
+        f"SELECT {SEGMENT_COLUMNS} FROM conversions WHERE ts_epoch < ? ORDER BY id LIMIT 100", (cutoff,)
+    ).fetchall()
+    archive.append(rows, cutoff)
+
+    repo.archive_older_than(cutoff, archive)
+
+    ids = archive.query()["id"].tolist()
+    assert len(ids) == len(set(ids))
+    assert _all_rows(repo, archive) == before
+
+
+def test_clear_purges_archive(repo, archive):
+    repo.archive_older_than(NOW - timedelta(days=30), archive)
+    assert archive.count() > 0
+
+    repo.clear(archive)
+
+    assert repo.count() == 0
+    assert archive.segments() == []
+    assert archive.query()["id"].size == 0
+
+
+def test_maintenance_without_retention_does_not_vacuum(repo, archive):
+    HistoryMaintenance(repo, archive, retention_days=None).run_once()
+    assert not repo.incremental_vacuum_enabled()
+    assert archive.count() == 0
+
+
+def test_maintenance_with_retention_archives_and_compacts(repo, archive):
+    maintenance = HistoryMaintenance(repo, archive, retention_days=(datetime.now() - NOW).days + 30)
+    assert maintenance.enable_compaction()
+    assert not maintenance.enable_compaction()  # une seule fois par base
+
+    summary = maintenance.run_once()
+
+    assert summary["archived"] == archive.count() > 0
+    assert repo.incremental_vacuum_enabled()
+    assert repo.conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
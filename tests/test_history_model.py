@@ -0,0 +1,40 @@
+"""
+HistoryModel : pages par clé dans l'ordre d'insertion, conversions de la session en fin.
+"""
+
+from currency_app.domain.models import ConversionRecord
+from currency_app.infra.db import SQLiteRepository
+from currency_app.ui.history_model import HistoryModel
+
+
+def _record(k):
+    return ConversionRecord(f"2026-03-01 10:{k % 60:02d}:00", "EUR", "USD", float(k), k * 1.1, 1.1)
+
+
+def _amounts(model):
+    return [float(model.index(r, 3).data().replace(",", "")) for r in range(model.rowCount())]
+
+
+def test_pages_oldest_first_then_session_rows(qapp, tmp_path):
+    repo = SQLiteRepository(tmp_path / "h.sqlite3", write_behind=False)
+    try:
+        for k in range(25):
+            repo.insert(_record(k))
+        model = HistoryModel(repo, page_size=10, max_cached_pages=2)
+        assert model.rowCount() == 0 and model.canFetchMore()
+
+        model.fetchMore()
+        session = _record(100)
+        repo.insert(session)          # écrite en base ET affichée : jamais en double
+        model.append(session)
+        assert _amounts(model) == [*range(10), 100]
+
+        while model.canFetchMore():
+            model.fetchMore()
+        assert _amounts(model) == [*range(25), 100]  # 3 pages, cache de 2 : relues à la demande
+
+        repo.clear()
+        model.reload()
+        assert model.rowCount() == 0 and not model.canFetchMore()
+    finally:
+        repo.close()
@@ -0,0 +1,105 @@
+"""
+HistoryStore colonnaire : équivalence avec le repository, ajout, instantanés.
+"""
+
+import time
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from currency_app.domain.history_store import HistoryStore, epoch_to_ts, naive_epoch_to_ms, ts_to_epoch
+from currency_app.domain.models import ConversionRecord
+from currency_app.infra.db import SQLiteRepository
+
+PAIRS = [("EUR", "USD"), ("USD", "JPY"), ("GBP", "CHF")]
+
+
+def _record(k):
+    frm, to = PAIRS[k % 3]
+    return ConversionRecord(f"2026-03-{1 + k % 28:02d} 10:{k % 60:02d}:00", frm, to, float(k), k * 1.1, 1 + k / 1000)
+
+
+def _key(rec):
+    return rec.ts, rec.from_cur, rec.to_cur, rec.amount, rec.result, rec.rate
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = SQLiteRepository(tmp_path / "h.sqlite3")
+    for k in range(300):
+        repo.insert(_record(k))
+    yield repo
+    repo.close()
+
+
+def test_epoch_round_trip():
+    for ts in ("1970-01-01 00:00:00", "2026-03-29 02:30:00", "2099-12-31 23:59:59"):
+        assert epoch_to_ts(ts_to_epoch(ts)) == ts
+
+
+def test_fetch_store_matches_repository(repo):
+    store = repo.fetch_store()
+
+    assert len(store) == repo.count() == 300
+    assert list(store.iter_rows()) == list(repo.iter_rows())
+    assert list(store.iter_rows(newest_first=True, batch_size=7)) == list(store.iter_rows())[::-1]
+    for pair in [(None, None), *PAIRS, ("EUR", "JPY")]:
+        xs, rates = store.rate_points(*pair)
+        ref_xs, ref_rates = repo.fetch_rate_points(*pair)
+        assert np.array_equal(xs, ref_xs) and np.array_equal(rates, ref_rates)
+
+
+def test_append_matches_bulk_load(repo):
+    store = HistoryStore(capacity=1)
+    for rec in repo.fetch_range():
+        store.append(rec)
+
+    assert [tuple(r) for r in store] == [_key(r) for r in repo.fetch_range()]
+    assert store.nbytes == 44 * len(store)
+    assert store[-1].as_record() == repo.fetch_range()[-1]
+
+
+def test_snapshot_is_isolated_from_later_writes(repo):
+    store = repo.fetch_store()
+    snap = store.snapshot()
+    rows = list(snap.iter_rows())
+
+    store.append(ConversionRecord("2026-04-01 00:00:00", "XAU", "EUR", 1.0, 2.0, 2.0))
+    store.clear()
+    store.append(_record(1))
+
+    assert snap.count() == 300
+    assert list(snap.iter_rows()) == rows
+    assert "XAU" not in snap.codes
+
+
+def test_since_returns_the_chronological_tail(repo):
+    store = repo.fetch_store()
+    cutoff = ts_to_epoch("2026-03-27 00:00:00")
+    assert [tuple(r) for r in store.since(cutoff)] == [
+        _key(r) for r in repo.fetch_range(start=cutoff)
+    ]
+
+
+def test_batches_with_selected_columns(repo):
+    store = repo.fetch_store()
+    [first, *_] = store.iter_batches(5, "id, ts_epoch, from_cur, rate")
+    assert first == list(repo.iter_batches(5, "id, ts_epoch, from_cur, rate"))[0]
+    with pytest.raises(ValueError):
+        next(store.iter_batches(5, "nope"))
+
+
+@pytest.mark.skipif(not hasattr(time, "tzset"), reason="time.tzset indisponible")
+def test_naive_epoch_to_ms_follows_dst_transitions(monkeypatch):
+    monkeypatch.setenv("TZ", "Europe/Paris")
+    time.tzset()
+    try:
+        stamps = [f"{day} {h:02d}:{m:02d}:00" for day in ("2026-03-29", "2026-10-25", "2026-07-01")
+                  for h in range(24) for m in (0, 59)]
+        epochs = np.array([ts_to_epoch(ts) for ts in stamps], dtype=np.int64)
+        expected = [datetime.fromisoformat(ts).timestamp() * 1000 for ts in stamps]
+        assert naive_epoch_to_ms(epochs).tolist() == expected
+    finally:
+        monkeypatch.undo()
+        time.tzset()
@@ -0,0 +1,37 @@
+"""
+Sous-systèmes différés : rien de coûteux n'est importé au démarrage.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from currency_app.core.lazy import LazyService
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFERRED = ("PySide6.QtCharts", "PySide6.QtPrintSupport", "currency_app.services.notifier",
+            "currency_app.services.chart_service", "currency_app.infra.pdf_exporter")
+
+
+def _loaded_after(code):
+    """Modules différés présents dans sys.modules après `code`, dans un interpréteur neuf."""
+    probe = f"import json, sys\n{code}\nprint(json.dumps([m for m in {DEFERRED!r} if m in sys.modules]))"
+    proc = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.splitlines()[-1])
+
+
+def test_importing_app_skips_deferred_subsystems():
+    assert _loaded_after("import app") == []
+
+
+def test_lazy_service_imports_on_first_attribute_access():
+    code = ("from currency_app.core.lazy import LazyService\n"
+            "svc = LazyService('currency_app.services.chart_service', 'RateChart')\n"
+            "assert not svc.loaded")
+    assert _loaded_after(code) == []
+
+    svc = LazyService("collections", "Counter", "abca")
+    assert not svc.loaded
+    assert svc.most_common(1) == [("a", 2)]
+    assert svc.loaded and svc.get() is svc.get()
@@ -0,0 +1,77 @@
+"""
+Registre de métriques : no-op tant que désactivé, histogrammes et export JSON.
+"""
+
+import json
+
+import pytest
+
+from currency_app.core import metrics
+
+
+@pytest.fixture
+def enabled():
+    metrics.set_enabled(True)
+    yield
+    metrics.set_enabled(False)
+
+
+def test_disabled_metrics_record_nothing():
+    assert not metrics.is_enabled()
+
+    @metrics.timed("test.disabled.timed")
+    def work(x):
+        return x * 2
+
+    assert work(21) == 42
+    metrics.counter("test.disabled.counter").inc(5)
+    metrics.histogram("test.disabled.rows", unit="rows").observe(10)
+    with metrics.timer("test.disabled.timer") as t:
+        pass
+
+    assert t is metrics.timer("test.other")  # context manager partagé, rien n'est alloué
+    assert metrics.counter("test.disabled.counter").value == 0
+    for name in ("test.disabled.timed", "test.disabled.rows"):
+        assert metrics.REGISTRY.histograms[name].count == 0
+    assert "test.disabled.timer" not in metrics.REGISTRY.histograms
+
+
+def test_enabled_metrics_and_json_snapshot(enabled, tmp_path):
+    @metrics.timed("test.enabled.timed")
+    def work():
+        return None
+
+    for _ in range(3):
+        work()
+    with metrics.timer("test.enabled.timer"):
+        pass
+    metrics.counter("test.enabled.counter").inc(2)
+    rows = metrics.histogram("test.enabled.rows", unit="rows")
+    for n in range(1, 101):
+        rows.observe(n)
+
+    assert metrics.counter("test.enabled.counter").value == 2
+    assert metrics.REGISTRY.histograms["test.enabled.timed"].count == 3
+    assert rows.percentile(0.5) == 64.0 and rows.percentile(0.99) == 100.0  # borne du bucket, ≤ max
+    assert (rows.min, rows.max, rows.total) == (1, 100, 5050)
+
+    path = tmp_path / "metrics.json"
+    metrics.REGISTRY.dump_json(path)
+    snap = json.loads(path.read_text(encoding="utf-8"))
+    assert snap["enabled"] and snap["counters"]["test.enabled.counter"] == 2
+    assert snap["histograms"]["test.enabled.rows"]["p95"] == 100.0
+    assert snap["histograms"]["test.enabled.timer"]["count"] == 1
+
+
+def test_reset_clears_values_but_keeps_metrics():
+    registry = metrics.MetricsRegistry()
+    counter, hist = registry.counter("a"), registry.histogram("b")
+    metrics.set_enabled(True)
+    try:
+        counter.inc()
+        hist.observe(0.5)
+    finally:
+        metrics.set_enabled(False)
+    registry.reset()
+    assert registry.counter("a") is counter and counter.value == 0
+    assert registry.snapshot()["histograms"]["b"] == {"unit": "s", "count": 0}
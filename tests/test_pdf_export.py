@@ -0,0 +1,39 @@
+"""
+Export PDF en flux : annulation à chaque page, tâche de fond annulable et attendue.
+"""
+
+from currency_app.domain.models import ConversionRecord
+from currency_app.infra.db import SQLiteRepository
+from currency_app.infra.pdf_exporter import PROGRESS_EVERY, export_rows_to_pdf
+from currency_app.services.pdf_export_task import PdfExportTask
+from currency_app.ui.history_model import HEADERS
+
+
+def test_cancel_is_checked_at_each_page(qapp, tmp_path):
+    consumed = []
+
+    def rows():
+        for k in range(10 * PROGRESS_EVERY):
+            consumed.append(k)
+            yield ("2026-03-01 10:00:00", "EUR", "USD", "1.00", "1.09", "1.0900")
+
+    assert not export_rows_to_pdf(tmp_path / "o.pdf", "t", HEADERS, rows(), is_cancelled=lambda: True)
+    assert 0 < len(consumed) < PROGRESS_EVERY  # arrêt au 1er saut de page
+
+
+def test_task_cancel_and_wait_removes_partial_file(qapp, tmp_path):
+    repo = SQLiteRepository(tmp_path / "h.sqlite3", write_behind=False)
+    try:
+        for k in range(500):
+            repo.insert(ConversionRecord("2026-03-01 10:00:00", "EUR", "USD", float(k), k * 1.09, 1.09))
+        task = PdfExportTask(str(tmp_path / "o.pdf"), "t", HEADERS, repo)
+        task.cancel()
+        task.start()
+        assert task.wait(30)
+        assert not (tmp_path / "o.pdf").exists()
+
+        done = PdfExportTask(str(tmp_path / "ok.pdf"), "t", HEADERS, repo)
+        done.run()
+        assert done.wait(0) and (tmp_path / "ok.pdf").stat().st_size > 0
+    finally:
+        repo.close()
@@ -0,0 +1,99 @@
+"""
+Rafraîchissement à chaud : swap, persistance du snapshot, changement de devises.
+"""
+
+import numpy as np
+
+from currency_app.core import metrics
+from currency_app.domain.converter import OfflineConverter
+from currency_app.infra.rate_snapshot import load_rate_table, save_rate_table
+from currency_app.infra.rate_sources import DropDirectorySource
+from currency_app.services.rate_refresher import RateRefresher
+
+from conftest import ECB_LINES
+
+
+def _drop(directory, name, lines):
+    path = directory / name
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def _poll_stable(refresher):
+    """Un fichier déposé n'est parsé qu'au 2e passage (taille / mtime inchangés)."""
+    assert refresher.poll_once() == 0
+    return refresher.poll_once()
+
+
+def test_swap_persists_snapshot_and_reports_new_codes(tmp_path, table):
+    drop = tmp_path / "drop"
+    drop.mkdir()
+    snapshot = tmp_path / "rates.snapshot"
+    converter = OfflineConverter(table)
+    refresher = RateRefresher(converter, [DropDirectorySource(drop)],
+                              persist=lambda t: save_rate_table(snapshot, t))
+    swaps, currency_changes = [], []
+    refresher.subscribe(lambda name, t: swaps.append(str(t.last_date)))
+    refresher.subscribe_currencies(currency_changes.append)
+
+    # Mêmes devises, nouveau jour : swap sans changement de devises
+    _drop(drop, "a.csv", [ECB_LINES[0], "2024-01-04,1.2000,150.00,0.85,0.33,N/A,", *ECB_LINES[1:]])
+    assert _poll_stable(refresher) == 1
+    assert swaps == ["2024-01-04"] and currency_changes == []
+    assert converter.convert(1, "EUR", "USD")[1] == 1.2
+
+    # Nouvelle devise (CHF) : abonnés prévenus avec le nouvel ensemble
+    _drop(drop, "b.csv", ["Date,USD,CHF,", "2024-01-05,1.3000,0.94,"])
+    assert _poll_stable(refresher) == 1
+    assert currency_changes == [("CHF", "EUR", "USD")]
+    assert refresher.poll_once() == 0  # rien de nouveau
+
+    # Le snapshot écrit est relu au redémarrage (dernière table reçue)
+    restored = load_rate_table(snapshot)
+    assert list(restored.codes) == ["CHF", "EUR", "USD"]
+    assert str(restored.last_date) == "2024-01-05"
+    assert np.array_equal(np.asarray(restored.data), np.asarray(converter.table.data), equal_nan=True)
+
+
+def test_hot_snapshot_never_replaces_the_mapped_file(tmp_path, table):
+    snapshot = tmp_path / "rates.snapshot"
+    mapped = load_rate_table(snapshot)  # compile puis memory-map le snapshot de base
+    first = save_rate_table(snapshot, table)
+    second = save_rate_table(snapshot, table)
+
+    assert snapshot.exists() and first != second and not first.exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["rates.snapshot", second.name]
+    assert list(load_rate_table(snapshot).codes) == list(table.codes)
+    assert len(mapped.codes) > len(table.codes)  # la table en service reste lisible
+
+
+def test_persist_failure_is_reported_and_swap_kept(tmp_path, table):
+    drop = tmp_path / "drop"
+    drop.mkdir()
+    converter = OfflineConverter(table)
+    refresher = RateRefresher(converter, [DropDirectorySource(drop)],
+                              persist=lambda t: save_rate_table(tmp_path / "absent" / "rates.snapshot", t))
+    metrics.set_enabled(True)
+    try:
+        before = metrics.counter("rates.persist_failed").value
+        _drop(drop, "a.csv", ["Date,USD,", "2024-01-05,1.3000,"])
+        assert _poll_stable(refresher) == 1
+        assert metrics.counter("rates.persist_failed").value == before + 1
+    finally:
+        metrics.set_enabled(False)
+    assert str(converter.table.last_date) == "2024-01-05"
+
+
+def test_drop_directory_waits_for_complete_files(tmp_path):
+    source = DropDirectorySource(tmp_path)
+    (tmp_path / "b.csv.part").write_text("Date,USD,\n2024-01-09,9.0,\n", encoding="utf-8")
+    path = _drop(tmp_path, "a.csv", ["Date,USD,JPY,", "2024-01-05,1.3000,"])  # écriture en cours
+    assert source.poll() is None
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("2024-01-04,1.2000,150.00,\n")
+    assert source.poll() is None  # taille changée depuis le tour précédent
+
+    table = source.poll()
+    assert list(table.codes) == ["EUR", "JPY", "USD"] and len(table.data) == 2
+    assert source.poll() is None
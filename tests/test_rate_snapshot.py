@@ -0,0 +1,44 @@
+"""
+Snapshot compilé des taux : compilation, memory-map et invalidation.
+"""
+
+import os
+
+import numpy as np
+
+from currency_app.infra.rate_snapshot import load_rate_table
+
+from conftest import ECB_LINES
+
+
+def _source(tmp_path, lines=ECB_LINES):
+    path = tmp_path / "eurofxref-hist.csv"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def test_second_load_maps_the_compiled_snapshot(tmp_path, table):
+    source, snapshot = _source(tmp_path), tmp_path / "rates.snapshot"
+    compiled = load_rate_table(snapshot, source)
+    assert snapshot.exists() and not isinstance(compiled.data, np.memmap)
+
+    mapped = load_rate_table(snapshot, source)
+    assert isinstance(mapped.data, np.memmap) and not mapped.data.flags.writeable
+    assert mapped.codes == table.codes and mapped.first_ordinal == table.first_ordinal
+    assert np.array_equal(mapped.data, table.data, equal_nan=True)
+
+
+def test_changed_source_or_corrupt_snapshot_is_recompiled(tmp_path):
+    source, snapshot = _source(tmp_path), tmp_path / "rates.snapshot"
+    load_rate_table(snapshot, source)
+
+    _source(tmp_path, [ECB_LINES[0], "2024-01-04,1.2000,150.00,0.85,0.33,N/A,", *ECB_LINES[1:]])
+    st = os.stat(source)
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    fresh = load_rate_table(snapshot, source)
+    assert str(fresh.last_date) == "2024-01-04" and not isinstance(fresh.data, np.memmap)
+    assert str(load_rate_table(snapshot, source).last_date) == "2024-01-04"
+
+    snapshot.write_bytes(b"garbage")
+    assert str(load_rate_table(snapshot, source).last_date) == "2024-01-04"
+    assert isinstance(load_rate_table(snapshot, source).data, np.memmap)
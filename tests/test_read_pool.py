@@ -0,0 +1,84 @@
+"""
+Pool de lecture : connexions en lecture seule, affinité de thread, lectures
+indépendantes du verrou d'écriture.
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from currency_app.domain.models import ConversionRecord
+from currency_app.infra.db import SQLiteRepository
+from currency_app.infra.read_pool import ReadPool
+
+
+def _record(k):
+    return ConversionRecord(f"2026-03-01 10:{k % 60:02d}:00", "EUR", "USD", float(k), k * 1.1, 1.1)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = SQLiteRepository(tmp_path / "h.sqlite3", read_pool_size=2, busy_timeout=0.2)
+    for k in range(20):
+        repo.insert(_record(k))
+    yield repo
+    repo.close()
+
+
+def _in_thread(fn):
+    """Exécute fn() dans un autre thread ; son exception éventuelle est relevée ici."""
+    out = {}
+
+    def target():
+        try:
+            out["value"] = fn()
+        except Exception as exc:
+            out["error"] = exc
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join(5)
+    assert not thread.is_alive()
+    if "error" in out:
+        raise out["error"]
+    return out["value"]
+
+
+def _borrow(pool):
+    with pool.cursor() as cur:
+        return cur.execute("SELECT COUNT(*) FROM conversions").fetchone()[0]
+
+
+def test_reads_bypass_the_write_lock(repo):
+    with repo.lock:  # insertion en cours sur la connexion d'écriture
+        assert _in_thread(repo.count) == 20
+        assert len(_in_thread(lambda: list(repo.iter_rows(batch_size=7)))) == 20
+
+    repo.insert(_record(99))
+    assert repo.count() == 21  # chaque lecture voit le dernier commit
+
+
+def test_connections_are_read_only_and_thread_affine(repo):
+    pool = repo.read_pool
+    with pool.cursor() as cur:
+        with pytest.raises(sqlite3.OperationalError):
+            cur.execute("DELETE FROM conversions")
+        first = cur.connection
+    with pool.cursor() as cur:
+        assert cur.connection is first
+    assert repo.count() == 20
+
+
+def test_exhausted_pool_times_out_and_closed_pool_refuses(tmp_path, repo):
+    pool = ReadPool(tmp_path / "h.sqlite3", size=1, timeout=0.1)
+    with pool.cursor():
+        with pytest.raises(sqlite3.OperationalError):
+            _in_thread(lambda: _borrow(pool))
+    assert _in_thread(lambda: _borrow(pool)) == 20  # rendue : la connexion migre de thread
+    pool.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        with pool.cursor():
+            pass
+    with pytest.raises(ValueError):
+        ReadPool(tmp_path / "h.sqlite3", size=0)
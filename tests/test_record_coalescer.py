@@ -0,0 +1,51 @@
+"""
+RecordCoalescer : une rafale de saisies sur une paire = un seul enregistrement.
+"""
+
+from PySide6.QtTest import QTest
+
+from currency_app.domain.models import ConversionRecord
+from currency_app.services.record_coalescer import RecordCoalescer
+
+
+def _rec(amount, to="USD"):
+    return ConversionRecord("2026-03-01 10:00:00", "EUR", to, amount, amount * 1.1, 1.1)
+
+
+def _coalescer(idle_ms=60_000):
+    coalescer = RecordCoalescer(idle_ms)
+    settled = []
+    coalescer.settled.connect(lambda rec: settled.append((rec.to_cur, rec.amount)))
+    return coalescer, settled
+
+
+def test_same_pair_is_replaced_until_settled(qapp):
+    coalescer, settled = _coalescer()
+    for amount in (1, 12, 125, 1250, 12500):
+        coalescer.offer(_rec(amount))
+    assert settled == [] and coalescer.pending.amount == 12500
+
+    coalescer.settle()
+    coalescer.settle()  # rien en attente : aucune émission
+    assert settled == [("USD", 12500)] and coalescer.pending is None
+
+
+def test_pair_change_settles_previous_pair_first(qapp):
+    coalescer, settled = _coalescer()
+    coalescer.offer(_rec(5))
+    coalescer.offer(_rec(50))
+    coalescer.offer(_rec(7, to="GBP"))
+    assert settled == [("USD", 50)] and coalescer.pending.to_cur == "GBP"
+
+    coalescer.discard()  # effacement de l'historique
+    coalescer.settle()
+    assert settled == [("USD", 50)]
+
+
+def test_idle_timer_settles_the_burst(qapp):
+    coalescer, settled = _coalescer(idle_ms=30)
+    coalescer.offer(_rec(1))
+    QTest.qWait(10)
+    coalescer.offer(_rec(2))  # relance le délai
+    QTest.qWait(150)
+    assert settled == [("USD", 2)]
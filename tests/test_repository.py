@@ -0,0 +1,68 @@
+"""
+SQLiteRepository : écriture groupée, lecture en flux, pagination et ordre du tableau.
+"""
+
+import pytest
+
+from currency_app.core import metrics
+from currency_app.domain.models import ConversionRecord
+from currency_app.infra.db import SQLiteRepository
+
+
+def _record(k):
+    # ts non monotone : l'ordre chronologique diffère de l'ordre d'insertion
+    return ConversionRecord(f"2026-03-01 10:{(k * 7) % 60:02d}:00", "EUR", "USD", float(k), k * 1.1, 1.1)
+
+
+@pytest.fixture(params=[False, True], ids=["direct", "write-behind"])
+def repo(tmp_path, request):
+    repo = SQLiteRepository(tmp_path / "h.sqlite3", write_behind=request.param)
+    for k in range(60):
+        repo.insert(_record(k))
+    yield repo
+    repo.close()
+
+
+def test_iter_rows_table_order_matches_history_pages(repo):
+    max_id = repo.max_id()  # vide la file d'écriture
+    table = [row[1:] for row in repo.fetch_page(0, 1000, max_id)]  # ordre du tableau (id croissant)
+    assert [row[3] for row in table] == [float(k) for k in range(60)]
+    assert list(repo.iter_rows(batch_size=7, table_order=True)) == table
+
+
+def test_iter_rows_is_chronological_by_default(repo):
+    rows = list(repo.iter_rows(batch_size=7))
+    assert rows == [tuple(vars(r).values()) for r in repo.fetch_range()]
+    assert [r[0] for r in rows] == sorted(r[0] for r in rows)
+
+
+def test_write_behind_commits_in_batches(tmp_path):
+    repo = SQLiteRepository(tmp_path / "h.sqlite3", write_behind=True, batch_size=100,
+                            flush_interval=60.0, synchronous="off")
+    batches = metrics.histogram("db.batch_rows", unit="rows")
+    metrics.set_enabled(True)
+    try:
+        batches.reset()
+        for k in range(250):
+            repo.insert(_record(k))
+        assert repo.count() == 250  # lecture : la file est vidée d'abord
+        assert (batches.count, batches.max) == (3, 100)  # 100 + 100 + 50, sans attendre l'intervalle
+    finally:
+        metrics.set_enabled(False)
+    assert repo.conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    assert repo.conn.execute("PRAGMA synchronous").fetchone() == (0,)
+    repo.close()
+
+
+def test_close_drains_the_write_queue(tmp_path):
+    path = tmp_path / "h.sqlite3"
+    repo = SQLiteRepository(path, write_behind=True, flush_interval=60.0)
+    for k in range(10):
+        repo.insert(_record(k))
+    repo.close()
+
+    reopened = SQLiteRepository(path)
+    assert reopened.count() == 10
+    reopened.close()
+    with pytest.raises(ValueError):
+        SQLiteRepository(path, synchronous="sometimes")
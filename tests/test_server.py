@@ -0,0 +1,108 @@
+"""
+Serveur JSON : chemins nominaux et erreurs 400 / 422 (sans réseau externe).
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from currency_app.api.server import MAX_HEADER_BYTES, ConversionServer
+
+
+async def _exchange(port, raw: bytes) -> tuple[int, dict | None]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(raw)
+        await writer.drain()
+        head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 5)
+        lines = head.decode("latin-1").split("\r\n")
+        headers = dict(line.lower().split(": ", 1) for line in lines[1:] if ": " in line)
+        body = await reader.readexactly(int(headers["content-length"]))
+
+        def reject(name):
+            raise ValueError(f"non-standard JSON constant {name}")
+        return int(lines[0].split(" ")[1]), json.loads(body, parse_constant=reject)
+    finally:
+        writer.close()
+
+
+def _post(path, payload, extra=""):
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    return (f"POST {path} HTTP/1.1\r\nHost: x\r\nContent-Length: {len(body)}\r\n{extra}"
+            f"Connection: close\r\n\r\n").encode() + body
+
+
+def _run(converter, *requests):
+    async def scenario():
+        server = ConversionServer(converter, port=0)
+        await server.start()
+        try:
+            return [await _exchange(server.port, raw) for raw in requests]
+        finally:
+            await server.stop()
+    return asyncio.run(scenario())
+
+
+def test_convert_and_batch(converter):
+    (status, body), (bstatus, bbody) = _run(
+        converter,
+        _post("/convert", {"amount": 10, "from": "eur", "to": "usd"}),
+        _post("/convert/batch", {"items": [{"amount": 1, "from": "EUR", "to": "USD"},
+                                           {"amount": 1, "from": "EUR", "to": "ISK"}]}),
+    )
+    assert status == 200 and body["result"] == pytest.approx(10.919)
+    assert bstatus == 200
+    assert bbody["results"][0]["rate"] == pytest.approx(1.0919)
+    assert bbody["results"][1]["error"] == "rate not found"
+
+
+@pytest.mark.parametrize("raw", [
+    b"POST /convert HTTP/1.1\r\nContent-Length: abc\r\n\r\n",
+    b"POST /convert HTTP/1.1\r\nContent-Length: -5\r\n\r\n",
+    b"GARBAGE\r\n\r\n",
+    _post("/convert", b"{not json"),
+    _post("/convert", {"amount": 1, "from": "EUR"}),
+])
+def test_malformed_requests_get_400(converter, raw):
+    [(status, body)] = _run(converter, raw)
+    assert status == 400
+    assert body["error"]
+
+
+def test_oversized_headers_get_431(converter):
+    padding = "X-Pad: " + "a" * MAX_HEADER_BYTES + "\r\n"
+    [(status, body)] = _run(converter, _post("/convert", {"amount": 1, "from": "EUR", "to": "USD"}, padding))
+    assert status == 431 and body["error"] == "headers too large"
+
+
+@pytest.mark.parametrize("payload", [
+    {"amount": "nan", "from": "EUR", "to": "USD"},
+    {"amount": "inf", "from": "EUR", "to": "USD"},
+    {"amount": 1, "from": "EUR", "to": "XXX"},
+    {"amount": 1, "from": "EUR", "to": "ISK"},
+])
+def test_unprocessable_conversions_get_422(converter, payload):
+    [(status, body)] = _run(converter, _post("/convert", payload))
+    assert status == 422
+    assert body["error"]
+
+
+def test_rate_not_found_in_per_item_fallback_gets_422(converter):
+    """Devise inconnue dans le lot : repli élément par élément, le taux absent reste un 422."""
+    async def scenario():
+        server = ConversionServer(converter, port=0, batch_window=0.05)
+        await server.start()
+        try:
+            return await asyncio.gather(
+                _exchange(server.port, _post("/convert", {"amount": 1, "from": "EUR", "to": "XXX"})),
+                _exchange(server.port, _post("/convert", {"amount": 1, "from": "EUR", "to": "ISK"})),
+                _exchange(server.port, _post("/convert", {"amount": 1, "from": "EUR", "to": "USD"})),
+            )
+        finally:
+            await server.stop()
+
+    (s1, _), (s2, b2), (s3, b3) = asyncio.run(scenario())
+    assert (s1, s2, s3) == (422, 422, 200)
+    assert "ISK" in b2["error"]
+    assert b3["result"] == pytest.approx(1.0919)
@@ -0,0 +1,81 @@
+"""
+Watchlist : ligne recalculée par fan_out, plages dataChanged, devises retirées par un swap à chaud.
+"""
+
+import numpy as np
+
+from currency_app.domain.rates import RateTable
+from currency_app.ui.watchlist_model import COL_RATE, COL_VALUE, WatchlistModel, _changed, _runs
+
+from conftest import ECB_LINES
+
+
+def _codes(model):
+    return [model.index(r, 0).data().split()[-1] for r in range(model.rowCount())]
+
+
+def test_swap_without_pinned_code_keeps_watchlist_live(qapp, converter):
+    model = WatchlistModel(converter, pinned=("USD", "GBP", "JPY"))
+    model.set_source(100, "EUR")
+    assert _codes(model) == ["USD", "GBP", "JPY"]
+
+    converter.swap(RateTable.from_ecb_lines(["Date,USD,JPY,", "2024-01-04,1.2000,150.00,"]))
+    model.refresh()  # rates_swapped arrive avant currencies_changed
+    assert _codes(model) == ["USD", "JPY"]
+    assert model.rates() == {("EUR", "USD"): 1.2, ("EUR", "JPY"): 150.0}
+
+    model.set_currencies(converter.list_currencies())
+    assert model.pinned == ["USD", "JPY"]
+    assert model.index(0, 1).data() == "120.00"
+
+
+def test_removed_source_currency_clears_rows(qapp, converter):
+    model = WatchlistModel(converter, pinned=("EUR", "JPY"))
+    model.set_source(1, "GBP")
+    assert model.rowCount() == 2
+
+    model.set_source(1, "GB")  # saisie en cours : valeurs gardées
+    assert model.rowCount() == 2 and set(model.rates()) == {("GBP", "EUR"), ("GBP", "JPY")}
+
+    converter.swap(RateTable.from_ecb_lines(["Date,USD,JPY,", "2024-01-04,1.2000,150.00,"]))
+    model.refresh()
+    assert model.rowCount() == 0 and model.rates() == {}
+
+
+def _spy(model):
+    changed, resets = [], []
+    model.dataChanged.connect(lambda first, last, *_: changed.append((first.column(), first.row(), last.row())))
+    model.modelReset.connect(lambda: resets.append(True))
+    return changed, resets
+
+
+def test_runs_merges_contiguous_indices():
+    mask = np.array([True, True, False, True, False, False, True, True, True])
+    assert list(_runs(mask)) == [(0, 1), (3, 3), (6, 8)]
+    assert list(_runs(np.zeros(4, bool))) == []
+    assert _changed(np.array([1.0, np.nan, 2.0]), np.array([1.0, np.nan, np.nan])).tolist() == [False, False, True]
+
+
+def test_amount_and_rate_updates_emit_only_changed_runs(qapp, converter):
+    model = WatchlistModel(converter, show_all=True)
+    model.set_source(100, "EUR")
+    codes = _codes(model)
+    isk = codes.index("ISK")  # pas de taux : NaN, jamais émis
+    changed, resets = _spy(model)
+
+    model.set_source(200, "EUR")
+    assert resets == [] and changed == [(COL_VALUE, 0, isk - 1), (COL_VALUE, isk + 1, len(codes) - 1)]
+
+    changed.clear()
+    model.set_source(200, "EUR")
+    assert changed == []
+
+    usd = codes.index("USD")
+    converter.swap(RateTable.from_ecb_lines([ECB_LINES[0], "2024-01-04,1.2000,155.52,0.86518,0.3361,N/A,"]))
+    model.refresh()
+    assert resets == [] and changed == [(COL_VALUE, usd, usd), (COL_RATE, usd, usd)]
+
+    model.toggle_pin(usd)  # « toutes les devises » : étoile sur une seule ligne
+    assert resets == [] and changed[-1] == (0, usd, usd) and model.pinned == ["USD"]
+    model.set_show_all(False)
+    assert resets == [True] and _codes(model) == ["USD"]